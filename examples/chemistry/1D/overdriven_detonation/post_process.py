@@ -13,28 +13,9 @@ physics = solver.physics
 
 # Plot
 plot.prepare_plot()
-plot.plot_solution(mesh, physics, solver, "MassFraction", 
-		plot_numerical=True, plot_exact=False, plot_IC=False,
-		create_new_figure=True, ylabel=None, fmt='bo', 
-		legend_label="DG", equidistant_pts=True, 
-		include_mesh=False, regular_2D=False, equal_AR=False)
-
-plot.plot_solution(mesh, physics, solver, "Density", 
-		plot_numerical=True, plot_exact=False, plot_IC=False,
-		create_new_figure=True, ylabel=None, fmt='bo', 
-		legend_label="DG", equidistant_pts=True, include_mesh=False,
-		regular_2D=False, equal_AR=False)
-
-plot.plot_solution(mesh, physics, solver, "Pressure", 
-		plot_numerical=True, plot_exact=False, plot_IC=False,
-		create_new_figure=True, ylabel=None, fmt='bo', 
-		legend_label="DG", equidistant_pts=True, include_mesh=False,
-		regular_2D=False, equal_AR=False)
-
-plot.plot_solution(mesh, physics, solver, "Energy", 
-		plot_numerical=True, plot_exact=False, plot_IC=False, 
-		create_new_figure=True, ylabel=None, fmt='bo', 
-		legend_label="DG", equidistant_pts=True, 
-		include_mesh=False, regular_2D=False, equal_AR=False)
+plot.plot_solutions(mesh, physics, solver, ["MassFraction", "Density",
+		"Pressure", "Energy"], fmt='bo', legend_label="DG",
+		equidistant_pts=True, include_mesh=False, regular_2D=False,
+		equal_AR=False)
 
 plot.show_plot()
@@ -16,16 +16,10 @@ post.get_error(mesh, physics, solver, "Density")
 ''' Plot '''
 ### Energy
 plot.prepare_plot()
-# DG solution
-plot.plot_solution(mesh, physics, solver, "Energy", plot_numerical=True, 
-		plot_exact=False, plot_IC=False, create_new_figure=True, 
-		fmt='bo', legend_label="DG")
-# Exact solution
-plot.plot_solution(mesh, physics, solver, "Energy", plot_exact=True, 
-		plot_numerical=False, create_new_figure=False, fmt='k-')
-# Initial condition
-plot.plot_solution(mesh, physics, solver, "Energy", plot_IC=True, 
-		plot_numerical=False, create_new_figure=False, fmt='k--')
+# DG solution, exact solution, and initial condition
+plot.plot_solution(mesh, physics, solver, "Energy", plot_numerical=True,
+		plot_exact=True, plot_IC=True, create_new_figure=True,
+		fmt=('bo', 'k-', 'k--'), legend_label=("DG", "Exact", "Initial"))
 # Save figure
 plot.save_figure(file_name='energy', file_type='pdf', crop_level=2)
 
@@ -16,15 +16,10 @@ post.get_error(mesh, physics, solver, "Scalar")
 ''' Plot '''
 # DG solution
 plot.prepare_plot()
+# DG solution, exact solution, and initial condition
 plot.plot_solution(mesh, physics, solver, "Scalar", plot_numerical=True,
-		plot_exact=False, plot_IC=False, create_new_figure=True, fmt='bo', 
-		legend_label="DG")
-# Exact solution
-plot.plot_solution(mesh, physics, solver, "Scalar", plot_exact=True,
-		plot_numerical=False, create_new_figure=False, fmt='k-')
-# Initial condition
-plot.plot_solution(mesh, physics, solver, "Scalar", plot_IC=True,
-		plot_numerical=False, create_new_figure=False, fmt='k--')
+		plot_exact=True, plot_IC=True, create_new_figure=True,
+		fmt=('bo', 'k-', 'k--'), legend_label=("DG", "Exact", "Initial"))
 # Save figure
 plot.save_figure(file_name='scalar', file_type='pdf',
 		crop_level=2)
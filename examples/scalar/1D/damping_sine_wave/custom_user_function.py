@@ -1,4 +1,4 @@
-import numpy as np
+import numerics.helpers.helpers as helpers
 
 # Calculate the difference between the maximum and minimum values
 def custom_user_function(solver):
@@ -17,7 +17,7 @@ def custom_user_function(solver):
 	basis_val = elem_helpers.basis_val
 
 	# Interpolate state at quad points
-	Uq = np.einsum('jn, ink -> ijk', basis_val, Uc) # [ne, nq, ns]
+	Uq = helpers.evaluate_state(Uc, basis_val) # [ne, nq, ns]
 
 	# Get min and max
 	solver.get_min_max_state(Uq)
@@ -135,6 +135,36 @@ Numerics = {
 		# Sets the threshold requirement for the predictor step's
 		# nonlinear solve. Lower values can be chosen which speeds up
 		# the simulations, but at the cost of some error increase.
+	"HelperPrecision" : "float64",
+		# Floating-point precision ("float32" or "float64") in which the
+		# physical basis gradients of each element are stored for the
+		# volume flux integral of the DG solver. "float32" halves the
+		# memory traffic of this integral, which is then evaluated in
+		# single precision; the precision of the solution itself is set
+		# by StatePrecision.
+	"StatePrecision" : "float64",
+		# Floating-point precision ("float32" or "float64") in which the
+		# state coefficients, and with them the residual and stage
+		# arrays of the time stepper, are stored. "float32" halves the
+		# memory traffic of these arrays; the inverse mass matrix and
+		# the geometric helpers are kept in double precision, so the
+		# updates are computed in double precision before being stored.
+	"StoreBasisPhysGrad" : True,
+		# If False, the DG solver does not store the physical basis
+		# gradients of each element, which saves memory on large meshes
+		# and/or at high order. They are instead obtained from the
+		# reference basis gradients and the inverse geometric Jacobians
+		# when needed. Not compatible with artificial viscosity or the
+		# WENO limiter.
+	"HelperCacheFile" : None,
+		# If not None, path of a file (numpy .npz format) in which the
+		# spatial element helpers of the DG and ADER-DG solvers (geometric
+		# data, basis values, inverse mass matrices, etc.) are cached. The
+		# two solvers compute the same element helpers, so a file written
+		# by one can be reused by the other. If the file holds data
+		# for the same mesh and discretization, it is loaded instead of
+		# recomputed; otherwise, it is overwritten with the newly
+		# computed data.
 }
 
 
@@ -249,6 +279,10 @@ Output = {
 	"ProgressBar" : False,
 		# If False, iteration info is printed to console
 		# If True, a progress bar is given instead of iteration info
+	"PrintInterval" : 1,
+		# Iteration info is printed to console at this interval (the
+		# final iteration is always printed)
+		# If nonpositive, then only the final iteration is printed
 	"CustomFunctionFilename" : "custom_user_function"
 		# Name of the user's custom function definitions.
 }
@@ -86,9 +86,8 @@ def mesh_1D(num_elems=10, xmin=-1., xmax=1.):
 
 	''' Create element-to-node-ID map '''
 	mesh.allocate_elem_to_node_IDs_map()
-	for elem_ID in range(mesh.num_elems):
-		for n in range(mesh.num_nodes_per_elem):
-			mesh.elem_to_node_IDs[elem_ID][n] = elem_ID + n
+	mesh.elem_to_node_IDs[:] = np.arange(mesh.num_elems).reshape(-1, 1) + \
+			np.arange(mesh.num_nodes_per_elem)
 
 	''' Create element objects '''
 	mesh.create_elements()
@@ -204,14 +203,15 @@ def mesh_2D(num_elems_x=10, num_elems_y =10, xmin=-1., xmax=1.,
 
 	''' Create element-to-node-ID map '''
 	mesh.allocate_elem_to_node_IDs_map()
-	elem = 0
-	for ny in range(num_elems_y):
-		for nx in range(num_elems_x):
-			mesh.elem_to_node_IDs[elem][0] = num_nodes_x*ny + nx
-			mesh.elem_to_node_IDs[elem][1] = num_nodes_x*ny + nx + 1
-			mesh.elem_to_node_IDs[elem][2] = num_nodes_x*(ny+1) + nx
-			mesh.elem_to_node_IDs[elem][3] = num_nodes_x*(ny+1) + nx + 1
-			elem += 1
+	# Note: element ID = num_elems_x*ny + nx, so the lower-left node of
+	# every element can be computed at once
+	ny, nx = np.meshgrid(np.arange(num_elems_y), np.arange(num_elems_x),
+			indexing="ij")
+	node0_IDs = np.reshape(num_nodes_x*ny + nx, -1)
+	mesh.elem_to_node_IDs[:, 0] = node0_IDs
+	mesh.elem_to_node_IDs[:, 1] = node0_IDs + 1
+	mesh.elem_to_node_IDs[:, 2] = node0_IDs + num_nodes_x
+	mesh.elem_to_node_IDs[:, 3] = node0_IDs + num_nodes_x + 1
 
 	''' Create element objects '''
 	mesh.create_elements()
@@ -328,24 +328,26 @@ def split_quadrils_into_tris(mesh_old):
 				int_face.elemR_ID, int_face.faceR_ID)
 
 	# Create new interior_faces ("diagonal" faces)
+	# Note: the final number of faces is known, so the new faces are
+	# allocated at once instead of grown one at a time
+	num_interior_faces_old = mesh.num_interior_faces
 	mesh.num_interior_faces += num_elems_old
-	for elem_ID in range(num_elems_old):
-		int_face = mesh_defs.InteriorFace()
+	new_faces = [mesh_defs.InteriorFace() for i in range(num_elems_old)]
+	for elem_ID, int_face in enumerate(new_faces):
 		int_face.elemL_ID = elem_ID
 		int_face.faceL_ID = 0
 		int_face.elemR_ID = elem_ID + num_elems_old
 		int_face.faceR_ID = 0
-		mesh.interior_faces.append(int_face)
+	mesh.interior_faces[num_interior_faces_old:] = new_faces
 
 	# Element-to-node-ID map
 	mesh.allocate_elem_to_node_IDs_map()
-	for elem_ID in range(num_elems_old):
-		# First triangle
-		mesh.elem_to_node_IDs[elem_ID] = mesh_old.elem_to_node_IDs[elem_ID,
-				tri1_node_IDs]
-		# Second triangle
-		mesh.elem_to_node_IDs[elem_ID+num_elems_old] = \
-				mesh_old.elem_to_node_IDs[elem_ID, tri2_node_IDs]
+	# First triangles
+	mesh.elem_to_node_IDs[:num_elems_old] = mesh_old.elem_to_node_IDs[:,
+			tri1_node_IDs]
+	# Second triangles
+	mesh.elem_to_node_IDs[num_elems_old:] = mesh_old.elem_to_node_IDs[:,
+			tri2_node_IDs]
 
 	# Create element objects
 	mesh.create_elements()
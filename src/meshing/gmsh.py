@@ -487,8 +487,10 @@ def get_nodes_ver2(fo):
 	if num_nodes == 0:
 		raise ValueError("No nodes to import!")
 	old_to_new_node_IDs = {}
-	# Allocate nodes - assume 3D first
-	node_coords = np.zeros([num_nodes, 3])
+	# Node coordinates - assume 3D first
+	# Note: coordinates are collected in a list and converted to an array
+	# once all nodes have been read
+	node_coords = []
 
 	# Extract nodes
 	new_node_ID = 0
@@ -497,16 +499,17 @@ def get_nodes_ver2(fo):
 		ls = fl.split()
 		# Node ID
 		old_node_ID = int(ls[0])
-		old_to_new_node_IDs.update({old_node_ID : new_node_ID})
+		old_to_new_node_IDs[old_node_ID] = new_node_ID
 		# Node coordinates
-		for d in range(3):
-			node_coords[new_node_ID, d] = float(ls[d+1])
+		node_coords.append([float(l) for l in ls[1:4]])
 		# Sanity check
-		if int(ls[0]) > num_nodes:
+		if old_node_ID > num_nodes:
 			raise errors.FileReadError
 
 		new_node_ID += 1
 
+	node_coords = np.array(node_coords) # [num_nodes, 3]
+
 	return node_coords, old_to_new_node_IDs
 
 
@@ -944,7 +947,9 @@ def add_face_info_to_table(node0_to_faces_info, num_face_nodes, node_IDs,
 		raise ValueError("Need num_face_nodes > 1")
 
 	# Sort nodes and convert to tuple (to make it hashable)
-	node_IDs_sort = tuple(np.sort(node_IDs[:num_face_nodes]))
+	# Note: faces only have a few nodes, so sorting a list is much cheaper
+	# than calling np.sort
+	node_IDs_sort = tuple(sorted(node_IDs[:num_face_nodes].tolist()))
 
 	# Extract correct faces_info dict
 	node0 = node_IDs_sort[0]
@@ -990,7 +995,9 @@ def delete_face_info_from_table(node0_to_faces_info, num_face_nodes,
 		raise ValueError("Need num_face_nodes > 1")
 
 	# Sort nodes and convert to tuple (to make it hashable)
-	node_IDs_sort = tuple(np.sort(node_IDs[:num_face_nodes]))
+	# Note: faces only have a few nodes, so sorting a list is much cheaper
+	# than calling np.sort
+	node_IDs_sort = tuple(sorted(node_IDs[:num_face_nodes].tolist()))
 
 	# Extract correct faces_info dict
 	n0 = node_IDs_sort[0]
@@ -1054,9 +1061,8 @@ def process_elems_bfaces_ver2(fo, mesh, phys_groups, num_phys_groups,
 			raise Exception("Wrong number of nodes")
 
 		# Convert nodes IDs
-		node_IDs = np.zeros(num_nodes, dtype=int)
-		for i in range(num_nodes):
-			node_IDs[i] = old_to_new_node_IDs[int(elist[i])]
+		node_IDs = np.array([old_to_new_node_IDs[int(node_ID)] for node_ID
+				in elist], dtype=int)
 
 		if phys_group.boundary_group_num >= 0:
 			# This is a boundary face
@@ -1143,6 +1149,8 @@ def process_elems_bfaces_ver4(fo, mesh, phys_groups, num_phys_groups,
 			# Get info
 			gorder = gmsh_element_database[etype].gorder
 			gbasis = gmsh_element_database[etype].gbasis
+			node_order = gmsh_element_database[etype].node_order
+			elem_to_node_IDs = mesh.elem_to_node_IDs
 
 			# Extract and process nodes
 			for _ in range(num_in_block):
@@ -1150,11 +1158,10 @@ def process_elems_bfaces_ver4(fo, mesh, phys_groups, num_phys_groups,
 				lint = [int(l) for l in fl.split()]
 
 				# Convert from Gmsh to quail node ordering and store
-				nodes = np.array(lint[1:])
-				for n in range(len(nodes)):
-					nodes[n] = old_to_new_node_IDs[nodes[n]]
-				new_node_IDs = nodes[gmsh_element_database[etype].node_order]
-				mesh.elem_to_node_IDs[num_elems] = new_node_IDs
+				nodes = np.array([old_to_new_node_IDs[node_ID] for node_ID
+						in lint[1:]], dtype=int)
+				new_node_IDs = nodes[node_order]
+				elem_to_node_IDs[num_elems] = new_node_IDs
 
 				# Increment number of elements
 				num_elems += 1
@@ -1185,9 +1192,8 @@ def process_elems_bfaces_ver4(fo, mesh, phys_groups, num_phys_groups,
 				lint = [int(l) for l in fl.split()]
 
 				# Convert node IDs
-				nodes = np.array(lint[1:])
-				for n in range(len(nodes)):
-					nodes[n] = old_to_new_node_IDs[nodes[n]]
+				nodes = np.array([old_to_new_node_IDs[node_ID] for node_ID
+						in lint[1:]], dtype=int)
 
 				# Add face info to table
 				_, _ = add_face_info_to_table(node0_to_faces_info,
@@ -1261,18 +1267,26 @@ def fill_mesh(fo, ver, mesh, phys_groups, num_phys_groups,
 	if not fl.startswith("$EndElements"):
 		raise errors.FileReadError
 
+	# Map boundary group number to physical group (done once here
+	# rather than searching through phys_groups for every boundary face)
+	bgroup_num_to_phys_group = {}
+	for phys_group in phys_groups:
+		bgroup_num_to_phys_group.setdefault(phys_group.boundary_group_num,
+				phys_group)
+
+	# Unpack
+	face_node_table = mesh_tools.get_local_face_principal_node_table(mesh)
+	elem_to_node_IDs = mesh.elem_to_node_IDs
+
 	# Fill boundary and interior face info
 	for elem_ID in range(mesh.num_elems):
-		for face_ID in range(mesh.gbasis.NFACES):
+		for face_ID in range(num_faces_per_elem):
 			# Get local q = 1 face nodes
-			gbasis = mesh.gbasis
-			local_node_nums = gbasis.get_local_face_principal_node_nums(
-					mesh.gorder, face_ID)
+			local_node_nums = face_node_table[face_ID]
 			num_face_nodes = local_node_nums.shape[0]
 
 			# Convert to global node IDs
-			global_node_nums = mesh.elem_to_node_IDs[elem_ID][
-					local_node_nums]
+			global_node_nums = elem_to_node_IDs[elem_ID][local_node_nums]
 
 			# Add to face info table
 			face_info, already_added = add_face_info_to_table(
@@ -1291,13 +1305,10 @@ def fill_mesh(fo, ver, mesh, phys_groups, num_phys_groups,
 								"to boundary face")
 
 					# Find physical group
-					found = False
-					for phys_group in phys_groups:
-						if phys_group.boundary_group_num == \
-								face_info.boundary_group_num:
-							found = True
-							break
-					if not found:
+					try:
+						phys_group = bgroup_num_to_phys_group[
+								face_info.boundary_group_num]
+					except KeyError:
 						raise errors.DoesNotExistError("Physical boundary " +
 								"group not found")
 					boundary_group = mesh.boundary_groups[phys_group.name]
@@ -1328,16 +1339,13 @@ def fill_mesh(fo, ver, mesh, phys_groups, num_phys_groups,
 						num_face_nodes, global_node_nums)
 
 	# Any faces not accounted for?
-	num_faces_left = 0
-	for n in range(mesh.num_nodes):
-		faces_info = node0_to_faces_info[n]
-		for node_IDs_sort in faces_info.keys():
-			print(node_IDs_sort)
-			num_faces_left += 1
+	faces_left = [node_IDs_sort for faces_info in node0_to_faces_info
+			for node_IDs_sort in faces_info.keys()]
+	num_faces_left = len(faces_left)
 
 	if num_faces_left != 0:
-		raise ValueError("Above %d faces not identified" % (num_faces_left) +
-			" as valid boundary or interior faces")
+		raise ValueError("%d faces not identified" % (num_faces_left) +
+			" as valid boundary or interior faces: %s" % (faces_left))
 
 	# Make sure number of interior faces makes sense
 	if mesh.num_interior_faces > mesh.num_elems*num_faces_per_elem:
@@ -84,6 +84,9 @@ class BoundaryGroup():
 	---------
 	allocate_boundary_faces
 		allocates list of BoundaryFace objects
+	get_boundary_face_IDs
+		gets the element and local face IDs of all boundary faces as
+		arrays
 	'''
 	def __init__(self):
 		self.name = ""
@@ -102,6 +105,25 @@ class BoundaryGroup():
 		self.boundary_faces = [BoundaryFace() for i in \
 				range(self.num_boundary_faces)]
 
+	def get_boundary_face_IDs(self):
+		'''
+		This method gets the element and local face IDs of all boundary
+		faces as arrays
+
+		Outputs:
+		--------
+			elem_IDs: IDs of adjacent elements [num_boundary_faces]
+			face_IDs: local IDs of faces from perspective of adjacent
+				elements [num_boundary_faces]
+		'''
+		face_IDs = np.array([[boundary_face.elem_ID, boundary_face.face_ID]
+				for boundary_face in self.boundary_faces],
+				dtype=int).reshape(-1, 2)
+		# Transpose so that each set of IDs is contiguous
+		elem_IDs, face_IDs = np.ascontiguousarray(face_IDs.transpose())
+
+		return elem_IDs, face_IDs # [num_boundary_faces] (x2)
+
 
 class Element():
 	'''
@@ -158,6 +180,12 @@ class Mesh():
 	elem_to_node_IDs : numpy array
 		maps element ID to global node IDs
 		[num_elems, num_nodes_per_elem]
+	elem_to_neighbor_IDs : numpy array
+		maps element ID and local face ID to element ID of neighbor
+		across said face (-1 if boundary face) [num_elems, num_faces]
+	elem_node_coords : numpy array
+		coordinates of the nodes of each element
+		[num_elems, num_nodes_per_elem, ndims]
 	elements : list
 		list of Element objects
 
@@ -171,6 +199,8 @@ class Mesh():
 		allocates self.interior_faces
 	add_boundary_group
 		appends new boundary group to self.boundary_groups
+	get_interior_face_IDs
+		gets element and local face IDs of all interior faces as arrays
 	create_elements
 		creates self.elements
 	'''
@@ -191,6 +221,8 @@ class Mesh():
 		self.num_elems = num_elems
 		self.num_nodes_per_elem = gbasis.get_num_basis_coeff(gorder)
 		self.elem_to_node_IDs = np.zeros(0, dtype=int)
+		self.elem_to_neighbor_IDs = np.zeros(0, dtype=np.int32)
+		self.elem_node_coords = np.zeros(0)
 		self.elements = []
 
 	def set_params(self, gbasis, gorder=1, num_elems=1):
@@ -266,6 +298,30 @@ class Mesh():
 
 		return bgroup
 
+	def get_interior_face_IDs(self):
+		'''
+		This method gets the element and local face IDs on either side of
+		all interior faces as arrays
+
+		Outputs:
+		--------
+			elemL_IDs: IDs of left elements [num_interior_faces]
+			faceL_IDs: local IDs of faces from perspective of left
+				elements [num_interior_faces]
+			elemR_IDs: IDs of right elements [num_interior_faces]
+			faceR_IDs: local IDs of faces from perspective of right
+				elements [num_interior_faces]
+		'''
+		face_IDs = np.array([[int_face.elemL_ID, int_face.faceL_ID,
+				int_face.elemR_ID, int_face.faceR_ID] for int_face in
+				self.interior_faces], dtype=int).reshape(-1, 4)
+		# Transpose so that each set of IDs is contiguous
+		elemL_IDs, faceL_IDs, elemR_IDs, faceR_IDs = np.ascontiguousarray(
+				face_IDs.transpose())
+
+		return elemL_IDs, faceL_IDs, elemR_IDs, faceR_IDs
+				# [num_interior_faces] (x4)
+
 	def create_elements(self):
 		'''
 		This method creates self.elements
@@ -273,9 +329,24 @@ class Mesh():
 		Outputs:
 		--------
 			self.elements: list of Element objects
+			self.elem_to_neighbor_IDs: maps element ID and local face ID
+				to neighbor element ID [num_elems, num_faces]
+			self.elem_node_coords: coordinates of the nodes of each
+				element [num_elems, num_nodes_per_elem, ndims]
+
+		Notes:
+		------
+			The face_to_neighbors and node_coords attributes of each
+			element are views into the corresponding rows of
+			self.elem_to_neighbor_IDs and self.elem_node_coords
 		'''
 		# Allocate
 		self.elements = [Element() for i in range(self.num_elems)]
+		# Note: int32 is plenty for element IDs and halves the memory
+		# footprint of this table
+		self.elem_to_neighbor_IDs = np.full([self.num_elems,
+				self.gbasis.NFACES], -1, dtype=np.int32)
+		self.elem_node_coords = self.node_coords[self.elem_to_node_IDs]
 
 		# Fill in information for each element
 		for elem_ID in range(self.num_elems):
@@ -283,18 +354,14 @@ class Mesh():
 
 			elem.ID = elem_ID
 			elem.node_IDs = self.elem_to_node_IDs[elem_ID]
-			elem.node_coords = self.node_coords[elem.node_IDs]
-			elem.face_to_neighbors = np.full(self.gbasis.NFACES, -1)
+			elem.node_coords = self.elem_node_coords[elem_ID]
+			elem.face_to_neighbors = self.elem_to_neighbor_IDs[elem_ID]
 
 		# Fill in information about neighbors
-		for int_face in self.interior_faces:
-			elemL_ID = int_face.elemL_ID
-			elemR_ID = int_face.elemR_ID
-			faceL_ID = int_face.faceL_ID
-			faceR_ID = int_face.faceR_ID
-
-			elemL = self.elements[elemL_ID]
-			elemR = self.elements[elemR_ID]
+		# Note: the neighbor IDs are scattered into elem_to_neighbor_IDs
+		# for all interior faces at once
+		elemL_IDs, faceL_IDs, elemR_IDs, faceR_IDs = \
+				self.get_interior_face_IDs()
 
-			elemL.face_to_neighbors[faceL_ID] = elemR_ID
-			elemR.face_to_neighbors[faceR_ID] = elemL_ID
+		self.elem_to_neighbor_IDs[elemL_IDs, faceL_IDs] = elemR_IDs
+		self.elem_to_neighbor_IDs[elemR_IDs, faceR_IDs] = elemL_IDs
@@ -80,8 +80,7 @@ def element_volumes(mesh, solver=None):
 			return solver.elem_helpers.vol_elems, \
 					solver.elem_helpers.domain_vol
 
-	# Allocate, unpack
-	vol_elems = np.zeros(mesh.num_elems)
+	# Unpack
 	gorder = mesh.gorder
 	gbasis = mesh.gbasis
 
@@ -89,11 +88,10 @@ def element_volumes(mesh, solver=None):
 	quad_order = gbasis.get_quadrature_order(mesh, gorder)
 	quad_pts, quad_wts = gbasis.get_quadrature_data(quad_order)
 
-	# Get element volumes
-	for elem_ID in range(mesh.num_elems):
-		djac, _, _ = basis_tools.element_jacobian(mesh, elem_ID, quad_pts,
-				get_djac=True)
-		vol_elems[elem_ID] = np.sum(quad_wts*djac)
+	# Get element volumes (Jacobian determinants of all elements at once)
+	djac, _, _ = basis_tools.element_jacobians(mesh, quad_pts,
+			get_djac=True) # [num_elems, nq, 1]
+	vol_elems = np.sum(quad_wts*djac, axis=(1, 2))
 
 	# Get domain volume
 	domain_vol = np.sum(vol_elems)
@@ -136,6 +134,32 @@ def get_element_centroid(mesh, elem_ID):
 	return xcentroid # [1, ndims]
 
 
+def get_local_face_principal_node_table(mesh):
+	'''
+	This function tabulates the local IDs of the principal nodes of every
+	face of the reference element.
+
+	Inputs:
+	-------
+		mesh: mesh object
+
+	Outputs:
+	--------
+		face_node_table: local IDs of principal nodes on each face
+			[num_faces, num_principal_nodes_per_face]
+
+	Notes:
+	------
+		This avoids repeated calls to
+		gbasis.get_local_face_principal_node_nums inside loops over faces
+	'''
+	gbasis = mesh.gbasis
+	face_node_table = np.array([gbasis.get_local_face_principal_node_nums(
+			mesh.gorder, face_ID) for face_ID in range(gbasis.NFACES)])
+
+	return face_node_table # [num_faces, num_principal_nodes_per_face]
+
+
 def check_face_orientations(mesh):
 	'''
 	This function checks the face orientations for 2D meshes.
@@ -148,37 +172,28 @@ def check_face_orientations(mesh):
 	------
 		An error is raised if face orientations don't match up.
 	'''
-	gbasis = mesh.gbasis
 	if mesh.ndims == 1:
 		# Don't need to check for 1D
 		return
 
-	for interior_face in mesh.interior_faces:
-		elemL_ID = interior_face.elemL_ID
-		elemR_ID = interior_face.elemR_ID
-		faceL_ID = interior_face.faceL_ID
-		faceR_ID = interior_face.faceR_ID
+	face_node_table = get_local_face_principal_node_table(mesh)
 
-		# Get local IDs of element nodes
-		elemL_node_IDs = mesh.elements[elemL_ID].node_IDs
-		elemR_node_IDs = mesh.elements[elemR_ID].node_IDs
+	elemL_IDs, faceL_IDs, elemR_IDs, faceR_IDs = mesh.get_interior_face_IDs()
 
-		''' Get global IDs of face nodes '''
-		# Local IDs - left
-		face_node_IDs = gbasis.get_local_face_principal_node_nums(
-				mesh.gorder, faceL_ID)
-		# Global IDs - left
-		global_node_IDs_L = elemL_node_IDs[face_node_IDs]
-		# Local IDs - right
-		face_node_IDs = gbasis.get_local_face_principal_node_nums(
-				mesh.gorder, faceR_ID)
-		# Global IDs - right
-		global_node_IDs_R = elemR_node_IDs[face_node_IDs]
+	''' Get global IDs of face nodes for all interior faces '''
+	# Left
+	global_node_IDs_L = mesh.elem_to_node_IDs[elemL_IDs[:, np.newaxis],
+			face_node_table[faceL_IDs]]
+	# Right
+	global_node_IDs_R = mesh.elem_to_node_IDs[elemR_IDs[:, np.newaxis],
+			face_node_table[faceR_IDs]]
 
-		# Node ordering should be reversed between the two elements
-		if not np.all(global_node_IDs_L == global_node_IDs_R[::-1]):
-			raise Exception("Face orientation for elemL_ID = %d, elemR_ID "
-					% (elemL_ID) + "= %d is incorrect" % (elemR_ID))
+	# Node ordering should be reversed between the two elements
+	wrong = np.any(global_node_IDs_L != global_node_IDs_R[:, ::-1], axis=1)
+	if np.any(wrong):
+		i = np.argmax(wrong)
+		raise Exception("Face orientation for elemL_ID = %d, elemR_ID "
+				% (elemL_IDs[i]) + "= %d is incorrect" % (elemR_IDs[i]))
 
 
 def verify_periodic_compatibility(mesh, boundary_group, icoord):
@@ -261,7 +276,7 @@ def reorder_periodic_boundary_nodes(mesh, b1, b2, icoord,
 		where node1_ID is the ID of a node on boundary 1 and node2_ID is the
 		ID of the node on boundary 2 that corresponds to node1
 	'''
-	gbasis = mesh.gbasis
+	face_node_table = get_local_face_principal_node_table(mesh)
 
 	if b1 is None and b2 is None:
 		# Trivial case - no periodicity in given direction
@@ -306,8 +321,7 @@ def reorder_periodic_boundary_nodes(mesh, b1, b2, icoord,
 		face_ID = boundary_face.face_ID
 
 		# Local IDs of face nodes
-		local_node_IDs = gbasis.get_local_face_principal_node_nums(
-				mesh.gorder, face_ID)
+		local_node_IDs = face_node_table[face_ID]
 		# Global IDs of face nodes
 		global_node_IDs = mesh.elem_to_node_IDs[elem_ID][local_node_IDs]
 
@@ -337,8 +351,7 @@ def reorder_periodic_boundary_nodes(mesh, b1, b2, icoord,
 		face_ID = boundary_face.face_ID
 
 		# Local IDs of face nodes
-		local_node_IDs = gbasis.get_local_face_principal_node_nums(
-				mesh.gorder, face_ID)
+		local_node_IDs = face_node_table[face_ID]
 		# Global IDs of face nodes
 		global_node_IDs = mesh.elem_to_node_IDs[elem_ID][local_node_IDs]
 
@@ -355,53 +368,49 @@ def reorder_periodic_boundary_nodes(mesh, b1, b2, icoord,
 			# Physical coordinates of node
 			coord2 = mesh.node_coords[node2_ID]
 
-			match = False
-			# Match with a node on boundary 1
-			for n in range(num_node_pairs):
-				if node_pairs[n, 1] != -1:
-					# node1 already paired - skip
-					continue
-
-				node1_ID = node_pairs[n, 0]
-				coord1 = mesh.node_coords[node1_ID]
-
-				# Find distance between the two nodes
-				norm = np.linalg.norm(coord1-coord2, ord=1)
-
-				# Check if distance is equal to pdiff (within TOL)
-				if np.abs(norm-pdiff) < TOL:
-					match = True
-					if old_to_new_node_map[node2_ID] == -1:
-						# node2 not reordered yet
-
-						# Populate maps
-						# Note: the difference in IDs of matching nodes is
-						# equal to (stop_node_ID - start_node_ID)
-						node2_ID_new = old_to_new_node_map[node1_ID] + \
-								stop_node_ID - start_node_ID
-						old_to_new_node_map[node2_ID] = node2_ID_new
-						new_to_old_node_map[node2_ID_new] = node2_ID
-						next_node_ID = np.amax([next_node_ID, node2_ID_new])
-
-						# Force nodes to match exactly
-						for d in range(mesh.ndims):
-							if d == icoord:
-								# Skip periodic direction
-								continue
-							coord2[d] = coord1[d]
-
-					# Store node pair
-					idx1 = idx_in_node_pairs[node1_ID]
-					node_pairs[idx1, 1] = node2_ID
-					idx_in_node_pairs[node2_ID] = idx1
-
-					# Flag node2 as matched
-					node2_matched[node2_ID] = True
-					break
-
-			if not match:
+			# Candidate nodes on boundary 1 (not yet paired)
+			idx_unpaired = np.flatnonzero(node_pairs[:num_node_pairs, 1]
+					== -1)
+			coords1 = mesh.node_coords[node_pairs[idx_unpaired, 0]]
+
+			# Find distances between node2 and all candidate nodes
+			norms = np.linalg.norm(coords1 - coord2, ord=1, axis=1)
+
+			# Match with the first node whose distance is equal to pdiff
+			# (within TOL)
+			idx_match = idx_unpaired[np.abs(norms - pdiff) < TOL]
+			if idx_match.shape[0] == 0:
 				raise ValueError("Could not find matching boundary node " +
 						"for Node %d" % (node2_ID))
+			node1_ID = node_pairs[idx_match[0], 0]
+			coord1 = mesh.node_coords[node1_ID]
+
+			if old_to_new_node_map[node2_ID] == -1:
+				# node2 not reordered yet
+
+				# Populate maps
+				# Note: the difference in IDs of matching nodes is
+				# equal to (stop_node_ID - start_node_ID)
+				node2_ID_new = old_to_new_node_map[node1_ID] + \
+						stop_node_ID - start_node_ID
+				old_to_new_node_map[node2_ID] = node2_ID_new
+				new_to_old_node_map[node2_ID_new] = node2_ID
+				next_node_ID = max(next_node_ID, node2_ID_new)
+
+				# Force nodes to match exactly
+				for d in range(mesh.ndims):
+					if d == icoord:
+						# Skip periodic direction
+						continue
+					coord2[d] = coord1[d]
+
+			# Store node pair
+			idx1 = idx_in_node_pairs[node1_ID]
+			node_pairs[idx1, 1] = node2_ID
+			idx_in_node_pairs[node2_ID] = idx1
+
+			# Flag node2 as matched
+			node2_matched[node2_ID] = True
 
 	# Modify next node ID
 	if start_node_ID != stop_node_ID:
@@ -449,21 +458,18 @@ def remap_nodes(mesh, old_to_new_node_map, new_to_old_node_map,
 	# Fill up node maps with non-periodic nodes
 	# Note: non-periodic nodes come after the periodic nodes
 	if next_node_ID != -1:
-		for node_ID in range(mesh.num_nodes):
-			if old_to_new_node_map[node_ID] == -1:
-				# Has not been re-ordered yet
-				old_to_new_node_map[node_ID] = next_node_ID
-				new_to_old_node_map[next_node_ID] = node_ID
-				next_node_ID += 1
+		# Nodes that have not been re-ordered yet
+		old_node_IDs = np.flatnonzero(old_to_new_node_map == -1)
+		# Assign all new IDs at once
+		new_node_IDs = next_node_ID + np.arange(old_node_IDs.shape[0])
+		old_to_new_node_map[old_node_IDs] = new_node_IDs
+		new_to_old_node_map[new_node_IDs] = old_node_IDs
 
 	# Assign new node IDs
 	mesh.node_coords = mesh.node_coords[new_to_old_node_map]
 
 	# New elem_to_node_IDs
-	num_elems = mesh.num_elems
-	for elem_ID in range(num_elems):
-		mesh.elem_to_node_IDs[elem_ID,:] = old_to_new_node_map[
-				mesh.elem_to_node_IDs[elem_ID, :]]
+	mesh.elem_to_node_IDs[:] = old_to_new_node_map[mesh.elem_to_node_IDs]
 
 
 def match_boundary_pair(mesh, icoord, boundary_group1, boundary_group2,
@@ -488,7 +494,7 @@ def match_boundary_pair(mesh, icoord, boundary_group1, boundary_group2,
 		mesh: mesh object (modified - new interior faces, removed boundary
 			groups)
 	'''
-	gbasis = mesh.gbasis
+	face_node_table = get_local_face_principal_node_table(mesh)
 	interior_faces = mesh.interior_faces
 
 	if boundary_group1 is None and boundary_group2 is None:
@@ -513,6 +519,23 @@ def match_boundary_pair(mesh, icoord, boundary_group1, boundary_group2,
 	if np.amin(new_node_pairs) == -1:
 		raise ValueError
 
+	'''
+	Index faces on boundary 2 by their (sorted) global node IDs
+	'''
+	# Note: this avoids a search through all faces on boundary 2 for
+	# each face on boundary 1
+	node_IDs_to_boundary_face2 = {}
+	for boundary_face2 in boundary_group2.boundary_faces:
+		# Local IDs of face nodes
+		local_node_IDs = face_node_table[boundary_face2.face_ID]
+		# Global IDs of face nodes
+		global_node_IDs = mesh.elem_to_node_IDs[boundary_face2.elem_ID][
+				local_node_IDs]
+		# Sort and convert to tuple (to make it hashable)
+		global_node_IDs_2 = np.sort(global_node_IDs)
+		node_IDs_to_boundary_face2.setdefault(tuple(global_node_IDs_2),
+				(boundary_face2, global_node_IDs_2))
+
 	'''
 	Identify and create periodic interior_faces
 	'''
@@ -522,61 +545,40 @@ def match_boundary_pair(mesh, icoord, boundary_group1, boundary_group2,
 		face_ID1 = boundary_face1.face_ID
 
 		# Local IDs of face nodes
-		local_node_IDs = gbasis.get_local_face_principal_node_nums(
-			mesh.gorder, face_ID1)
+		local_node_IDs = face_node_table[face_ID1]
 		# Global IDs of face nodes
 		global_node_IDs = mesh.elem_to_node_IDs[elem_ID1][local_node_IDs]
 		# Sort for easy comparison later
 		global_node_IDs_1 = np.sort(global_node_IDs)
 
-		# Pair each node with corresponding one on other boundary
-		for boundary_face2 in boundary_group2.boundary_faces:
-			# Extract info
-			elem_ID2 = boundary_face2.elem_ID
-			face_ID2 = boundary_face2.face_ID
-
-			# Local IDs of face nodes
-			local_node_IDs = gbasis.get_local_face_principal_node_nums(
-					mesh.gorder, face_ID2)
-			# Global IDs of face nodes
-			global_node_IDs = mesh.elem_to_node_IDs[elem_ID2][local_node_IDs]
-			# Sort for easy comparison later
-			global_node_IDs_2 = np.sort(global_node_IDs)
-
-			''' Check for complete match between all nodes '''
-			# Get nodes on boundary 2 paired with those in global_node_IDs_1
-			idx1 = idx_in_node_pairs[global_node_IDs_1]
-			nodes1_partner_IDs = node_pairs[idx1, 1]
-			# Sort
-			nodes1_partner_IDs_sort = np.sort(nodes1_partner_IDs)
-
-			match = False
-			if np.all(global_node_IDs_2 == nodes1_partner_IDs_sort):
-				# Matching nodes
-				match = True
-
-				# Sanity check
-				if not np.all(global_node_IDs_2 == nodes1_partner_IDs):
-					raise ValueError("Node ordering on opposite periodic " +
-							"faces is different")
-
-				# Create interior face between these two faces
-				mesh.num_interior_faces += 1
-				interior_faces.append(mesh_defs.InteriorFace())
-				interior_face = interior_faces[-1]
-				interior_face.elemL_ID = elem_ID1
-				interior_face.faceL_ID = face_ID1
-				interior_face.elemR_ID = elem_ID2
-				interior_face.faceR_ID = face_ID2
-
-				# Decrement number of boundary faces
-				boundary_group1.num_boundary_faces -= 1
-				boundary_group2.num_boundary_faces -= 1
-
-				break
-
-		if not match:
+		# Get nodes on boundary 2 paired with those in global_node_IDs_1
+		idx1 = idx_in_node_pairs[global_node_IDs_1]
+		nodes1_partner_IDs = node_pairs[idx1, 1]
+
+		''' Find face on boundary 2 with all nodes matching '''
+		node_IDs_sort = tuple(np.sort(nodes1_partner_IDs))
+		if node_IDs_sort not in node_IDs_to_boundary_face2:
 			raise ValueError("Could not find matching boundary face")
+		boundary_face2, global_node_IDs_2 = node_IDs_to_boundary_face2[
+				node_IDs_sort]
+
+		# Sanity check
+		if not np.all(global_node_IDs_2 == nodes1_partner_IDs):
+			raise ValueError("Node ordering on opposite periodic " +
+					"faces is different")
+
+		# Create interior face between these two faces
+		mesh.num_interior_faces += 1
+		interior_faces.append(mesh_defs.InteriorFace())
+		interior_face = interior_faces[-1]
+		interior_face.elemL_ID = elem_ID1
+		interior_face.faceL_ID = face_ID1
+		interior_face.elemR_ID = boundary_face2.elem_ID
+		interior_face.faceR_ID = boundary_face2.face_ID
+
+		# Decrement number of boundary faces
+		boundary_group1.num_boundary_faces -= 1
+		boundary_group2.num_boundary_faces -= 1
 
 	# Verification
 	if boundary_group1.num_boundary_faces != 0 or \
@@ -624,6 +626,11 @@ def verify_periodic_mesh(mesh):
 	-------
 		mesh: mesh object
 	'''
+	# Unpack
+	face_node_table = get_local_face_principal_node_table(mesh)
+	elem_to_node_IDs = mesh.elem_to_node_IDs
+	node_coords = mesh.node_coords
+
 	# Loop through interior faces
 	for interior_face in mesh.interior_faces:
 		# Extract info
@@ -631,32 +638,30 @@ def verify_periodic_mesh(mesh):
 		elemR_ID = interior_face.elemR_ID
 		faceL_ID = interior_face.faceL_ID
 		faceR_ID = interior_face.faceR_ID
-		gbasis = mesh.gbasis
-		gorder = mesh.gorder
 
 		''' Get global IDs of face nodes '''
 		# Local IDs - left
-		local_node_IDs = gbasis.get_local_face_principal_node_nums(
-				gorder, faceL_ID)
+		local_node_IDs = face_node_table[faceL_ID]
 		# Global IDs - left
-		global_node_IDs_L = mesh.elem_to_node_IDs[elemL_ID][local_node_IDs]
+		global_node_IDs_L = elem_to_node_IDs[elemL_ID][local_node_IDs]
 		# Local IDs - right
-		local_node_IDs = gbasis.get_local_face_principal_node_nums(
-			gorder, faceR_ID)
+		local_node_IDs = face_node_table[faceR_ID]
 		# Global IDs - right
-		global_node_IDs_R = mesh.elem_to_node_IDs[elemR_ID][local_node_IDs]
+		global_node_IDs_R = elem_to_node_IDs[elemR_ID][local_node_IDs]
 
 		''' If exact same global nodes, then this is NOT a periodic face '''
-		# Sort for easy comparison
-		global_node_IDs_L = np.sort(global_node_IDs_L)
-		global_node_IDs_R = np.sort(global_node_IDs_R)
-		if np.all(global_node_IDs_L == global_node_IDs_R):
+		# Note: faces only have a few principal nodes, so comparing sets is
+		# cheaper than sorting both arrays
+		if set(global_node_IDs_L.tolist()) == set(global_node_IDs_R.tolist()):
 			# Skip non-periodic faces
 			continue
 
 		''' Compare distances '''
-		coordsL = mesh.node_coords[global_node_IDs_L]
-		coordsR = mesh.node_coords[global_node_IDs_R]
+		# Sort to pair up nodes
+		global_node_IDs_L = np.sort(global_node_IDs_L)
+		global_node_IDs_R = np.sort(global_node_IDs_R)
+		coordsL = node_coords[global_node_IDs_L]
+		coordsR = node_coords[global_node_IDs_R]
 		dists = np.linalg.norm(coordsL-coordsR, axis=1)
 		if np.abs(np.max(dists) - np.min(dists)) > TOL:
 			raise ValueError
@@ -677,6 +682,19 @@ def make_periodic_translational(mesh, x1=None, x2=None, y1=None, y2=None):
 	Outputs:
 	--------
 		mesh: mesh object (modified)
+
+	Notes:
+	------
+		The cost of this function (and of the other mesh manipulation
+		routines in this module) is dominated by Python-level loops over
+		faces and nodes and by the allocation of many small arrays, not
+		by floating-point work. Speedups should therefore come from
+		lookup tables, dict-based matching, and operations on whole-mesh
+		arrays rather than from tuning arithmetic.
+
+		Element objects hold views into mesh-level arrays (see
+		Mesh.create_elements). They are rebuilt at the end so that they
+		reflect the remapped node coordinates and connectivity.
 	'''
 	print("-------------------------------------------------")
 	print("IMPOSING PERIODICITY\n")
@@ -31,6 +31,9 @@ import meshing.gmsh as mesh_gmsh
 import numerics.basis.basis as basis_defs
 import numerics.basis.tools as basis_tools
 
+ELEM_BLOCK_SIZE = 1024 # number of elements processed at once when
+	# building the per-element space-time stiffness matrices
+
 
 def set_basis_spacetime(mesh, order, basis_name):
 	'''
@@ -91,6 +94,114 @@ def get_elem_inv_mass_matrix_ader(mesh, basis, order, elem_ID=-1,
 	return iMM # [nb_st, nb_st]
 
 
+def get_inv_mass_matrices_ader(mesh, basis_st, order):
+	'''
+	Calculate the inverse mass matrices for the ADER-DG prediction step
+	for all elements in physical space
+
+	Inputs:
+	-------
+		mesh: mesh object
+		basis_st: space-time basis object
+		order: solution order
+
+	Outputs:
+	--------
+		iMM_elems: inverse mass matrices [num_elems, nb_st, nb_st]
+
+	Notes:
+	------
+		Equivalent to calling get_elem_inv_mass_matrix_ader with
+		physical_space=True for each element, but the reference-space
+		quadrature data and basis values are evaluated only once
+	'''
+	gbasis = mesh.gbasis
+	quad_order = gbasis.get_quadrature_order(mesh, order*2)
+	quad_pts, quad_wts = basis_st.get_quadrature_data(quad_order)
+
+	basis_st.get_basis_val_grads(quad_pts, get_val=True)
+	basis_val = basis_st.basis_val
+
+	djac_elems, _, _ = basis_tools.element_jacobians(mesh, quad_pts,
+			get_djac=True) # [num_elems, nq, 1]
+
+	MM_elems = np.matmul(basis_val.transpose(), basis_val*quad_wts*
+			djac_elems) # [num_elems, nb_st, nb_st]
+
+	return np.linalg.inv(MM_elems) # [num_elems, nb_st, nb_st]
+
+
+def get_stiffness_matrices_ader(mesh, basis_st, order, dt):
+	'''
+	Calculate the spatial stiffness matrices for the ADER-DG prediction
+	step for all elements in physical space
+
+	Inputs:
+	-------
+		mesh: mesh object
+		basis_st: space-time basis object
+		order: solution order
+		dt: time step
+
+	Outputs:
+	--------
+		SMS_elems: transposed stiffness matrices in each spatial direction
+			[num_elems, nb_st, nb_st, ndims]
+
+	Notes:
+	------
+		SMS_elems[elem_ID, :, :, d] is the transpose of the output of
+		get_stiffness_matrix_ader with grad_dir=d and physical_space=True.
+		The reference-space quadrature data and basis values are evaluated
+		only once for all elements.
+	'''
+	ndims = mesh.ndims
+
+	quad_order_st = basis_st.get_quadrature_order(mesh, order*2)
+	quad_pts_st, quad_wts_st = basis_st.get_quadrature_data(quad_order_st)
+
+	_, _, ijac = basis_tools.element_jacobians(mesh, quad_pts_st,
+			get_djac=True, get_ijac=True) # [num_elems, nq_st, ndims, ndims]
+
+	num_elems = ijac.shape[0]
+	nq_st = quad_pts_st.shape[0]
+
+	basis_st.get_basis_val_grads(quad_pts_st, get_val=True,
+			get_ref_grad=True)
+	basis_st_val = basis_st.basis_val
+	basis_ref_grad = basis_st.basis_ref_grad
+	nb_st = basis_st_val.shape[1]
+
+	SMS_elems = np.zeros([num_elems, nb_st, nb_st, ndims])
+
+	# The physical gradients of the space-time basis are
+	# [num_elems, nq_st, nb_st, ndims + 1], so elements are processed
+	# in blocks to keep these temporaries small on large meshes
+	for start in range(0, num_elems, ELEM_BLOCK_SIZE):
+		elems = slice(start, start + ELEM_BLOCK_SIZE)
+		ijac_block = ijac[elems]
+		nblock = ijac_block.shape[0]
+
+		ijac_st = np.zeros([nblock, nq_st, ndims + 1, ndims + 1])
+		ijac_st[:, :, :ndims, :ndims] = ijac_block
+
+		# Add the temporal Jacobian in the ndims+1 dimension
+		ijac_st[:, :, ndims, ndims] = 2./dt
+
+		# Physical gradient of the space-time basis for each element
+		basis_st_grad = np.matmul(ijac_st.transpose(0, 1, 3, 2),
+				basis_ref_grad.transpose(0, 2, 1)).transpose(0, 1, 3, 2)
+				# [nblock, nq_st, nb_st, ndims + 1]
+
+		for grad_dir in range(ndims):
+			SM = np.matmul(basis_st_grad[:, :, :, grad_dir].transpose(
+					0, 2, 1), basis_st_val*quad_wts_st)
+					# [nblock, nb_st, nb_st]
+			SMS_elems[elems, :, :, grad_dir] = SM.transpose(0, 2, 1)
+
+	return SMS_elems # [num_elems, nb_st, nb_st, ndims]
+
+
 def get_stiffness_matrix_ader(mesh, basis, basis_st, order, dt, elem_ID,
 		grad_dir, physical_space=False):
 	'''
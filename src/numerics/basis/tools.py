@@ -163,16 +163,43 @@ def get_inv_mass_matrices(mesh, basis, order):
 	Outputs:
 	--------
 		iMM_all: all inverse mass matrices
+
+	Notes:
+	------
+		For elements with a constant Jacobian determinant (affine
+		elements), the mass matrix is the reference mass matrix scaled by
+		the determinant, so its inverse is obtained by scaling the
+		inverse reference mass matrix. The remaining elements are
+		inverted directly.
 	'''
-	nb = basis.nb
+	gbasis = mesh.gbasis
+	quad_order = gbasis.get_quadrature_order(mesh, order*2)
+	quad_pts, quad_wts = basis.get_quadrature_data(quad_order)
+
+	basis.get_basis_val_grads(quad_pts, get_val=True)
+	basis_val = basis.basis_val
+
+	djac_elems, _, _ = element_jacobians(mesh, quad_pts, get_djac=True)
+		# [num_elems, nq, 1]
+
+	# Elements with constant Jacobian determinant
+	djac_ref = djac_elems[:, :1]
+	affine = np.all(np.abs(djac_elems - djac_ref) <= 1e-14*djac_ref,
+			axis=(1, 2))
 
-	iMM_all = np.zeros([mesh.num_elems, nb, nb])
+	iMM_all = np.empty([mesh.num_elems, basis.nb, basis.nb])
 
-	for elem_ID in range(mesh.num_elems):
-		# Calculate the inv mass matrix in physical space
-		iMM = get_elem_inv_mass_matrix(mesh, basis, order, elem_ID, True)
-		# Store
-		iMM_all[elem_ID] = iMM
+	# Affine elements: scale the inverse reference mass matrix
+	if np.any(affine):
+		iMM_ref = np.linalg.inv(np.matmul(basis_val.transpose(),
+				basis_val*quad_wts))
+		iMM_all[affine] = iMM_ref/djac_ref[affine]
+
+	# Other elements
+	if not np.all(affine):
+		MM = np.matmul(basis_val.transpose(), basis_val*quad_wts*
+				djac_elems[~affine])
+		iMM_all[~affine] = np.linalg.inv(MM)
 
 	return iMM_all # [mesh.num_elems, nb, nb]
 
@@ -342,6 +369,84 @@ def element_jacobian(mesh, elem_ID, quad_pts, get_djac=False, get_jac=False,
 		# [nq, 1], [nq, ndims, ndims], and [nq, ndims, ndims]
 
 
+def element_jacobians(mesh, quad_pts, get_djac=False, get_jac=False,
+		get_ijac=False, elem_IDs=None):
+	'''
+	Evaluate the geometric Jacobian for all elements at once
+
+	Inputs:
+	-------
+		mesh: mesh object
+		quad_pts: coordinates of quadrature points
+		get_djac: [OPTIONAL] flag to calculate Jacobian determinant
+			(Default: False)
+		get_jac: [OPTIONAL] flag to calculate Jacobian (Default: False)
+		get_ijac: [OPTIONAL] flag to calculate inverse of the Jacobian
+			(Default: False)
+		elem_IDs: [OPTIONAL] indices of the elements to evaluate
+			(Default: all elements)
+
+	Outputs:
+	--------
+		djac: determinant of the Jacobian [num_elems, nq, 1]
+		jac: Jacobian [num_elems, nq, ndims, ndims]
+		ijac: inverse Jacobian [num_elems, nq, ndims, ndims]
+			(None if not requested)
+	'''
+	gbasis = mesh.gbasis
+	ndims = gbasis.NDIMS
+
+	# Gradients in reference space
+	basis_ref_grad = gbasis.get_grads(quad_pts) # [nq, nb, ndims]
+
+	if ndims != mesh.ndims:
+		raise Exception("Dimensions don't match")
+
+	# Node coordinates of the requested elements
+	if elem_IDs is None:
+		elem_IDs = np.arange(mesh.num_elems)
+	elem_coords = mesh.node_coords[mesh.elem_to_node_IDs[elem_IDs]]
+		# [num_elems, nb, ndims]
+
+	# Compute Jacobian
+	jac = np.matmul(elem_coords.transpose(0, 2, 1)[:, np.newaxis],
+			basis_ref_grad) # [num_elems, nq, ndims, ndims]
+
+	# Get inverse and determinant. These are written out in closed form
+	# for the small matrices encountered in 1D and 2D, which avoids the
+	# overhead of LAPACK on stacks of tiny matrices.
+	if ndims == 1:
+		djac = np.linalg.det(jac)[:, :, np.newaxis]
+		ijac = 1./jac if get_ijac else None
+	elif ndims == 2:
+		a = jac[:, :, 0, 0]
+		b = jac[:, :, 0, 1]
+		c = jac[:, :, 1, 0]
+		d = jac[:, :, 1, 1]
+		det = a*d - b*c
+		djac = det[:, :, np.newaxis]
+		if get_ijac:
+			ijac = np.empty_like(jac)
+			ijac[:, :, 0, 0] = d/det
+			ijac[:, :, 0, 1] = -b/det
+			ijac[:, :, 1, 0] = -c/det
+			ijac[:, :, 1, 1] = a/det
+		else:
+			ijac = None
+	else:
+		ijac = np.linalg.inv(jac) if get_ijac else None
+		djac = np.linalg.det(jac)[:, :, np.newaxis]
+
+	# Check for nonpositive Jacobian
+	if get_djac and np.any(djac <= 0.):
+		elem_ID = elem_IDs[np.argwhere(djac <= 0.)[0, 0]]
+		raise Exception("Nonpositive Jacobian (elem_ID = %d)" % (elem_ID))
+
+	return djac, jac, ijac
+		# [num_elems, nq, 1], [num_elems, nq, ndims, ndims], and
+		# [num_elems, nq, ndims, ndims]
+
+
 def calculate_1D_normals(mesh, elem_ID, face_ID, quad_pts):
 
 	'''
@@ -350,27 +455,34 @@ def calculate_1D_normals(mesh, elem_ID, face_ID, quad_pts):
 	Inputs:
 	-------
 		mesh: mesh object
-		elem_ID: element index
-		face_ID: face index
+		elem_ID: element index, or array of element indices [nf]
+		face_ID: face index, or array of face indices with the same
+			shape as elem_ID
 		quad_pts: points in reference space at which to calculate normals
 
 	Outputs:
 	--------
-		normals: normal vector [nq, ndims]
+		normals: normal vector [nq, ndims] (or [nf, nq, ndims] if
+			elem_ID is an array)
 	'''
 	nq = quad_pts.shape[0]
 
-	normals = np.zeros([nq, mesh.ndims])
+	normals = np.zeros(np.shape(elem_ID) + (nq, mesh.ndims))
 
 	# 1D normals calculation
-	if face_ID == 0:
-		normals[0] = -1.
+	if np.ndim(face_ID) > 0:
+		if np.any((face_ID != 0) & (face_ID != 1)):
+			raise ValueError
+		# Face 0 points left and face 1 points right
+		normals[..., 0, 0] = 2.*face_ID - 1.
+	elif face_ID == 0:
+		normals[..., 0, :] = -1.
 	elif face_ID == 1:
-		normals[0] = 1.
+		normals[..., 0, :] = 1.
 	else:
 		raise ValueError
 
-	return normals # [nq, ndims]
+	return normals # [nq, ndims] or [nf, nq, ndims]
 
 
 def calculate_2D_normals(mesh, elem_ID, face_ID, quad_pts):
@@ -380,35 +492,46 @@ def calculate_2D_normals(mesh, elem_ID, face_ID, quad_pts):
 	Inputs:
 	-------
 		mesh: mesh object
-		elem_ID: element index
-		face_ID: face index
+		elem_ID: element index, or array of element indices [nf]
+		face_ID: face index, or array of face indices with the same
+			shape as elem_ID
 		quad_pts: points in reference space at which to calculate normals
 
 	Outputs:
 	--------
-		normals: normal vector [nq, ndims]
+		normals: normal vector [nq, ndims] (or [nf, nq, ndims] if
+			elem_ID is an array)
 	'''
 	gbasis = mesh.gbasis
 	gorder = mesh.gorder
-	elem_coords = mesh.elements[elem_ID].node_coords
+	elem_coords = mesh.node_coords[mesh.elem_to_node_IDs[elem_ID]]
 
 	''' Get face coordinates '''
-	# Get local IDs of face nodes
-	fnodes = gbasis.get_local_face_node_nums(gorder, face_ID)
 	# Instantiate segment basis
 	basis_seg = basis_defs.LagrangeSeg(gorder)
 	# Compute basis values
 	basis_ref_grad = basis_seg.get_grads(quad_pts)
-	# Extract coordinates of face nodes
-	face_coords = elem_coords[fnodes]
+	if np.ndim(face_ID) > 0:
+		# Get local IDs of face nodes for every face
+		fnodes = np.array([gbasis.get_local_face_node_nums(gorder, i)
+				for i in range(gbasis.NFACES)])[face_ID]
+		# Extract coordinates of face nodes
+		face_coords = np.take_along_axis(elem_coords,
+				fnodes[..., np.newaxis], axis=-2)
+	else:
+		# Get local IDs of face nodes
+		fnodes = gbasis.get_local_face_node_nums(gorder, face_ID)
+		# Extract coordinates of face nodes
+		face_coords = elem_coords[..., fnodes, :]
 
 	''' Calculate 2D normals '''
-	xphys_grad = np.matmul(face_coords.transpose(), basis_ref_grad)[
-			:, :, 0] # gradient of physical space w.r.t ref space
-	normals = xphys_grad[:, ::-1]
-	normals[:, 1] *= -1.
+	xphys_grad = np.matmul(np.swapaxes(face_coords, -1, -2)[..., np.newaxis,
+			:, :], basis_ref_grad)[..., 0]
+			# gradient of physical space w.r.t ref space
+	normals = xphys_grad[..., ::-1]
+	normals[..., 1] *= -1.
 
-	return normals # [nq, ndims]
+	return normals # [nq, ndims] or [nf, nq, ndims]
 
 
 def get_lagrange_basis_1D(xq, xnodes, basis_val=None, basis_ref_grad=None):
@@ -457,6 +580,51 @@ def get_lagrange_basis_1D(xq, xnodes, basis_val=None, basis_ref_grad=None):
 			mask[j] = True
 
 
+def get_tensor_product_factor(basis, quad_pts, basis_val):
+	'''
+	Evaluates the 1D basis whose tensor product with itself gives the
+	values of a quadrilateral basis at a tensor-product grid of
+	quadrature points
+
+	Inputs:
+	-------
+		basis: basis object
+		quad_pts: coordinates of quadrature points [nq, ndims]
+		basis_val: values of basis at quad_pts [nq, nb]
+
+	Outputs:
+	--------
+		basis_val_1D: values of the 1D basis [nq_1D, order + 1] (None if
+			basis_val is not such a tensor product)
+
+	Notes:
+	------
+		The quadrature points and the basis functions are both ordered
+		with the x-index varying fastest, so that
+		basis_val = kron(basis_val_1D, basis_val_1D)
+	'''
+	if isinstance(basis, basis_defs.LagrangeQuad):
+		basis_1D = basis_defs.LagrangeSeg(basis.order)
+		basis_1D.get_1d_nodes = basis.get_1d_nodes
+	elif isinstance(basis, basis_defs.LegendreQuad):
+		basis_1D = basis_defs.LegendreSeg(basis.order)
+	else:
+		return None
+
+	nq = quad_pts.shape[0]
+	nq_1D = int(round(np.sqrt(nq)))
+	if nq_1D**2 != nq:
+		return None
+
+	basis_val_1D = basis_1D.get_values(quad_pts[:nq_1D, :1])
+
+	# Check that the quadrature points form a tensor-product grid
+	if not np.allclose(np.kron(basis_val_1D, basis_val_1D), basis_val):
+		return None
+
+	return basis_val_1D # [nq_1D, order + 1]
+
+
 def get_lagrange_basis_2D(xq, xnodes, basis_val=None, basis_ref_grad=None):
 	'''
 	Calculates the 2D Lagrange basis functions
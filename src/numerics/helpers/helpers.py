@@ -43,17 +43,20 @@ def get_element_mean(Uq, quad_wts, djac, vol):
 	return U_mean # [ne, 1, ns]
 
 
-def evaluate_state(Uc, basis_val, skip_interp=False):
+def evaluate_state(Uc, basis_val, skip_interp=False, basis_val_1D=None):
 	'''
 	This function evaluates the state based on the given basis values.
 
 	Inputs:
 	-------
 	    Uc: state coefficients [ne, nb, ns]
-	    basis_val: basis values [ne, nq, nb]
+	    basis_val: basis values [ne, nq, nb] or [nq, nb]
 	    skip_interp: if True, then will simply copy the state coefficients;
 	    	useful for a colocated scheme, i.e. quadrature points and
 	    	solution nodes (for a nodal basis) are the same
+	    basis_val_1D: [OPTIONAL] 1D factor of a tensor-product basis_val
+	    	[nq_1D, nb_1D]; if given, then the state is evaluated with sum
+	    	factorization, one direction at a time
 
 	Outputs:
 	--------
@@ -61,13 +64,21 @@ def evaluate_state(Uc, basis_val, skip_interp=False):
 	'''
 	if skip_interp:
 		Uq = Uc.copy()
+	elif basis_val_1D is not None:
+		ne, nb, ns = Uc.shape
+		nq_1D, nb_1D = basis_val_1D.shape
+		# Interpolate in the x-direction
+		Uq = np.matmul(basis_val_1D, Uc.reshape(ne, nb_1D, nb_1D, ns))
+			# [ne, nb_1D, nq_1D, ns]
+		# Interpolate in the y-direction
+		Uq = np.matmul(basis_val_1D, Uq.reshape(ne, nb_1D, nq_1D*ns))
+			# [ne, nq_1D, nq_1D*ns]
+		Uq = Uq.reshape(ne, nq_1D*nq_1D, ns)
 	else:
-		if basis_val.ndim == 3:
-			# For faces, there is a different basis_val for each face
-			Uq = np.einsum('ijn, ink -> ijk', basis_val, Uc)
-		else:
-			# For elements, all elements have the same basis_val
-			Uq = np.einsum('jn, ink -> ijk', basis_val, Uc)
+		# For faces, there is a different basis_val for each face. For
+		# elements, all elements have the same basis_val, which is
+		# broadcast.
+		Uq = np.matmul(basis_val, Uc)
 
 	return Uq # [ne, nq, ns]
 
@@ -87,10 +98,11 @@ def evaluate_gradient(Uc, basis_phys_grad_elems):
 	--------
 	    gUq: gradient of the state [ne, nq, ns, ndims]
 	'''
-	if basis_phys_grad_elems.ndim == 4:
-		gUq = np.einsum('ijml, imk -> ijkl', basis_phys_grad_elems, Uc)
-	else:
-		gUq = np.einsum('jml, imk -> ijkl', basis_phys_grad_elems, Uc)
+	# Batched matrix multiply of the transposed coefficients with the
+	# basis gradients of each quadrature point (broadcast over the
+	# elements if the gradients are element-independent)
+	gUq = np.matmul(Uc.transpose(0, 2, 1)[:, np.newaxis],
+			basis_phys_grad_elems)
 
 	return gUq # [ne, nq, ns, ndims]
 
@@ -110,6 +122,6 @@ def ref_to_phys_grad(ijac, gU_ref):
 	--------
 		gU_phys: physical gradient of the state [ne, num_pts, ns, ndims]
 	'''
-	gU_phys = np.einsum('ijpl, ijkp -> ijkl', ijac, gU_ref)
+	gU_phys = np.matmul(gU_ref, ijac)
 
 	return gU_phys # [ne, num_pts, ns, ndims]
\ No newline at end of file
@@ -179,14 +179,9 @@ class PositivityPreserving(base.LimiterBase):
 		''' Limit pressure '''
 		# Compute pressure at quadrature points
 		p_elem_faces = physics.compute_variable(self.var_name2, U_elem_faces)
-		theta[:] = 1.
-		# Indices where pressure is negative
-		negative_p_indices = np.where(p_elem_faces < 0.)
-		elem_IDs = negative_p_indices[0]
-		i_neg_p  = negative_p_indices[1]
-
-		theta[elem_IDs, i_neg_p] = (p_bar[elem_IDs, :, 0] - POS_TOL) / (
-				p_bar[elem_IDs, :, 0] - p_elem_faces[elem_IDs, i_neg_p, :])
+		# Limit only where pressure is negative (branch-free select)
+		theta = np.where(p_elem_faces < 0., (p_bar - POS_TOL) / (
+				p_bar - p_elem_faces), 1.)
 
 		# Truncate theta2; otherwise, can get noticeably different
 		# results across machines, possibly due to poor conditioning in its
@@ -323,14 +318,9 @@ class PositivityPreservingChem(PositivityPreserving):
 		''' Limit pressure '''
 		# Compute pressure at quadrature points
 		p_elem_faces = physics.compute_variable(self.var_name2, U_elem_faces)
-		theta[:] = 1.
-		# Indices where pressure is negative
-		negative_p_indices = np.where(p_elem_faces < 0.)
-		elem_IDs = negative_p_indices[0]
-		i_neg_p  = negative_p_indices[1]
-
-		theta[elem_IDs, i_neg_p] = p_bar[elem_IDs, :, 0] / (
-				p_bar[elem_IDs, :, 0] - p_elem_faces[elem_IDs, i_neg_p])
+		# Limit only where pressure is negative (branch-free select)
+		theta = np.where(p_elem_faces < 0., p_bar / (
+				p_bar - p_elem_faces), 1.)
 
 		# Truncate theta3; otherwise, can get noticeably different
 		# results across machines, possibly due to poor conditioning in its
@@ -61,6 +61,9 @@ class WENO(base.LimiterBase):
 		stores the right eigenvector for the equation set
 	left_eigen: numpy array
 		stores the left eigenvector for the equation set
+	get_eigenvectors: method
+		physics method that computes the right and left eigenvectors
+		(None if the equation set does not provide one)
 	basis_ref_hessian: numpy array
 		stores the hessian for the basis on ref element
 	basis_phys_hessian_elems: numpy array
@@ -78,6 +81,7 @@ class WENO(base.LimiterBase):
 		self.djac_elems = np.zeros(0)
 		self.elemP_IDs = np.zeros(0)
 		self.elemM_IDs = np.zeros(0)
+		self.get_eigenvectors = None
 
 	def precompute_helpers(self, solver):
 		# Unpack
@@ -112,16 +116,17 @@ class WENO(base.LimiterBase):
 		# Element quadrature weights
 		self.quad_wts_elem = elem_helpers.quad_wts
 
-		# identify neighboring elements and store
-		elemP_IDs = np.empty([num_elems], dtype=int)
-		elemM_IDs = np.empty([num_elems], dtype=int)
+		# identify neighboring elements and store (read directly from the
+		# neighbor table of the mesh rather than from each element object)
+		self.elemP_IDs = mesh.elem_to_neighbor_IDs[:, 1].astype(int)
+		self.elemM_IDs = mesh.elem_to_neighbor_IDs[:, 0].astype(int)
 
-		for elem_ID in range(num_elems):
-			elemP_IDs[elem_ID] = mesh.elements[elem_ID].face_to_neighbors[1]
-			elemM_IDs[elem_ID] = mesh.elements[elem_ID].face_to_neighbors[0]
-	
-		self.elemP_IDs = elemP_IDs
-		self.elemM_IDs = elemM_IDs
+		# Look up the eigenvector function once (not available for the
+		# scalar case)
+		get_eigenvectors = getattr(solver.physics, "get_conv_eigenvectors",
+				None)
+		if callable(get_eigenvectors):
+			self.get_eigenvectors = get_eigenvectors
 
 		# Allocate the right and left eigenvectors (needed for scalar case)
 		self.right_eigen = np.ones([num_elems, 1, ns, ns])
@@ -208,11 +213,9 @@ class WENO(base.LimiterBase):
 
 		# Calculate the eigenvectors if available (they are pre-allocated in 
 		# precompute_helpers)
-		get_eigenvector_function = getattr(physics, 
-				"get_conv_eigenvectors", None)
-		if callable(get_eigenvector_function):
+		if self.get_eigenvectors is not None:
 			self.right_eigen, self.left_eigen = \
-					physics.get_conv_eigenvectors(U_bar)
+					self.get_eigenvectors(U_bar)
 
 		Vc = np.einsum('elij, elj -> eli', self.left_eigen, Uc)
 
@@ -88,7 +88,8 @@ class SourceSolvers():
 			A, iA = self.get_jacobian_matrix(mesh, solver)
 
 			res = np.einsum('ijkll, ijl -> ikl', A, U) + dU
-			U = np.einsum('ijkll, ijl -> ikl', iA, res)
+			# Update in place so that the state keeps its precision
+			U[:] = np.einsum('ijkll, ijl -> ikl', iA, res)
 
 			solver.apply_limiter(U)
 			solver.state_coeffs = U
@@ -192,9 +193,6 @@ class SourceSolvers():
 			mesh = solver.mesh
 			elem_helpers = solver.elem_helpers
 			basis_val = elem_helpers.basis_val
-			iMM_elems = elem_helpers.iMM_elems
-			quad_pts = elem_helpers.quad_pts
-			quad_wts = elem_helpers.quad_wts
 			x_elems = elem_helpers.x_elems
 
 			Uq = helpers.evaluate_state(U, basis_val,
@@ -213,8 +211,7 @@ class SourceSolvers():
 			res = self.res
 
 			# Project onto the basis state from the quadrature points
-			solver_tools.L2_projection(mesh, iMM_elems, solver.basis,
-					quad_pts, quad_wts, Uq, U)
+			U[:] = np.matmul(elem_helpers.proj_elems, Uq)
 
 			solver.apply_limiter(U)
 			solver.state_coeffs = U
@@ -251,9 +248,6 @@ class SourceSolvers():
 			mesh = solver.mesh
 			elem_helpers = solver.elem_helpers
 			basis_val = elem_helpers.basis_val
-			iMM_elems = elem_helpers.iMM_elems
-			quad_pts = elem_helpers.quad_pts
-			quad_wts = elem_helpers.quad_wts
 			x_elems = elem_helpers.x_elems
 
 			U = solver.state_coeffs
@@ -285,8 +279,7 @@ class SourceSolvers():
 			solver.count_evaluations += len(subiterations)
 
 			# Project onto the basis state from the quadrature points
-			solver_tools.L2_projection(mesh, iMM_elems, solver.basis,
-					quad_pts, quad_wts, value, U)
+			U[:] = np.matmul(elem_helpers.proj_elems, value)
 
 			solver.apply_limiter(U)
 			solver.state_coeffs = U
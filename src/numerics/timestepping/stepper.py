@@ -161,30 +161,42 @@ class RK4(StepperBase):
 	'''
 	STEPPER_TYPE = StepperType.RK4
 
+	def __init__(self, U):
+		super().__init__(U)
+		'''
+		Additional Attributes:
+		----------------------
+		Utemp: numpy array
+			intermediate solution array reused by each stage
+				(shape: [num_elems, nb, ns])
+		'''
+		self.Utemp = np.zeros_like(U)
+
 	def take_time_step(self, solver):
 		physics = solver.physics
 		mesh = solver.mesh
 		U = solver.state_coeffs
 
 		res = self.res
+		Utemp = self.Utemp
 
 		# First stage
 		res = solver.get_residual(U, res)
 		dU1 = solver_tools.mult_inv_mass_matrix(mesh, solver, self.dt, res)
-		Utemp = U + 0.5*dU1
+		np.add(U, 0.5*dU1, out=Utemp)
 		solver.apply_limiter(Utemp)
 
 		# Second stage
 		solver.time += self.dt/2.
 		res = solver.get_residual(Utemp, res)
 		dU2 = solver_tools.mult_inv_mass_matrix(mesh, solver, self.dt, res)
-		Utemp = U + 0.5*dU2
+		np.add(U, 0.5*dU2, out=Utemp)
 		solver.apply_limiter(Utemp)
 
 		# Third stage
 		res = solver.get_residual(Utemp, res)
 		dU3 = solver_tools.mult_inv_mass_matrix(mesh, solver, self.dt, res)
-		Utemp = U + dU3
+		np.add(U, dU3, out=Utemp)
 		solver.apply_limiter(Utemp)
 
 		# Fourth stage
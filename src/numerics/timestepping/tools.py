@@ -123,6 +123,11 @@ def set_time_stepping_approach(stepper, params):
 		3. CFL number
 		4. number of time steps and time step size
 	'''
+	if num_time_steps != None:
+		# Store as a Python int so that the time loop does not do NumPy
+		# scalar arithmetic
+		num_time_steps = int(num_time_steps)
+
 	if num_time_steps != None and tfinal != None:
 		stepper.get_time_step = get_dt_from_num_time_steps
 		stepper.num_time_steps = num_time_steps
@@ -77,6 +77,11 @@ def set_state_indices_slices(physics):
 		physics.state_slices[key.name] = slice(index, index+1)
 		index += 1
 
+	# Store all indices and slices in state variable order so that they
+	# can be unpacked without repeated dictionary lookups
+	physics.state_index_tuple = tuple(physics.state_indices.values())
+	physics.state_slice_tuple = tuple(physics.state_slices.values())
+
 
 class PhysicsBase(ABC):
 	'''
@@ -99,6 +104,10 @@ class PhysicsBase(ABC):
 	state_slices: dict
 	    keys are the names of the state variables; values are the
 	    corresponding slices
+	state_index_tuple: tuple
+	    indices of all state variables, ordered as in StateVariables
+	state_slice_tuple: tuple
+	    slices of all state variables, ordered as in StateVariables
 	IC_fcn_map: dict
 		keys are the types of initial conditions (members of FcnType enum);
 		values are the corresponding classes
@@ -224,6 +233,8 @@ class PhysicsBase(ABC):
 		'''
 		self.state_indices = {}
 		self.state_slices = {}
+		self.state_index_tuple = ()
+		self.state_slice_tuple = ()
 		self.IC_fcn_map = {}
 		self.exact_fcn_map = {}
 		self.BC_map = {}
@@ -548,6 +559,14 @@ class PhysicsBase(ABC):
 		Outputs:
 		--------
 			Fq: flux values [ne, nq, ns, ndims]
+
+		Notes:
+		------
+			The (ns, ndims) block of each quadrature point is contiguous,
+			which is the layout the volume and face integrals contract
+			over. Implementations should fill it with block assignments
+			over state/direction slices (e.g. the full stress tensor into
+			F[:, :, smom, :]) rather than one [ne, nq] write per entry.
 		'''
 		pass
 
@@ -206,8 +206,7 @@ class LaxFriedrichs(ConvNumFluxBase):
 		aR = physics.compute_variable("MaxWaveSpeed", UqR,
 				flag_non_physical=True)
 
-		idx = aR > a
-		a[idx] = aR[idx]
+		np.maximum(a, aR, out=a)
 
 		# Put together
 		return n_mag*(0.5*(FqL+FqR) - 0.5*a*dUq)
@@ -127,9 +127,12 @@ class Chemistry(base.PhysicsBase):
 				raise errors.NotPhysicalError
 
 		''' Nested functions for common quantities '''
-		def get_pressure():
-			varq = (gamma - 1.)*(rhoE - 0.5*np.sum(mom*mom, axis=2,
-					keepdims=True)/rho - qo*rhoY)
+		def get_internal_energy(mom2=None):
+			if mom2 is None:
+				mom2 = np.sum(mom*mom, axis=2, keepdims=True)
+			return rhoE - 0.5*mom2/rho
+		def get_pressure(mom2=None):
+			varq = (gamma - 1.)*(get_internal_energy(mom2) - qo*rhoY)
 			if flag_non_physical:
 				if np.any(varq < 0.):
 					raise errors.NotPhysicalError
@@ -146,14 +149,14 @@ class Chemistry(base.PhysicsBase):
 		elif vname is self.AdditionalVariables["Entropy"].name:
 			varq = np.log(get_pressure()/rho**gamma)
 		elif vname is self.AdditionalVariables["InternalEnergy"].name:
-			varq = rhoE - 0.5*np.sum(mom*mom, axis=2, keepdims=True)/rho
+			varq = get_internal_energy()
 		elif vname is self.AdditionalVariables["TotalEnthalpy"].name:
 			varq = (rhoE + get_pressure())/rho
 		elif vname is self.AdditionalVariables["SoundSpeed"].name:
 			varq = np.sqrt(gamma*get_pressure()/rho)
 		elif vname is self.AdditionalVariables["MaxWaveSpeed"].name:
-			varq = np.linalg.norm(mom, axis=2, keepdims=True)/rho + np.sqrt(
-					gamma*get_pressure()/rho)
+			mom2 = np.sum(mom*mom, axis=2, keepdims=True)
+			varq = np.sqrt(mom2)/rho + np.sqrt(gamma*get_pressure(mom2)/rho)
 		elif vname is self.AdditionalVariables["MassFraction"].name:
 			varq = rhoY/rho
 		#NOTE: 1D only right now.
@@ -207,20 +210,12 @@ class Chemistry1D(Chemistry):
 		Mixture = "\\rho Y"
 
 	def get_state_indices(self):
-		irho = self.get_state_index("Density")
-		irhou = self.get_state_index("XMomentum")
-		irhoE = self.get_state_index("Energy")
-		irhoY = self.get_state_index("Mixture")
-
-		return irho, irhou, irhoE, irhoY
+		# irho, irhou, irhoE, irhoY
+		return self.state_index_tuple
 
 	def get_state_slices(self):
-		srho = self.get_state_slice("Density")
-		srhou = self.get_state_slice("XMomentum")
-		srhoE = self.get_state_slice("Energy")
-		srhoY = self.get_state_slice("Mixture")
-
-		return srho, srhou, srhoE, srhoY
+		# srho, srhou, srhoE, srhoY
+		return self.state_slice_tuple
 
 	def get_momentum_slice(self):
 		irhou = self.get_state_index("XMomentum")
@@ -304,7 +299,7 @@ class Chemistry1D(Chemistry):
 		p = (self.gamma - 1.)*(rhoE - 0.5 * rho * u2 \
 				- rhoY * self.qo) # [n, nq]
 		# Get total enthalpy
-		H = rhoE/rho + p/rho # CHECK : do I need to divide by rho here?
+		H = (rhoE + p)/rho # CHECK : do I need to divide by rho here?
 
 		# Get sound speed
 		a = np.sqrt(self.gamma * p / rho)
@@ -109,23 +109,24 @@ class SimpleDetonation1(FcnBase):
 		''' Fill state '''
 		Uq = np.zeros([x.shape[0], x.shape[1], physics.NUM_STATE_VARS])
 
-		for elem_ID in range(Uq.shape[0]):
-			ileft = (x[elem_ID] <= xshock).reshape(-1)
-			iright = (x[elem_ID] > xshock).reshape(-1)
-			# Density
-			Uq[elem_ID, iright, srho] = rho_u
-			Uq[elem_ID, ileft, srho] = rho_b
-			# Momentum
-			Uq[elem_ID, iright, srhou] = rho_u*u_u
-			Uq[elem_ID, ileft, srhou] = rho_b*u_b
-			# Energy
-			Uq[elem_ID, iright, srhoE] = (p_u/(gam-1.) + 0.5*rho_u*u_u*u_u +
-					qo*rho_u*Y_u)
-			Uq[elem_ID, ileft, srhoE] = (p_b/(gam-1.) + 0.5*rho_b*u_b*u_b +
-					qo*rho_b*Y_b)
-			# MixtureFraction
-			Uq[elem_ID, iright, srhoz] = rho_u*Y_u
-			Uq[elem_ID, ileft, srhoz] = rho_b*Y_b
+		# Masks of the points on either side of the shock, for all
+		# elements at once
+		ileft = x[:, :, 0] <= xshock # [ne, nq]
+		iright = x[:, :, 0] > xshock # [ne, nq]
+		# Density
+		Uq[iright, srho] = rho_u
+		Uq[ileft, srho] = rho_b
+		# Momentum
+		Uq[iright, srhou] = rho_u*u_u
+		Uq[ileft, srhou] = rho_b*u_b
+		# Energy
+		Uq[iright, srhoE] = (p_u/(gam-1.) + 0.5*rho_u*u_u*u_u +
+				qo*rho_u*Y_u)
+		Uq[ileft, srhoE] = (p_b/(gam-1.) + 0.5*rho_b*u_b*u_b +
+				qo*rho_b*Y_b)
+		# MixtureFraction
+		Uq[iright, srhoz] = rho_u*Y_u
+		Uq[ileft, srhoz] = rho_b*Y_b
 
 		return Uq # [ne, nq, ns]
 
@@ -192,8 +193,9 @@ class OverdrivenDetonation(FcnBase):
 		R = physics.R
 
 		# Source term constants
-		Ta = physics.source_terms[0].Tign
-		A = physics.source_terms[0].A
+		source = physics.source_terms[0]
+		Ta = source.Tign
+		A = source.A
 
 		# Normalized Pre-shock state 
 		rho1 = 1.
@@ -122,9 +122,12 @@ class Euler(base.PhysicsBase):
 				raise errors.NotPhysicalError
 
 		''' Nested functions for common quantities '''
-		def get_pressure():
-			varq = (gamma - 1.)*(rhoE - 0.5*np.sum(mom*mom, axis=2,
-					keepdims=True)/rho)
+		def get_internal_energy(mom2=None):
+			if mom2 is None:
+				mom2 = np.sum(mom*mom, axis=2, keepdims=True)
+			return rhoE - 0.5*mom2/rho
+		def get_pressure(mom2=None):
+			varq = (gamma - 1.)*get_internal_energy(mom2)
 			if flag_non_physical:
 				if np.any(varq < 0.):
 					raise errors.NotPhysicalError
@@ -144,15 +147,15 @@ class Euler(base.PhysicsBase):
 			# Alternate way
 			varq = np.log(get_pressure()/rho**gamma)
 		elif vname is self.AdditionalVariables["InternalEnergy"].name:
-			varq = rhoE - 0.5*np.sum(mom*mom, axis=2, keepdims=True)/rho
+			varq = get_internal_energy()
 		elif vname is self.AdditionalVariables["TotalEnthalpy"].name:
 			varq = (rhoE + get_pressure())/rho
 		elif vname is self.AdditionalVariables["SoundSpeed"].name:
 			varq = np.sqrt(gamma*get_pressure()/rho)
 		elif vname is self.AdditionalVariables["MaxWaveSpeed"].name:
 			# |u| + c
-			varq = np.linalg.norm(mom, axis=2, keepdims=True)/rho + np.sqrt(
-					gamma*get_pressure()/rho)
+			mom2 = np.sum(mom*mom, axis=2, keepdims=True)
+			varq = np.sqrt(mom2)/rho + np.sqrt(gamma*get_pressure(mom2)/rho)
 		elif vname is self.AdditionalVariables["Velocity"].name:
 			varq = np.linalg.norm(mom, axis=2, keepdims=True)/rho 
 		elif vname is self.AdditionalVariables["XVelocity"].name:
@@ -244,18 +247,12 @@ class Euler1D(Euler):
 		Energy = "\\rho E"
 
 	def get_state_indices(self):
-		irho = self.get_state_index("Density")
-		irhou = self.get_state_index("XMomentum")
-		irhoE = self.get_state_index("Energy")
-
-		return irho, irhou, irhoE
+		# irho, irhou, irhoE
+		return self.state_index_tuple
 
 	def get_state_slices(self):
-		srho = self.get_state_slice("Density")
-		srhou = self.get_state_slice("XMomentum")
-		srhoE = self.get_state_slice("Energy")
-
-		return srho, srhou, srhoE
+		# srho, srhou, srhoE
+		return self.state_slice_tuple
 
 	def get_momentum_slice(self):
 		irhou = self.get_state_index("XMomentum")
@@ -276,16 +273,21 @@ class Euler1D(Euler):
 		# Get squared velocitiy
 		u2 = u**2
 
-		# Calculate pressure using the Ideal Gas Law
-		p = (self.gamma - 1.)*(rhoE - 0.5 * rho * u2) # [n, nq]
+		# Get rho*u^2
+		rhou2 = rho * u2
+
+		# Calculate pressure using the Ideal Gas Law (in place to avoid
+		# temporaries)
+		p = rhoE - 0.5 * rhou2
+		p *= self.gamma - 1. # [n, nq]
 		# Get total enthalpy
 		H = rhoE + p
 
-		# Assemble flux matrix
+		# Assemble flux matrix (products written directly into F)
 		F = np.empty(Uq.shape + (self.NDIMS,)) # [n, nq, ns, ndims]
-		F[:, :, irho, 0] = rhou         # Flux of mass
-		F[:, :, irhou, 0] = rho * u2 + p # Flux of momentum
-		F[:, :, irhoE, 0] = H * u        # Flux of energy
+		F[:, :, irho, 0] = rhou                       # Flux of mass
+		np.add(rhou2, p, out=F[:, :, irhou, 0])       # Flux of momentum
+		np.multiply(H, u, out=F[:, :, irhoE, 0])      # Flux of energy
 
 		return F, (u2, rho, p)
 
@@ -324,7 +326,7 @@ class Euler1D(Euler):
 		# Calculate pressure using the Ideal Gasd Law
 		p = (self.gamma - 1.)*(rhoE - 0.5 * rho * u2) # [n, nq]
 		# Get total specific enthalpy
-		H = rhoE/rho + p/rho
+		H = (rhoE + p)/rho
 
 		# Get sound speed
 		a = np.sqrt(self.gamma * p / rho)
@@ -413,12 +415,8 @@ class Euler2D(Euler):
 		Energy = "\\rho E"
 
 	def get_state_indices(self):
-		irho = self.get_state_index("Density")
-		irhou = self.get_state_index("XMomentum")
-		irhov = self.get_state_index("YMomentum")
-		irhoE = self.get_state_index("Energy")
-
-		return irho, irhou, irhov, irhoE
+		# irho, irhou, irhov, irhoE
+		return self.state_index_tuple
 
 	def get_momentum_slice(self):
 		irhou = self.get_state_index("XMomentum")
@@ -433,33 +431,32 @@ class Euler2D(Euler):
 		smom = self.get_momentum_slice()
 
 		rho  = Uq[:, :, irho]  # [n, nq]
-		rhou = Uq[:, :, irhou] # [n, nq]
-		rhov = Uq[:, :, irhov] # [n, nq]
 		rhoE = Uq[:, :, irhoE] # [n, nq]
 		mom  = Uq[:, :, smom]  # [n, nq, ndims]
 
 		# Get velocity in each dimension
-		u = rhou / rho
-		v = rhov / rho
+		vel = mom / rho[:, :, np.newaxis] # [n, nq, ndims]
+		u = vel[:, :, 0]
+		v = vel[:, :, 1]
 		# Get squared velocities
 		u2 = u**2
 		v2 = v**2
 
-		# Calculate pressure using the Ideal Gas Law
-		p = (self.gamma - 1.)*(rhoE - 0.5 * rho * (u2 + v2)) # [n, nq]
-		# Get off-diagonal momentum
-		rhouv = rho * u * v
+		# Calculate pressure using the Ideal Gas Law (in place to avoid
+		# temporaries)
+		p = rhoE - 0.5 * rho * (u2 + v2)
+		p *= self.gamma - 1. # [n, nq]
 		# Get total enthalpy
 		H = rhoE + p
 
 		# Assemble flux matrix
 		F = np.empty(Uq.shape + (self.NDIMS,)) # [n, nq, ns, ndims]
 		F[:,:,irho,  :] = mom          # Flux of mass in all directions
-		F[:,:,irhou, 0] = rho * u2 + p # x-flux of x-momentum
-		F[:,:,irhov, 0] = rhouv        # x-flux of y-momentum
-		F[:,:,irhou, 1] = rhouv        # y-flux of x-momentum
-		F[:,:,irhov, 1] = rho * v2 + p # y-flux of y-momentum
-		F[:,:,irhoE, 0] = H * u        # x-flux of energy
-		F[:,:,irhoE, 1] = H * v        # y-flux of energy
+		# Flux of momentum (rho u_i u_j + p delta_ij)
+		F[:,:,smom,  :] = mom[:, :, :, np.newaxis] * \
+				vel[:, :, np.newaxis, :]
+		F[:,:,irhou, 0] += p
+		F[:,:,irhov, 1] += p
+		F[:,:,irhoE, :] = H[:, :, np.newaxis] * vel # Flux of energy
 
 		return F, (u2, v2, rho, p)
@@ -133,28 +133,26 @@ class SmoothIsentropicFlow(FcnBase):
 
 		xr_elems = x[:,:,0]
 
-		Uq = np.zeros(xr_elems.shape + (physics.NUM_STATE_VARS,))
-
+		# Solve above nonlinear equations for x1 and x2. This is kept
+		# element by element so that each solve stays a small system.
+		x1 = np.empty_like(xr_elems)
+		x2 = np.empty_like(xr_elems)
 		for elem_ID in range(x.shape[0]):
 			xr = xr_elems[elem_ID,:]
-			# Solve above nonlinear equations for x1 and x2
-			x1 = fsolve(f1, 0.*xr, (xr, t, a))
-			if np.abs(x1.any()) > 1.: raise Exception("x1 = %g out of range" %
-					(x1))
-			x2 = fsolve(f2, 0.*xr, (xr, t, a))
-			if np.abs(x2.any()) > 1.: raise Exception("x2 = %g out of range" %
-					(x2))
-
-			# State
-			den = rho(x1, x2, a)
-			u = vel(x1, x2, a)
-			p = pressure(den, gamma)
-			rhoE = p/(gamma - 1.) + 0.5*den*u*u
-
-			# Store
-			Uq[elem_ID, :, irho] = den
-			Uq[elem_ID, :, irhou] = den*u
-			Uq[elem_ID, :, irhoE] = rhoE
+			x1[elem_ID] = fsolve(f1, 0.*xr, (xr, t, a))
+			x2[elem_ID] = fsolve(f2, 0.*xr, (xr, t, a))
+
+		# State, evaluated for all elements at once
+		den = rho(x1, x2, a)
+		u = vel(x1, x2, a)
+		p = pressure(den, gamma)
+		rhoE = p/(gamma - 1.) + 0.5*den*u*u
+
+		# Store
+		Uq = np.empty(xr_elems.shape + (physics.NUM_STATE_VARS,))
+		Uq[:, :, irho] = den
+		Uq[:, :, irhou] = den*u
+		Uq[:, :, irhoE] = rhoE
 
 		return Uq # [ne, nq, ns]
 
@@ -218,18 +216,14 @@ class MovingShock(FcnBase):
 		''' Fill state '''
 		Uq = np.zeros([x.shape[0], x.shape[1], physics.NUM_STATE_VARS])
 
-		for elem_ID in range(Uq.shape[0]):
-			ileft = (x[elem_ID] <= xshock).reshape(-1)
-			iright = (x[elem_ID] > xshock).reshape(-1)
-			# Density
-			Uq[elem_ID, iright, srho] = rho1
-			Uq[elem_ID, ileft, srho] = rho2
-			# Momentum
-			Uq[elem_ID, iright, srhou] = rho1*u1
-			Uq[elem_ID, ileft, srhou] = rho2*u2
-			# Energy
-			Uq[elem_ID, iright, srhoE] = p1/(gamma - 1.) + 0.5*rho1*u1*u1
-			Uq[elem_ID, ileft, srhoE] = p2/(gamma - 1.) + 0.5*rho2*u2*u2
+		ileft = x <= xshock # [ne, nq, 1]
+		# Density
+		Uq[:, :, srho] = np.where(ileft, rho2, rho1)
+		# Momentum
+		Uq[:, :, srhou] = np.where(ileft, rho2*u2, rho1*u1)
+		# Energy
+		Uq[:, :, srhoE] = np.where(ileft, p2/(gamma - 1.) + 0.5*rho2*u2*u2,
+				p1/(gamma - 1.) + 0.5*rho1*u1*u1)
 
 		return Uq # [ne, nq, ns]
 
@@ -306,14 +300,17 @@ class IsentropicVortex(FcnBase):
 		# Track center of vortex
 		xr = x[:, :, 0] - ub*t
 		yr = x[:, :, 1] - vb*t
-		r = np.sqrt(xr**2. + yr**2.)
+		r2 = xr*xr + yr*yr
+
+		# Shared Gaussian factor (exp(1 - r^2) is its square)
+		exp_half = np.exp(0.5*(1. - r2))
 
 		# Perturbations
-		dU = vs/(2.*np.pi)*np.exp(0.5*(1-r**2.))
+		dU = vs/(2.*np.pi)*exp_half
 		du = dU*-yr
 		dv = dU*xr
 
-		dT = -(gamma - 1.)*vs**2./(8.*gamma*np.pi**2.)*np.exp(1. - r**2.)
+		dT = -(gamma - 1.)*vs**2./(8.*gamma*np.pi**2.)*(exp_half*exp_half)
 
 		u = ub + du
 		v = vb + dv
@@ -488,31 +485,23 @@ class RiemannProblem(FcnBase):
 		# Location of contact
 		xc = u2*t + xd
 
-		u = np.zeros_like(x); p = np.zeros_like(x); rho = np.zeros_like(x);
-
-		for i in range(x.shape[0]):
-			for j in range(x.shape[1]):
-				if x[i,j] <= xe1:
-					# Left of expansion fan (region 4)
-					u[i,j] = u4; p[i,j] = p4; rho[i,j] = rho4
-				elif x[i,j] > xe1 and x[i,j] <= xe2:
-					# Expansion fan
-					u[i,j] = (2/(gamma+1)*((x[i,j]-xd)/t
-							+ (gamma-1)/2*u4 + c4))
-					c = u[i,j] - (x[i,j]-xd)/t
-					p[i,j] = p4*(c/c4)**(2*gamma/(gamma-1))
-					rho[i,j] = gamma*p[i,j]/c**2
-				elif x[i,j] > xe2 and x[i,j] <= xc:
-					# Between expansion fan and and contact discontinuity
-					# (region 3)
-					u[i,j] = u3; p[i,j] = p3; rho[i,j] = rho3
-				elif x[i,j] > xc and x[i,j] <= xs:
-					# Between the contact discontinuity and the shock
-					# (region 2)
-					u[i,j] = u2; p[i,j] = p2; rho[i,j] = rho2
-				else:
-					# Right of the shock (region 1)
-					u[i,j] = u1; p[i,j] = p1; rho[i,j] = rho1
+		# Region in which each point lies, from left to right: region 4,
+		# expansion fan, region 3 (up to the contact discontinuity),
+		# region 2 (up to the shock), region 1
+		conds = [x <= xe1, x <= xe2, x <= xc, x <= xs]
+		u = np.select(conds, [u4, 0., u3, u2], u1)
+		p = np.select(conds, [p4, 0., p3, p2], p1)
+		rho = np.select(conds, [rho4, 0., rho3, rho2], rho1)
+
+		# Expansion fan (evaluated only where needed, since t may be 0)
+		ifan = ~conds[0] & conds[1]
+		xfan = x[ifan]
+		ufan = (2/(gamma+1)*((xfan-xd)/t + (gamma-1)/2*u4 + c4))
+		c = ufan - (xfan-xd)/t
+		pfan = p4*(c/c4)**(2*gamma/(gamma-1))
+		u[ifan] = ufan
+		p[ifan] = pfan
+		rho[ifan] = gamma*pfan/c**2
 
 		Uq = np.zeros([x.shape[0], x.shape[1], physics.NUM_STATE_VARS])
 		Uq[:, :, srho] = rho
@@ -608,19 +597,14 @@ class ShuOsherProblem(FcnBase):
 		''' Fill state '''
 		Uq = np.zeros([x.shape[0], x.shape[1], physics.NUM_STATE_VARS])
 
-		for elem_ID in range(Uq.shape[0]):
-			ileft = (x[elem_ID] < xshock).reshape(-1)
-			iright = (x[elem_ID] >= xshock).reshape(-1)
-			rhoR = rho_sin[elem_ID, iright]
-			# Density
-			Uq[elem_ID, iright, srho] = rhoR
-			Uq[elem_ID, ileft, srho] = rhoL
-			# Momentum
-			Uq[elem_ID, iright, srhou] = rhoR*uR
-			Uq[elem_ID, ileft, srhou] = rhoL*uL
-			# Energy
-			Uq[elem_ID, iright, srhoE] = pR/(gamma - 1.) + 0.5*rhoR*uR*uR
-			Uq[elem_ID, ileft, srhoE] = pL/(gamma - 1.) + 0.5*rhoL*uL*uL
+		ileft = x < xshock # [ne, nq, 1]
+		# Density
+		Uq[:, :, srho] = np.where(ileft, rhoL, rho_sin)
+		# Momentum
+		Uq[:, :, srhou] = np.where(ileft, rhoL*uL, rho_sin*uR)
+		# Energy
+		Uq[:, :, srhoE] = np.where(ileft, pL/(gamma - 1.) + 0.5*rhoL*uL*uL,
+				pR/(gamma - 1.) + 0.5*rho_sin*uR*uR)
 
 		return Uq # [ne, nq, ns]
 
@@ -652,21 +636,16 @@ class GravityRiemann(FcnBase):
 		uR = 1.
 		pR = .2
 
-		for elem_ID in range(Uq.shape[0]):
-			ileft = (x[elem_ID, :, 0] <= 1.).reshape(-1)
-			iright = (x[elem_ID, :, 0] > 1.).reshape(-1)
-			# Density
-			Uq[elem_ID, ileft, irho] = rhoL
-			Uq[elem_ID, iright, irho] = rhoR
-			# XMomentum
-			Uq[elem_ID, ileft, irhou] = rhoL*uL
-			Uq[elem_ID, iright, irhou] = rhoR*uR
-			# YMomentum
-			Uq[elem_ID, ileft, irhov] = 0.
-			Uq[elem_ID, iright, irhov] = 0.
-			# Energy
-			Uq[elem_ID, ileft, irhoE] = pL/(gamma - 1.) + 0.5*rhoL*uL*uL
-			Uq[elem_ID, iright, irhoE] = pR/(gamma - 1.) + 0.5*rhoR*uR*uR
+		ileft = x[:, :, 0] <= 1. # [ne, nq]
+		# Density
+		Uq[:, :, irho] = np.where(ileft, rhoL, rhoR)
+		# XMomentum
+		Uq[:, :, irhou] = np.where(ileft, rhoL*uL, rhoR*uR)
+		# YMomentum
+		Uq[:, :, irhov] = 0.
+		# Energy
+		Uq[:, :, irhoE] = np.where(ileft, pL/(gamma - 1.) + 0.5*rhoL*uL*uL,
+				pR/(gamma - 1.) + 0.5*rhoR*uR*uR)
 
 		return Uq # [ne, nq, ns]
 
@@ -690,8 +669,9 @@ class SlipWall(BCWeakPrescribed):
 	def get_boundary_state(self, physics, UqI, normals, x, t):
 		smom = physics.get_momentum_slice()
 
-		# Unit normals
-		n_hat = normals/np.linalg.norm(normals, axis=2, keepdims=True)
+		# Unit normals (one reciprocal square root per face point)
+		inv_n_mag = 1./np.sqrt(np.einsum('ijk, ijk -> ij', normals, normals))
+		n_hat = normals*inv_n_mag[:, :, np.newaxis]
 
 		# Remove momentum contribution in normal direction from boundary
 		# state
@@ -739,8 +719,9 @@ class PressureOutlet(BCWeakPrescribed):
 
 		UqB = UqI.copy()
 
-		# Unit normals
-		n_hat = normals/np.linalg.norm(normals, axis=2, keepdims=True)
+		# Unit normals (one reciprocal square root per face point)
+		inv_n_mag = 1./np.sqrt(np.einsum('ijk, ijk -> ij', normals, normals))
+		n_hat = normals*inv_n_mag[:, :, np.newaxis]
 
 		# Interior velocity in normal direction
 		rhoI = UqI[:, :, srho]
@@ -931,6 +912,8 @@ class LaxFriedrichs1D(ConvNumFluxBase):
 	the Lax-Friedrichs flux found in base.
 	'''
 	def compute_flux(self, physics, UqL, UqR, normals):
+		gamma = physics.gamma
+
 		# Normalize the normal vectors
 		n_mag = np.linalg.norm(normals, axis=2, keepdims=True)
 		n_hat = normals/n_mag
@@ -945,15 +928,12 @@ class LaxFriedrichs1D(ConvNumFluxBase):
 		dUq = UqR - UqL
 
 		# Max wave speeds at each point
-		aL = np.empty(pL.shape + (1,))
-		aR = np.empty(pR.shape + (1,))
-		aL[:, :, 0] = np.sqrt(u2L) + np.sqrt(physics.gamma * pL / rhoL)
-		aR[:, :, 0] = np.sqrt(u2R) + np.sqrt(physics.gamma * pR / rhoR)
-		idx = aR > aL
-		aL[idx] = aR[idx]
+		aL = np.sqrt(u2L) + np.sqrt(gamma * pL / rhoL)
+		aR = np.sqrt(u2R) + np.sqrt(gamma * pR / rhoR)
+		a = np.maximum(aL, aR)[:, :, np.newaxis] # [nf, nq, 1]
 
 		# Put together
-		return 0.5 * n_mag * (FqL + FqR - aL*dUq)
+		return 0.5 * n_mag * (FqL + FqR - a*dUq)
 
 
 class LaxFriedrichs2D(ConvNumFluxBase):
@@ -963,6 +943,8 @@ class LaxFriedrichs2D(ConvNumFluxBase):
 	the Lax-Friedrichs flux found in base.
 	'''
 	def compute_flux(self, physics, UqL, UqR, normals):
+		gamma = physics.gamma
+
 		# Normalize the normal vectors
 		n_mag = np.linalg.norm(normals, axis=2, keepdims=True)
 		n_hat = normals/n_mag
@@ -979,15 +961,12 @@ class LaxFriedrichs2D(ConvNumFluxBase):
 		dUq = UqR - UqL
 
 		# Max wave speeds at each point
-		aL = np.empty(pL.shape + (1,))
-		aR = np.empty(pR.shape + (1,))
-		aL[:, :, 0] = np.sqrt(u2L + v2L) + np.sqrt(physics.gamma * pL / rhoL)
-		aR[:, :, 0] = np.sqrt(u2R + v2R) + np.sqrt(physics.gamma * pR / rhoR)
-		idx = aR > aL
-		aL[idx] = aR[idx]
+		aL = np.sqrt(u2L + v2L) + np.sqrt(gamma * pL / rhoL)
+		aR = np.sqrt(u2R + v2R) + np.sqrt(gamma * pR / rhoR)
+		a = np.maximum(aL, aR)[:, :, np.newaxis] # [nf, nq, 1]
 
 		# Put together
-		return 0.5 * n_mag * (FqL + FqR - aL*dUq)
+		return 0.5 * n_mag * (FqL + FqR - a*dUq)
 
 
 class Roe1D(ConvNumFluxBase):
@@ -1112,8 +1091,11 @@ class Roe1D(ConvNumFluxBase):
 		HL = physics.compute_variable("TotalEnthalpy", UqL)
 		HR = physics.compute_variable("TotalEnthalpy", UqR)
 
-		velRoe = (rhoL_sqrt*velL + rhoR_sqrt*velR)/(rhoL_sqrt+rhoR_sqrt)
-		HRoe = (rhoL_sqrt*HL + rhoR_sqrt*HR)/(rhoL_sqrt+rhoR_sqrt)
+		# Shared normalization of the sqrt(rho) weights
+		inv_rho_sqrt_sum = 1./(rhoL_sqrt + rhoR_sqrt)
+
+		velRoe = (rhoL_sqrt*velL + rhoR_sqrt*velR)*inv_rho_sqrt_sum
+		HRoe = (rhoL_sqrt*HL + rhoR_sqrt*HR)*inv_rho_sqrt_sum
 		rhoRoe = rhoL_sqrt*rhoR_sqrt
 
 		return rhoRoe, velRoe, HRoe
@@ -214,243 +214,253 @@ class ManufacturedSource(SourceBase):
 	def manufactured_source(self, x1, x2, t, gamma, kappa, mu, R):
 	
 		
+		# Trigonometric terms shared by the generated expressions below
+		sin_x1 = np.sin(np.pi*x1)
+		cos_x1 = np.cos(np.pi*x1)
+		sin_x2 = np.sin(np.pi*x2)
+		cos_x2 = np.cos(np.pi*x2)
+		sin_2x1 = np.sin(2*np.pi*x1)
+		cos_2x1 = np.cos(2*np.pi*x1)
+		sin_3x1 = np.sin(3*np.pi*x1)
+		cos_3x1 = np.cos(3*np.pi*x1)
+
 		# The following lines of code are generated using sympy
-		S_rho = (-0.3*np.pi*np.sin(np.pi*x1)*np.cos(np.pi*x2) + \
-			0.9*np.pi*np.cos(3*np.pi*x1))*(0.1*np.sin(np.pi*x1) \
-			+ 0.1*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0) + (-0.1*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) + 0.1*np.pi* \
-			np.cos(np.pi*x1))*(0.3*np.sin(3*np.pi*x1) + \
-			0.3*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x2) + 2.0) + (-0.3*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.3*np.pi* \
-			np.cos(np.pi*x2))*(0.1*np.sin(np.pi*x1) + 0.1* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0) + (-0.1*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.2*np.pi* \
-			np.sin(np.pi*x2))*(0.3*np.sin(np.pi*x2) + \
-			0.3*np.cos(np.pi*x1)*np.cos(np.pi*x2) + \
-			0.3*np.cos(np.pi*x1) + 2.0)
-
-		S_rhou = -mu*(-0.2*np.pi**2*np.sin(np.pi*x1)* \
-			np.sin(np.pi*x2) - 3.6*np.pi**2*np.sin(3*np.pi*x1) \
-			 - 0.4*np.pi**2*np.cos(np.pi*x1)*np.cos(np.pi*x2)) \
-			- mu*(0.3*np.pi**2*np.sin(np.pi*x1)*np.sin(np.pi*x2) \
-			- 0.3*np.pi**2*np.cos(np.pi*x1)*np.cos(np.pi*x2) - \
-			0.3*np.pi**2*np.cos(np.pi*x2)) + 4.0*(-0.3*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) + 0.9*np.pi* \
-			np.cos(3*np.pi*x1))*(0.1*np.sin(np.pi*x1) + \
-			0.1*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0)*(0.15*np.sin(3*np.pi*x1) \
-			+ 0.15*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x2) + 1) + 4.0*(-0.1*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) + 0.1*np.pi* \
-			np.cos(np.pi*x1))*(0.15*np.sin(3*np.pi*x1) + 0.15* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x2) + 1)**2 + (-0.3*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) - 0.3* \
-			np.pi*np.sin(np.pi*x2))*(0.1*np.sin(np.pi*x1) + \
-			0.1*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0)*(0.3*np.sin(np.pi*x2) + \
-			0.3*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x1) + 2.0) + (-0.3*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.3*np.pi* \
-			np.cos(np.pi*x2))*(0.1*np.sin(np.pi*x1) + 0.1* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0)*(0.3*np.sin(3*np.pi*x1) \
-			+ 0.3*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x2) + 2.0) + (-0.1*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.2*np.pi* \
-			np.sin(np.pi*x2))*(0.3*np.sin(3*np.pi*x1) + 0.3* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x2) + 2.0)*(0.3*np.sin(np.pi*x2) + \
-			0.3*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x1) + 2.0) - 0.5*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) - \
-			2.0*np.pi*np.sin(2*np.pi*x1)
-
-		S_rhov = -mu*(-0.2*np.pi**2*np.sin(np.pi*x1)* \
-			np.sin(np.pi*x2) - 0.4*np.pi**2*np.sin(np.pi*x2) \
-			- 0.4*np.pi**2*np.cos(np.pi*x1)*np.cos(np.pi*x2)) \
-			 - mu*(0.3*np.pi**2*np.sin(np.pi*x1)* \
-		 	np.sin(np.pi*x2) - 0.3*np.pi**2* \
-		 	np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.3*np.pi**2* \
-		 	np.cos(np.pi*x1)) + (-0.3*np.pi*np.sin(np.pi*x1)* \
-		 	np.cos(np.pi*x2) - 0.3*np.pi*np.sin(np.pi*x1))* \
-		 	(0.1*np.sin(np.pi*x1) + 0.1*np.cos(np.pi*x1)* \
-	 		np.cos(np.pi*x2) - 0.2*np.cos(np.pi*x2) + 1.0)* \
-	 		(0.3*np.sin(3*np.pi*x1) + 0.3*np.cos(np.pi*x1)* \
- 			np.cos(np.pi*x2) + 0.3*np.cos(np.pi*x2) + 2.0) + \
- 			(-0.3*np.pi*np.sin(np.pi*x1)*np.cos(np.pi*x2) + \
-			0.9*np.pi*np.cos(3*np.pi*x1))*(0.1*np.sin(np.pi*x1) \
-			+ 0.1*np.cos(np.pi*x1)*np.cos(np.pi*x2) - \
-			0.2*np.cos(np.pi*x2) + 1.0)*(0.3*np.sin(np.pi*x2) + \
-			0.3*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x1) + 2.0) + (-0.1*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) + 0.1*np.pi* \
-			np.cos(np.pi*x1))*(0.3*np.sin(3*np.pi*x1) + 0.3* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x2) + 2.0)*(0.3*np.sin(np.pi*x2) + 0.3 \
-			*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x1) + 2.0) + 4.0*(-0.3*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.3*np.pi* \
-			np.cos(np.pi*x2))*(0.1*np.sin(np.pi*x1) + 0.1* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0)*(0.15*np.sin(np.pi*x2) + \
-			0.15*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x1) + 1) + 4.0*(-0.1*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.2*np.pi* \
-			np.sin(np.pi*x2))*(0.15*np.sin(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x1) + 1)**2 - 0.5*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + \
-			1.0*np.pi*np.cos(np.pi*x2)
-
-		S_rhoE = -mu*(-0.3*np.pi*np.sin(np.pi*x1)* \
-			np.cos(np.pi*x2) - 0.3*np.pi*np.sin(np.pi*x1)) \
-			*(-0.3*np.pi*np.sin(np.pi*x1)*np.cos(np.pi*x2) \
-			- 0.3*np.pi*np.sin(np.pi*x1) - 0.3*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) - 0.3*np.pi* \
-			np.sin(np.pi*x2)) - mu*(-0.3*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) + 0.9*np.pi* \
-			np.cos(3*np.pi*x1))*(-0.4*np.pi*np.sin(np.pi*x1)* \
-			np.cos(np.pi*x2) + 0.2*np.pi*np.sin(np.pi*x2)* \
-			np.cos(np.pi*x1) + 1.2*np.pi*np.cos(3*np.pi*x1) - \
-			0.2*np.pi*np.cos(np.pi*x2)) - mu*(-0.3*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) - 0.3*np.pi* \
-			np.sin(np.pi*x2))*(-0.3*np.pi*np.sin(np.pi*x1)* \
-			np.cos(np.pi*x2) - 0.3*np.pi*np.sin(np.pi*x1) - \
-			0.3*np.pi*np.sin(np.pi*x2)*np.cos(np.pi*x1) - 0.3* \
-			np.pi*np.sin(np.pi*x2)) - mu*(-0.3*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.3*np.pi* \
-			np.cos(np.pi*x2))*(0.2*np.pi*np.sin(np.pi*x1)* \
-			np.cos(np.pi*x2) - 0.4*np.pi*np.sin(np.pi*x2)* \
-			np.cos(np.pi*x1) - 0.6*np.pi*np.cos(3*np.pi*x1) \
-			+ 0.4*np.pi*np.cos(np.pi*x2)) - mu*(-0.2*np.pi**2* \
-			np.sin(np.pi*x1)*np.sin(np.pi*x2) - 3.6*np.pi**2* \
-			np.sin(3*np.pi*x1) - 0.4*np.pi**2*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2))*(0.3*np.sin(3*np.pi*x1) + 0.3* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x2) + 2.0) - mu*(-0.2*np.pi**2* \
-			np.sin(np.pi*x1)*np.sin(np.pi*x2) - 0.4*np.pi**2* \
-			np.sin(np.pi*x2) - 0.4*np.pi**2*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2))*(0.3*np.sin(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x1) + 2.0) - mu*(0.3*np.pi**2* \
-			np.sin(np.pi*x1)*np.sin(np.pi*x2) - 0.3*np.pi**2* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.3*np.pi**2* \
-			np.cos(np.pi*x1))*(0.3*np.sin(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x1) + 2.0) - mu*(0.3*np.pi**2* \
-			np.sin(np.pi*x1)*np.sin(np.pi*x2) - 0.3*np.pi**2* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.3*np.pi**2* \
-			np.cos(np.pi*x2))*(0.3*np.sin(3*np.pi*x1) + 0.3* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x2) + 2.0) + (-0.3*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) + 0.9*np.pi* \
-			np.cos(3*np.pi*x1))*((4.0*(0.15* \
-			np.sin(3*np.pi*x1) + 0.15*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 0.15*np.cos(np.pi*x2) + 1)**2 \
-			+ 4.0*(0.15*np.sin(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x1) + 1)**2)*(0.05*np.sin(np.pi*x1) \
-			+ 0.05*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.1* \
-			np.cos(np.pi*x2) + 0.5) + 1.0*np.sin(np.pi*x2) + \
-			0.5*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 1.0* \
-			np.cos(2*np.pi*x1) + 10.0 + (1.0*np.sin(np.pi*x2) \
-			+ 0.5*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 1.0* \
-			np.cos(2*np.pi*x1) + 10.0)/(gamma - 1)) + (-0.3* \
-			np.pi*np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.3*np.pi* \
-			np.cos(np.pi*x2))*((4.0*(0.15*np.sin(3*np.pi*x1) + \
-			0.15*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x2) + 1)**2 + 4.0*(0.15* \
-			np.sin(np.pi*x2) + 0.15*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 0.15*np.cos(np.pi*x1) + 1)**2) \
-			*(0.05*np.sin(np.pi*x1) + 0.05*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) - 0.1*np.cos(np.pi*x2) + 0.5) + 1.0 \
-			*np.sin(np.pi*x2) + 0.5*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 1.0*np.cos(2*np.pi*x1) + 10.0 \
-			+ (1.0*np.sin(np.pi*x2) + 0.5*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 1.0*np.cos(2*np.pi*x1) + 10.0) \
-			/(gamma - 1)) + (0.3*np.sin(3*np.pi*x1) + 0.3* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.3* \
-			np.cos(np.pi*x2) + 2.0)*((4.0*(-0.3*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) - 0.3*np.pi* \
-			np.sin(np.pi*x1))*(0.15*np.sin(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x1) + 1) + 4.0*(-0.3*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) + 0.9* \
-			np.pi*np.cos(3*np.pi*x1))*(0.15*np.sin(3*np.pi*x1) \
-			+ 0.15*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x2) + 1))*(0.05*np.sin(np.pi*x1) + \
-			0.05*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.1* \
-			np.cos(np.pi*x2) + 0.5) + (-0.05*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) + 0.05*np.pi* \
-			np.cos(np.pi*x1))*(4.0*(0.15*np.sin(3*np.pi*x1) + \
-			0.15*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x2) + 1)**2 + 4.0*(0.15* \
-			np.sin(np.pi*x2) + 0.15*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 0.15*np.cos(np.pi*x1) + 1)**2) \
-			- 0.5*np.pi*np.sin(np.pi*x1)*np.cos(np.pi*x2) - \
-			2.0*np.pi*np.sin(2*np.pi*x1) + (-0.5*np.pi* \
-			np.sin(np.pi*x1)*np.cos(np.pi*x2) - 2.0*np.pi* \
-			np.sin(2*np.pi*x1))/(gamma - 1)) + (0.3* \
-			np.sin(np.pi*x2) + 0.3*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 0.3*np.cos(np.pi*x1) + \
-			2.0)*((4.0*(-0.3*np.pi*np.sin(np.pi*x2)* \
-			np.cos(np.pi*x1) - 0.3*np.pi*np.sin(np.pi*x2))* \
-			(0.15*np.sin(3*np.pi*x1) + 0.15*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 0.15*np.cos(np.pi*x2) + 1) + \
-			4.0*(-0.3*np.pi*np.sin(np.pi*x2)*np.cos(np.pi*x1) \
-			+ 0.3*np.pi*np.cos(np.pi*x2))*(0.15*np.sin(np.pi*x2) \
-			+ 0.15*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x1) + 1))*(0.05*np.sin(np.pi*x1) + \
-			0.05*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.1* \
-			np.cos(np.pi*x2) + 0.5) + (-0.05*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 0.1*np.pi* \
-			np.sin(np.pi*x2))*(4.0*(0.15*np.sin(3*np.pi*x1) + \
-			0.15*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 0.15* \
-			np.cos(np.pi*x2) + 1)**2 + 4.0*(0.15* \
-			np.sin(np.pi*x2) + 0.15*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 0.15*np.cos(np.pi*x1) + 1)**2) \
-			- 0.5*np.pi*np.sin(np.pi*x2)*np.cos(np.pi*x1) + \
-			1.0*np.pi*np.cos(np.pi*x2) + (-0.5*np.pi* \
-			np.sin(np.pi*x2)*np.cos(np.pi*x1) + 1.0*np.pi* \
-			np.cos(np.pi*x2))/(gamma - 1)) - np.pi**2*kappa* \
-			(-0.2*(0.5*np.sin(np.pi*x1)*np.cos(np.pi*x2) + 2.0* \
-			np.sin(2*np.pi*x1))*(np.sin(np.pi*x1)* \
-			np.cos(np.pi*x2) - np.cos(np.pi*x1))/(0.1* \
-			np.sin(np.pi*x1) + 0.1*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) - 0.2*np.cos(np.pi*x2) + 1.0) \
-			+ (0.02*(np.sin(np.pi*x1)*np.cos(np.pi*x2) - \
-			np.cos(np.pi*x1))**2/(0.1*np.sin(np.pi*x1) + 0.1 \
-			*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0) + 0.1*np.sin(np.pi*x1) + \
-			0.1*np.cos(np.pi*x1)*np.cos(np.pi*x2))*(1.0* \
-			np.sin(np.pi*x2) + 0.5*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) + 1.0*np.cos(2*np.pi*x1) + 10.0) \
-			/(0.1*np.sin(np.pi*x1) + 0.1*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) - 0.2*np.cos(np.pi*x2) + 1.0) - \
-			0.5*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 4.0* \
-			np.cos(2*np.pi*x1))/(R*(0.1*np.sin(np.pi*x1) + \
-			0.1*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0)) - np.pi**2*kappa*(-2* \
-			(0.5*np.sin(np.pi*x2)*np.cos(np.pi*x1) - 1.0* \
-			np.cos(np.pi*x2))*(0.1*np.cos(np.pi*x1) - 0.2)* \
-			np.sin(np.pi*x2)/(0.1*np.sin(np.pi*x1) + 0.1* \
-			np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0) + ((0.2*np.cos(np.pi*x1) \
-			- 0.4)*np.sin(np.pi*x2)**2/(0.1*np.sin(np.pi*x1) \
-			+ 0.1*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0) + np.cos(np.pi*x2))*(0.1* \
-			np.cos(np.pi*x1) - 0.2)*(1.0*np.sin(np.pi*x2) + 0.5 \
-			*np.cos(np.pi*x1)*np.cos(np.pi*x2) + 1.0* \
-			np.cos(2*np.pi*x1) + 10.0)/(0.1*np.sin(np.pi*x1) \
-			+ 0.1*np.cos(np.pi*x1)*np.cos(np.pi*x2) - 0.2* \
-			np.cos(np.pi*x2) + 1.0) - 1.0*np.sin(np.pi*x2) - \
-			0.5*np.cos(np.pi*x1)*np.cos(np.pi*x2))/(R*(0.1* \
-			np.sin(np.pi*x1) + 0.1*np.cos(np.pi*x1)* \
-			np.cos(np.pi*x2) - 0.2*np.cos(np.pi*x2) + 1.0))
+		S_rho = (-0.3*np.pi*sin_x1*cos_x2 + \
+			0.9*np.pi*cos_3x1)*(0.1*sin_x1 \
+			+ 0.1*cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0) + (-0.1*np.pi* \
+			sin_x1*cos_x2 + 0.1*np.pi* \
+			cos_x1)*(0.3*sin_3x1 + \
+			0.3*cos_x1*cos_x2 + 0.3* \
+			cos_x2 + 2.0) + (-0.3*np.pi* \
+			sin_x2*cos_x1 + 0.3*np.pi* \
+			cos_x2)*(0.1*sin_x1 + 0.1* \
+			cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0) + (-0.1*np.pi* \
+			sin_x2*cos_x1 + 0.2*np.pi* \
+			sin_x2)*(0.3*sin_x2 + \
+			0.3*cos_x1*cos_x2 + \
+			0.3*cos_x1 + 2.0)
+
+		S_rhou = -mu*(-0.2*np.pi**2*sin_x1* \
+			sin_x2 - 3.6*np.pi**2*sin_3x1 \
+			 - 0.4*np.pi**2*cos_x1*cos_x2) \
+			- mu*(0.3*np.pi**2*sin_x1*sin_x2 \
+			- 0.3*np.pi**2*cos_x1*cos_x2 - \
+			0.3*np.pi**2*cos_x2) + 4.0*(-0.3*np.pi* \
+			sin_x1*cos_x2 + 0.9*np.pi* \
+			cos_3x1)*(0.1*sin_x1 + \
+			0.1*cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0)*(0.15*sin_3x1 \
+			+ 0.15*cos_x1*cos_x2 + 0.15* \
+			cos_x2 + 1) + 4.0*(-0.1*np.pi* \
+			sin_x1*cos_x2 + 0.1*np.pi* \
+			cos_x1)*(0.15*sin_3x1 + 0.15* \
+			cos_x1*cos_x2 + 0.15* \
+			cos_x2 + 1)**2 + (-0.3*np.pi* \
+			sin_x2*cos_x1 - 0.3* \
+			np.pi*sin_x2)*(0.1*sin_x1 + \
+			0.1*cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0)*(0.3*sin_x2 + \
+			0.3*cos_x1*cos_x2 + 0.3* \
+			cos_x1 + 2.0) + (-0.3*np.pi* \
+			sin_x2*cos_x1 + 0.3*np.pi* \
+			cos_x2)*(0.1*sin_x1 + 0.1* \
+			cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0)*(0.3*sin_3x1 \
+			+ 0.3*cos_x1*cos_x2 + 0.3* \
+			cos_x2 + 2.0) + (-0.1*np.pi* \
+			sin_x2*cos_x1 + 0.2*np.pi* \
+			sin_x2)*(0.3*sin_3x1 + 0.3* \
+			cos_x1*cos_x2 + 0.3* \
+			cos_x2 + 2.0)*(0.3*sin_x2 + \
+			0.3*cos_x1*cos_x2 + 0.3* \
+			cos_x1 + 2.0) - 0.5*np.pi* \
+			sin_x1*cos_x2 - \
+			2.0*np.pi*sin_2x1
+
+		S_rhov = -mu*(-0.2*np.pi**2*sin_x1* \
+			sin_x2 - 0.4*np.pi**2*sin_x2 \
+			- 0.4*np.pi**2*cos_x1*cos_x2) \
+			 - mu*(0.3*np.pi**2*sin_x1* \
+		 	sin_x2 - 0.3*np.pi**2* \
+		 	cos_x1*cos_x2 - 0.3*np.pi**2* \
+		 	cos_x1) + (-0.3*np.pi*sin_x1* \
+		 	cos_x2 - 0.3*np.pi*sin_x1)* \
+		 	(0.1*sin_x1 + 0.1*cos_x1* \
+	 		cos_x2 - 0.2*cos_x2 + 1.0)* \
+	 		(0.3*sin_3x1 + 0.3*cos_x1* \
+ 			cos_x2 + 0.3*cos_x2 + 2.0) + \
+ 			(-0.3*np.pi*sin_x1*cos_x2 + \
+			0.9*np.pi*cos_3x1)*(0.1*sin_x1 \
+			+ 0.1*cos_x1*cos_x2 - \
+			0.2*cos_x2 + 1.0)*(0.3*sin_x2 + \
+			0.3*cos_x1*cos_x2 + 0.3* \
+			cos_x1 + 2.0) + (-0.1*np.pi* \
+			sin_x1*cos_x2 + 0.1*np.pi* \
+			cos_x1)*(0.3*sin_3x1 + 0.3* \
+			cos_x1*cos_x2 + 0.3* \
+			cos_x2 + 2.0)*(0.3*sin_x2 + 0.3 \
+			*cos_x1*cos_x2 + 0.3* \
+			cos_x1 + 2.0) + 4.0*(-0.3*np.pi* \
+			sin_x2*cos_x1 + 0.3*np.pi* \
+			cos_x2)*(0.1*sin_x1 + 0.1* \
+			cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0)*(0.15*sin_x2 + \
+			0.15*cos_x1*cos_x2 + 0.15* \
+			cos_x1 + 1) + 4.0*(-0.1*np.pi* \
+			sin_x2*cos_x1 + 0.2*np.pi* \
+			sin_x2)*(0.15*sin_x2 + 0.15* \
+			cos_x1*cos_x2 + 0.15* \
+			cos_x1 + 1)**2 - 0.5*np.pi* \
+			sin_x2*cos_x1 + \
+			1.0*np.pi*cos_x2
+
+		S_rhoE = -mu*(-0.3*np.pi*sin_x1* \
+			cos_x2 - 0.3*np.pi*sin_x1) \
+			*(-0.3*np.pi*sin_x1*cos_x2 \
+			- 0.3*np.pi*sin_x1 - 0.3*np.pi* \
+			sin_x2*cos_x1 - 0.3*np.pi* \
+			sin_x2) - mu*(-0.3*np.pi* \
+			sin_x1*cos_x2 + 0.9*np.pi* \
+			cos_3x1)*(-0.4*np.pi*sin_x1* \
+			cos_x2 + 0.2*np.pi*sin_x2* \
+			cos_x1 + 1.2*np.pi*cos_3x1 - \
+			0.2*np.pi*cos_x2) - mu*(-0.3*np.pi* \
+			sin_x2*cos_x1 - 0.3*np.pi* \
+			sin_x2)*(-0.3*np.pi*sin_x1* \
+			cos_x2 - 0.3*np.pi*sin_x1 - \
+			0.3*np.pi*sin_x2*cos_x1 - 0.3* \
+			np.pi*sin_x2) - mu*(-0.3*np.pi* \
+			sin_x2*cos_x1 + 0.3*np.pi* \
+			cos_x2)*(0.2*np.pi*sin_x1* \
+			cos_x2 - 0.4*np.pi*sin_x2* \
+			cos_x1 - 0.6*np.pi*cos_3x1 \
+			+ 0.4*np.pi*cos_x2) - mu*(-0.2*np.pi**2* \
+			sin_x1*sin_x2 - 3.6*np.pi**2* \
+			sin_3x1 - 0.4*np.pi**2*cos_x1* \
+			cos_x2)*(0.3*sin_3x1 + 0.3* \
+			cos_x1*cos_x2 + 0.3* \
+			cos_x2 + 2.0) - mu*(-0.2*np.pi**2* \
+			sin_x1*sin_x2 - 0.4*np.pi**2* \
+			sin_x2 - 0.4*np.pi**2*cos_x1* \
+			cos_x2)*(0.3*sin_x2 + 0.3* \
+			cos_x1*cos_x2 + 0.3* \
+			cos_x1 + 2.0) - mu*(0.3*np.pi**2* \
+			sin_x1*sin_x2 - 0.3*np.pi**2* \
+			cos_x1*cos_x2 - 0.3*np.pi**2* \
+			cos_x1)*(0.3*sin_x2 + 0.3* \
+			cos_x1*cos_x2 + 0.3* \
+			cos_x1 + 2.0) - mu*(0.3*np.pi**2* \
+			sin_x1*sin_x2 - 0.3*np.pi**2* \
+			cos_x1*cos_x2 - 0.3*np.pi**2* \
+			cos_x2)*(0.3*sin_3x1 + 0.3* \
+			cos_x1*cos_x2 + 0.3* \
+			cos_x2 + 2.0) + (-0.3*np.pi* \
+			sin_x1*cos_x2 + 0.9*np.pi* \
+			cos_3x1)*((4.0*(0.15* \
+			sin_3x1 + 0.15*cos_x1* \
+			cos_x2 + 0.15*cos_x2 + 1)**2 \
+			+ 4.0*(0.15*sin_x2 + 0.15* \
+			cos_x1*cos_x2 + 0.15* \
+			cos_x1 + 1)**2)*(0.05*sin_x1 \
+			+ 0.05*cos_x1*cos_x2 - 0.1* \
+			cos_x2 + 0.5) + 1.0*sin_x2 + \
+			0.5*cos_x1*cos_x2 + 1.0* \
+			cos_2x1 + 10.0 + (1.0*sin_x2 \
+			+ 0.5*cos_x1*cos_x2 + 1.0* \
+			cos_2x1 + 10.0)/(gamma - 1)) + (-0.3* \
+			np.pi*sin_x2*cos_x1 + 0.3*np.pi* \
+			cos_x2)*((4.0*(0.15*sin_3x1 + \
+			0.15*cos_x1*cos_x2 + 0.15* \
+			cos_x2 + 1)**2 + 4.0*(0.15* \
+			sin_x2 + 0.15*cos_x1* \
+			cos_x2 + 0.15*cos_x1 + 1)**2) \
+			*(0.05*sin_x1 + 0.05*cos_x1* \
+			cos_x2 - 0.1*cos_x2 + 0.5) + 1.0 \
+			*sin_x2 + 0.5*cos_x1* \
+			cos_x2 + 1.0*cos_2x1 + 10.0 \
+			+ (1.0*sin_x2 + 0.5*cos_x1* \
+			cos_x2 + 1.0*cos_2x1 + 10.0) \
+			/(gamma - 1)) + (0.3*sin_3x1 + 0.3* \
+			cos_x1*cos_x2 + 0.3* \
+			cos_x2 + 2.0)*((4.0*(-0.3*np.pi* \
+			sin_x1*cos_x2 - 0.3*np.pi* \
+			sin_x1)*(0.15*sin_x2 + 0.15* \
+			cos_x1*cos_x2 + 0.15* \
+			cos_x1 + 1) + 4.0*(-0.3*np.pi* \
+			sin_x1*cos_x2 + 0.9* \
+			np.pi*cos_3x1)*(0.15*sin_3x1 \
+			+ 0.15*cos_x1*cos_x2 + 0.15* \
+			cos_x2 + 1))*(0.05*sin_x1 + \
+			0.05*cos_x1*cos_x2 - 0.1* \
+			cos_x2 + 0.5) + (-0.05*np.pi* \
+			sin_x1*cos_x2 + 0.05*np.pi* \
+			cos_x1)*(4.0*(0.15*sin_3x1 + \
+			0.15*cos_x1*cos_x2 + 0.15* \
+			cos_x2 + 1)**2 + 4.0*(0.15* \
+			sin_x2 + 0.15*cos_x1* \
+			cos_x2 + 0.15*cos_x1 + 1)**2) \
+			- 0.5*np.pi*sin_x1*cos_x2 - \
+			2.0*np.pi*sin_2x1 + (-0.5*np.pi* \
+			sin_x1*cos_x2 - 2.0*np.pi* \
+			sin_2x1)/(gamma - 1)) + (0.3* \
+			sin_x2 + 0.3*cos_x1* \
+			cos_x2 + 0.3*cos_x1 + \
+			2.0)*((4.0*(-0.3*np.pi*sin_x2* \
+			cos_x1 - 0.3*np.pi*sin_x2)* \
+			(0.15*sin_3x1 + 0.15*cos_x1* \
+			cos_x2 + 0.15*cos_x2 + 1) + \
+			4.0*(-0.3*np.pi*sin_x2*cos_x1 \
+			+ 0.3*np.pi*cos_x2)*(0.15*sin_x2 \
+			+ 0.15*cos_x1*cos_x2 + 0.15* \
+			cos_x1 + 1))*(0.05*sin_x1 + \
+			0.05*cos_x1*cos_x2 - 0.1* \
+			cos_x2 + 0.5) + (-0.05*np.pi* \
+			sin_x2*cos_x1 + 0.1*np.pi* \
+			sin_x2)*(4.0*(0.15*sin_3x1 + \
+			0.15*cos_x1*cos_x2 + 0.15* \
+			cos_x2 + 1)**2 + 4.0*(0.15* \
+			sin_x2 + 0.15*cos_x1* \
+			cos_x2 + 0.15*cos_x1 + 1)**2) \
+			- 0.5*np.pi*sin_x2*cos_x1 + \
+			1.0*np.pi*cos_x2 + (-0.5*np.pi* \
+			sin_x2*cos_x1 + 1.0*np.pi* \
+			cos_x2)/(gamma - 1)) - np.pi**2*kappa* \
+			(-0.2*(0.5*sin_x1*cos_x2 + 2.0* \
+			sin_2x1)*(sin_x1* \
+			cos_x2 - cos_x1)/(0.1* \
+			sin_x1 + 0.1*cos_x1* \
+			cos_x2 - 0.2*cos_x2 + 1.0) \
+			+ (0.02*(sin_x1*cos_x2 - \
+			cos_x1)**2/(0.1*sin_x1 + 0.1 \
+			*cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0) + 0.1*sin_x1 + \
+			0.1*cos_x1*cos_x2)*(1.0* \
+			sin_x2 + 0.5*cos_x1* \
+			cos_x2 + 1.0*cos_2x1 + 10.0) \
+			/(0.1*sin_x1 + 0.1*cos_x1* \
+			cos_x2 - 0.2*cos_x2 + 1.0) - \
+			0.5*cos_x1*cos_x2 - 4.0* \
+			cos_2x1)/(R*(0.1*sin_x1 + \
+			0.1*cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0)) - np.pi**2*kappa*(-2* \
+			(0.5*sin_x2*cos_x1 - 1.0* \
+			cos_x2)*(0.1*cos_x1 - 0.2)* \
+			sin_x2/(0.1*sin_x1 + 0.1* \
+			cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0) + ((0.2*cos_x1 \
+			- 0.4)*sin_x2**2/(0.1*sin_x1 \
+			+ 0.1*cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0) + cos_x2)*(0.1* \
+			cos_x1 - 0.2)*(1.0*sin_x2 + 0.5 \
+			*cos_x1*cos_x2 + 1.0* \
+			cos_2x1 + 10.0)/(0.1*sin_x1 \
+			+ 0.1*cos_x1*cos_x2 - 0.2* \
+			cos_x2 + 1.0) - 1.0*sin_x2 - \
+			0.5*cos_x1*cos_x2)/(R*(0.1* \
+			sin_x1 + 0.1*cos_x1* \
+			cos_x2 - 0.2*cos_x2 + 1.0))
 		# End of generated code
 
 		
@@ -63,6 +63,8 @@ class NavierStokes(euler.Euler):
 		mass-specific gas constant
 	gamma: float
 		specific heat ratio
+	kappa_over_mu: float
+		ratio of thermal conductivity to viscosity (cp / Pr)
 	'''
 	PHYSICS_TYPE = general.PhysicsType.NavierStokes
 
@@ -70,6 +72,7 @@ class NavierStokes(euler.Euler):
 		super().__init__()
 		self.R = 0.
 		self.gamma = 0.
+		self.kappa_over_mu = 0.
 
 	def set_maps(self):
 		super().set_maps()
@@ -106,6 +109,10 @@ class NavierStokes(euler.Euler):
 		self.T0 = T0
 		self.beta = beta
 
+		# Constant factor relating thermal conductivity to viscosity
+		cv = GasConstant / (SpecificHeatRatio - 1.)
+		self.kappa_over_mu = SpecificHeatRatio * cv / PrandtlNumber
+
 
 class NavierStokes1D(NavierStokes, euler.Euler1D):
 	'''
@@ -137,47 +144,45 @@ class NavierStokes1D(NavierStokes, euler.Euler1D):
 			flag_non_physical=False)
 		mu = mu.reshape(rho.shape)
 		kappa = kappa.reshape(rho.shape)
-		nu = mu / rho
+
+		# Reciprocal of density (reused in place of divisions)
+		inv_rho = 1. / rho
+		nu = mu * inv_rho
 
 		gamma = self.gamma
 		R = self.R
 
 		# Set constants for stress tensor
 		C1 = 2. / 3.
-		C2 = (gamma - 1.) / (R * rho)
+		C2 = ((gamma - 1.) / R) * inv_rho
 		
 		# Separate x gradient
 		gUx = gUq[:, :, :, 0] # [ne, nq, ns]
 
 		# Get velocity
-		u = rhou / rho
+		u = rhou * inv_rho
 		
 		# Get E
-		E = rhoE / rho
+		E = rhoE * inv_rho
 		
 		# Get squared velocity
 		u2 = u**2
 
-		# Store dTdU
-		dTdU = np.zeros_like(gUx)
-		dTdU[:, :, 0] = C2 * (-E + u2)
-		dTdU[:, :, 1] = C2 * -u
-		dTdU[:, :, 2] = C2
-
 		# Get the stress tensor (use product rules to write in 
 		# terms of the conservative gradients)
-		rhodiv = (gUx[:, :, 1] - u * gUx[:, :, 0])
-		tauxx = nu * (2. * (gUx[:, :, 1] - u * gUx[:, :, 0]) - \
-			C1 * rhodiv)
+		# rho * du/dx (also the divergence term in 1D)
+		rhodiv = gUx[:, :, irhou] - u * gUx[:, :, irho]
+		tauxx = nu * (2. * rhodiv - C1 * rhodiv)
 
-		# Assemble flux matrix
-		F = np.empty(Uq.shape + (self.NDIMS,)) # [n, nq, ns, ndims]
-		F[:,:,irho,  :] = 0.		   # flux of rho 
-		F[:,:,irhou, 0] = tauxx 	# flux of momentum
-		F[:,:,irhoE, 0] = u * tauxx + \
-			kappa * np.einsum('ijk, ijk -> ij', dTdU, gUx)
+		# Flux of energy
+		FE = u * tauxx + kappa * C2 * (gUx[:, :, irhoE] - \
+			u * gUx[:, :, irhou] + (u2 - E) * gUx[:, :, irho]) # dT/dx
 
-		return F # [n, nq, ns, ndims]
+		# Assemble flux matrix in state order (rho, rhou, rhoE); the flux
+		# of rho is zero
+		F = np.stack((np.zeros_like(FE), tauxx, FE), axis=2)
+
+		return F[:, :, :, np.newaxis] # [n, nq, ns, ndims]
 
 class NavierStokes2D(NavierStokes, euler.Euler2D):
 	'''
@@ -221,8 +226,6 @@ class NavierStokes2D(NavierStokes, euler.Euler2D):
 
 		# Unpack state coefficients
 		rho  = Uq[:, :, irho]  # [n, nq]
-		rhou = Uq[:, :, irhou] # [n, nq]
-		rhov = Uq[:, :, irhov] # [n, nq]
 		rhoE = Uq[:, :, irhoE] # [n, nq]
 		mom  = Uq[:, :, smom]  # [n, nq, ndims]
 
@@ -231,62 +234,56 @@ class NavierStokes2D(NavierStokes, euler.Euler2D):
 			flag_non_physical=False)
 		mu = mu.reshape(rho.shape)
 		kappa = kappa.reshape(rho.shape)
-		nu = mu / rho
+
+		# Reciprocal of density (reused in place of divisions)
+		inv_rho = 1. / rho
+		nu = mu * inv_rho
 
 		gamma = self.gamma
 		R = self.R
 
 		# Set constants for stress tensor
 		C1 = 2. / 3.
-		C2 = (gamma - 1.) / (R * rho)
+		C2 = ((gamma - 1.) / R) * inv_rho
 		
-		# Separate x and y gradients
-		gUx = gUq[:, :, :, 0] # [ne, nq, ns]
-		gUy = gUq[:, :, :, 1] # [ne, nq, ns]
-
 		# Get velocity in each dimension
-		u = rhou / rho
-		v = rhov / rho
+		vel = mom * inv_rho[:, :, np.newaxis] # [n, nq, ndims]
+		u = vel[:, :, 0]
+		v = vel[:, :, 1]
 		
 		# Get E
-		E = rhoE / rho
-		
-		# Get squared velocities
-		u2 = u**2
-		v2 = v**2
-
-		# Store dTdU
-		dTdU = np.zeros_like(gUx)
-		dTdU[:, :, 0] = C2 * (-E + u2 + v2)
-		dTdU[:, :, 1] = C2 * -u
-		dTdU[:, :, 2] = C2 * -v
-		dTdU[:, :, 3] = C2
+		E = rhoE * inv_rho
+
+		# Get rho times the velocity gradient tensor (use product rules
+		# to write in terms of the conservative gradients)
+		# rho_gvel[:, :, i, j] = rho * du_i/dx_j
+		grho = gUq[:, :, irho, :] # [n, nq, ndims]
+		rho_gvel = gUq[:, :, smom, :] - vel[:, :, :, np.newaxis] * \
+				grho[:, :, np.newaxis, :] # [n, nq, ndims, ndims]
+		rhodiv = rho_gvel[:, :, 0, 0] + rho_gvel[:, :, 1, 1]
+
+		# Get the stress tensor
+		tau = rho_gvel + np.swapaxes(rho_gvel, 2, 3)
+		tau[:, :, 0, 0] -= C1 * rhodiv
+		tau[:, :, 1, 1] -= C1 * rhodiv
+		tau *= nu[:, :, np.newaxis, np.newaxis] # [n, nq, ndims, ndims]
+
+		# Temperature gradient (dT/dU contracted with the state gradient).
+		# Writing the momentum gradients through rho_gvel cancels the
+		# |u|^2 terms: grad(T) = C2*(grad(rhoE) - E*grad(rho) - u_i*rho_gvel_i)
+		gT = C2[:, :, np.newaxis] * (gUq[:, :, irhoE, :] - \
+			E[:, :, np.newaxis] * grho - \
+			u[:, :, np.newaxis] * rho_gvel[:, :, 0, :] - \
+			v[:, :, np.newaxis] * rho_gvel[:, :, 1, :]) # [n, nq, ndims]
+
+		# x,y-flux of energy
+		FE = u[:, :, np.newaxis] * tau[:, :, 0, :] + \
+			v[:, :, np.newaxis] * tau[:, :, 1, :] + \
+			kappa[:, :, np.newaxis] * gT # [n, nq, ndims]
+
+		# Assemble flux matrix in state order (rho, rhou, rhov, rhoE); the
+		# x,y-flux of rho is zero and the momentum flux is tau
+		F = np.concatenate((np.zeros_like(FE)[:, :, np.newaxis, :], tau,
+				FE[:, :, np.newaxis, :]), axis=2)
 
-		# Get the stress tensor (use product rules to write in 
-		# terms of the conservative gradients)
-		rhodiv = ((gUx[:, :, 1] - u * gUx[:, :, 0]) + \
-			(gUy[:, :, 2] - v * gUy[:, :, 0]))
-		tauxx = nu * (2. * (gUx[:, :, 1] - u * gUx[:, :, 0]) - \
-			C1 * rhodiv)
-		tauxy = nu * ((gUy[:, :, 1] - u * gUy[:, :, 0]) + \
-			(gUx[:, :, 2] - v * gUx[:, :, 0]))
-		tauyy = nu * (2. * (gUy[:, :, 2] - v * gUy[:, :, 0]) - \
-			C1 * rhodiv)
-
-		# Assemble flux matrix
-		F = np.empty(Uq.shape + (self.NDIMS,)) # [n, nq, ns, ndims]
-		F[:,:,irho,  :] = 0.		   # x,y-flux of rho (zero both dir)
-
-		# x-direction
-		F[:,:,irhou, 0] = tauxx 	# x-flux of x-momentum
-		F[:,:,irhov, 0] = tauxy     # x-flux of y-momentum
-		F[:,:,irhoE, 0] = u * tauxx + v * tauxy + \
-			kappa * np.einsum('ijk, ijk -> ij', dTdU, gUx)
-
-		# y-direction
-		F[:,:,irhou, 1] = tauxy        # y-flux of x-momentum
-		F[:,:,irhov, 1] = tauyy 	   # y-flux of y-momentum
-		F[:,:,irhoE, 1] = u * tauxy + v * tauyy + \
-			kappa * np.einsum('ijk, ijk -> ij', dTdU, gUy)
-
-		return F # [n, nq, ns, ndims]
\ No newline at end of file
+		return F # [n, nq, ns, ndims]
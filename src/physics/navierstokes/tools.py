@@ -66,15 +66,9 @@ def get_constant_transport(physics, Uq, flag_non_physical=None):
 		mu: viscosity [ne]
 		kappa: thermal conductivity [ne]
 	'''
-	# Unpack
-	Pr = physics.Pr
-	gamma = physics.gamma
-	R = physics.R
-
-	mu = physics.mu0 * np.ones([Uq.shape[0], Uq.shape[1]])
-	cv = 1./(gamma - 1) * R
+	mu = np.full([Uq.shape[0], Uq.shape[1]], physics.mu0)
 
-	return mu, mu * cv * gamma / Pr
+	return mu, physics.kappa_over_mu * mu
 
 
 def get_sutherland_transport(physics, Uq, flag_non_physical=None):
@@ -94,9 +88,6 @@ def get_sutherland_transport(physics, Uq, flag_non_physical=None):
 		kappa: thermal conductivity [ne]
 	'''
 	# Unpack
-	Pr = physics.Pr
-	gamma = physics.gamma
-	R = physics.R
 	s = physics.s
 	T0 = physics.T0
 	beta = physics.beta
@@ -105,9 +96,8 @@ def get_sutherland_transport(physics, Uq, flag_non_physical=None):
 			Uq, flag_non_physical=flag_non_physical)
 
 	mu0 = 0.1; s = 1.; T0 = 1.; beta = 1.5;
-	cv = 1./(gamma - 1) * R
 
 	mu = mu0 * (T / T0)**beta * ((T0 + s) / (T + s))
-	kappa = mu * cv * gamma / Pr
+	kappa = physics.kappa_over_mu * mu
 
 	return mu, kappa
\ No newline at end of file
@@ -23,7 +23,6 @@
 # ------------------------------------------------------------------------ #
 from enum import Enum, auto
 import numpy as np
-from scipy.optimize import root
 
 from physics.base.data import FcnBase, BCWeakRiemann, BCWeakPrescribed, \
 		SourceBase, ConvNumFluxBase
@@ -104,7 +103,10 @@ class Sine(FcnBase):
 
 	def get_state(self, physics, x, t):
 		c = physics.c
-		Uq = np.sin(self.omega*(x-c*t))
+		# Phase is built in a single fresh array and overwritten in place
+		Uq = x - c*t
+		Uq *= self.omega
+		np.sin(Uq, out=Uq)
 
 		return Uq
 
@@ -138,7 +140,11 @@ class DampingSine(FcnBase):
 
 	def get_state(self, physics, x, t):
 		c = physics.c
-		Uq = np.sin(self.omega*(x-c*t)) * np.exp(self.nu*t)
+		Uq = x - c*t
+		Uq *= self.omega
+		np.sin(Uq, out=Uq)
+		# Damping factor is a scalar
+		Uq *= np.exp(self.nu*t)
 
 		return Uq
 
@@ -172,10 +178,16 @@ class Gaussian(FcnBase):
 
 	def get_state(self, physics, x, t):
 
-		r = np.linalg.norm(x[:] - self.x0 - physics.c*t, axis=2,
-				keepdims=True)
-		Uq = 1./(self.sig*np.sqrt(2.*np.pi))**float(physics.NDIMS) * \
-				np.exp(-r**2./(2.*self.sig**2.))
+		c = physics.c
+		sig = self.sig
+		# Scalar constants, so only the exponent touches the arrays
+		norm = 1./(sig*np.sqrt(2.*np.pi))**float(physics.NDIMS)
+		inv_two_sig2 = 1./(2.*sig*sig)
+
+		# Squared distance from the advected center (no sqrt needed)
+		dx = x - self.x0 - c*t
+		r2 = np.einsum('ijk, ijk -> ij', dx, dx)[:, :, np.newaxis]
+		Uq = norm*np.exp(-inv_two_sig2*r2)
 
 		return Uq
 
@@ -189,7 +201,9 @@ class Paraboloid(FcnBase):
 		pass
 
 	def get_state(self, physics, x, t):
-		r2 = x[:, 0:1]**2. + x[:, 1:2]**2.
+		x1 = x[:, 0:1]
+		x2 = x[:, 1:2]
+		r2 = x1*x1 + x2*x2
 		Uq = r2
 
 		return Uq
@@ -203,7 +217,7 @@ class ShockBurgers(FcnBase):
 	-----------
 	uL: float
 		left state
-	uL: float
+	uR: float
 		right state
 	xshock: float
 		initial shock location
@@ -227,21 +241,16 @@ class ShockBurgers(FcnBase):
 		self.xshock = xshock
 
 	def get_state(self, physics, x, t):
-		# Unpack
-		uL = self.uL
-		uR = self.uR
+		# Unpack (as floats so that integer inputs still give a float
+		# state array)
+		uL = float(self.uL)
+		uR = float(self.uR)
 		xshock = self.xshock
 
 		# Shock
 		us = uR + uL
 		xshock = xshock + us*t
-		ileft = (x <= xshock).reshape(-1)
-		iright = (x > xshock).reshape(-1)
-
-		Uq = np.zeros([x.shape[0], physics.NUM_STATE_VARS])
-
-		Uq[ileft] = uL
-		Uq[iright] = uR
+		Uq = np.where(x <= xshock, uL, uR) # [ne, nq, ns]
 
 		return Uq
 
@@ -271,19 +280,26 @@ class SineBurgers(FcnBase):
 		self.omega = omega
 
 	def get_state(self, physics, x, t):
-
-		def F(u):
-			x1 = x.reshape(x.shape[0]*x.shape[1])
-			F = u - np.sin(self.omega*(x1-u*t))
-			return F
-
-		u = np.sin(self.omega*x)
-		u1 = u.reshape(u.shape[0]*u.shape[1])
-		sol = root(F, u1, tol=1e-12)
-
-		Uq = sol.x.reshape(u.shape[0], u.shape[1], 1)
-
-		return Uq
+		omega = self.omega
+
+		# Solve u = sin(omega*(x - u*t)) pointwise with Newton's method,
+		# starting from the initial profile
+		omega_x = omega*x
+		omega_t = omega*t
+		# u has the shape of x, i.e. [ne, nq, 1], so it is already in
+		# state layout and the work arrays are reused across iterations
+		u = np.sin(omega_x)
+		arg = np.empty_like(u)
+		du = np.empty_like(u)
+		for _ in range(50):
+			np.subtract(omega_x, omega_t*u, out=arg)
+			np.subtract(u, np.sin(arg), out=du)
+			du /= 1. + omega_t*np.cos(arg)
+			u -= du
+			if np.amax(np.abs(du)) < 1e-14:
+				break
+
+		return u # [ne, nq, 1]
 
 
 class LinearBurgers(FcnBase):
@@ -316,7 +332,8 @@ class DiffGaussian(FcnBase):
 		xo = self.xo
 
 		C1 = 1. / np.sqrt(4.*t + 1.)
-		C2 = (x - xo - c*t) * (x - xo - c*t)
+		dx = x - xo - c*t
+		C2 = dx*dx
 		C3 = al * (4*t + 1)
 
 		Uq = C1 * np.exp(-C2 / C3)
@@ -336,23 +353,23 @@ class DiffGaussian2D(FcnBase):
 		c = physics.c
 		al = physics.al
 
-		x1 = x[:, :, 0]
-		x2 = x[:, :, 1]
-
-		xo = self.xo
-		yo = self.yo
-
-		Uq = np.zeros([x.shape[0], x.shape[1], physics.NUM_STATE_VARS])
+		# Offsets from the advected center, computed on the packed
+		# coordinates in one pass
+		xc = np.array([self.xo, self.yo]) + c*t
+		dx = x - xc # [ne, nq, 2]
 
 		C1 = 1. / (4.*t + 1.)
-		C2x = (x1 - xo - c[0]*t)**2
-		C2y = (x2 - yo - c[1]*t)**2
-		C3x = al[0] * (4*t + 1)
-		C3y = al[1] * (4*t + 1)
+		inv_C3 = 1. / (al * (4*t + 1))
 
-		Uq[:, :, 0] = C1 * np.exp(-1.*(C2x / C3x) - (C2y / C3y))
+		# Exponent as a single weighted contraction over both dimensions,
+		# then evaluated in place
+		Uq = np.einsum('ijk, ijk, k -> ij', dx, dx, inv_C3)
+		Uq *= -1.
+		np.exp(Uq, out=Uq)
+		Uq *= C1
 
-		return Uq
+		# Scalar state, so the profile can be returned directly
+		return Uq[:, :, np.newaxis] # [ne, nq, 1]
 
 '''
 ---------------------
@@ -413,13 +430,27 @@ class ExactLinearFlux(ConvNumFluxBase):
 	This class corresponds to the exact flux for linear advection.
 	'''
 	def compute_flux(self, physics, UqL, UqR, normals):
+		c = physics.c
+
+		if normals.shape[2] == 1:
+			# 1D: the upwind side follows from the sign of c*n, and the
+			# projected flux is linear in the normal, so no normalization
+			# is needed. This also handles a scalar advection velocity.
+			iL = (c*normals[:, :, 0] >= 0.)
+			Uq_upwind = np.where(iL[:, :, np.newaxis], UqL, UqR)
+			Fq,_ = physics.get_conv_flux_projected(Uq_upwind, normals)
+
+			return Fq
+
 		# Normalize the normal vectors
-		n_mag = np.linalg.norm(normals, axis=2, keepdims=True)
+		n2 = np.einsum('ijl, ijl -> ij', normals, normals)
+		n_mag = np.sqrt(n2)[:, :, np.newaxis]
 		n_hat = normals/n_mag
 
-		Uq_upwind = UqR.copy()
-		iL = (np.einsum('ijl, l -> ij', n_hat, physics.c) >= 0.) 
-		Uq_upwind[iL, :] = UqL[iL, :]
+		# Upwind direction only depends on the sign of c dot n, so the
+		# unnormalized normals suffice here
+		iL = (np.einsum('ijl, l -> ij', normals, c) >= 0.)
+		Uq_upwind = np.where(iL[:, :, np.newaxis], UqL, UqR)
 
 		# Flux
 		Fq,_ = physics.get_conv_flux_projected(Uq_upwind, n_hat)
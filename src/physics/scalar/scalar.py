@@ -193,9 +193,8 @@ class ConstAdvScalar2D(ConstAdvScalar):
 	def get_conv_flux_interior(self, Uq):
 		c = self.c
 
-		F = np.empty(Uq.shape + (self.NDIMS,)) # [n, nq, ns, ndims]
-		F[:, :, :, 0] = c[0] * Uq
-		F[:, :, :, 1] = c[1] * Uq
+		# Broadcast the velocity along the trailing dimension axis
+		F = Uq[:, :, :, np.newaxis] * c # [n, nq, ns, ndims]
 
 		return F, None
 
@@ -362,19 +361,16 @@ class ConstAdvDiffScalar2D(ConstAdvDiffScalar):
 	def get_conv_flux_interior(self, Uq):
 		c = self.c
 
-		F = np.empty(Uq.shape + (self.NDIMS,)) # [n, nq, ns, ndims]
-		F[:, :, :, 0] = c[0] * Uq
-		F[:, :, :, 1] = c[1] * Uq
+		# Broadcast the velocity along the trailing dimension axis
+		F = Uq[:, :, :, np.newaxis] * c # [n, nq, ns, ndims]
 
 		return F, None
 
 	def get_diff_flux_interior(self, Uq, gUq):
 		al = self.al
-		
-		F = np.empty(Uq.shape + (self.NDIMS,)) # [n, nq, ns, ndims]
 
-		F[:, :, :, 0] = al[0] * gUq[:, :, :, 0]
-		F[:, :, :, 1] = al[1] * gUq[:, :, :, 1]
+		# Diffusion coefficients broadcast along the dimension axis
+		F = al * gUq # [n, nq, ns, ndims]
 
 		return F
 
@@ -83,10 +83,13 @@ class PendulumExact(FcnBase):
 		g = physics.g
 		l = physics.l
 
+		# Natural frequency
+		omega = np.sqrt(g/l)
+
 		Uq = np.zeros([x.shape[0], x.shape[1], physics.NUM_STATE_VARS])
 
-		Uq[:, :, 0] = 0.1745 * np.cos(np.sqrt(g/l)*t)
-		Uq[:, :, 1] = -0.1745 * np.sqrt(g/l) * np.sin(np.sqrt(g/l)*t)
+		Uq[:, :, 0] = 0.1745 * np.cos(omega*t)
+		Uq[:, :, 1] = -0.1745 * omega * np.sin(omega*t)
 
 		return Uq
 
@@ -222,29 +225,30 @@ class Mixing(SourceBase):
 		super().__init__(kwargs)
 
 	def get_source(self, physics, Uq, x, t):
-		# Unpack T and Y
+		# Unpack (quantities that do not vary between quadrature points)
+		tau = physics.tau
+		gas = physics.gas
+		P = physics.P
+		mw = gas.molecular_weights
+		yin = physics.yin[1:]
+		hin_mw = physics.hin/mw
+
 		S = np.zeros([Uq.shape[0], Uq.shape[1], physics.NUM_STATE_VARS])
 		# Loop over quadrature points
 		for i in range(Uq.shape[1]):
+			# Unpack T and Y
 			T = Uq[0, i, 0]
 			y = Uq[0, i, 1:]
 
-			tau = physics.tau
-			gas = physics.gas
 			gas.set_unnormalized_mass_fractions(y)
 
-			gas.TPY = T, physics.P, y
+			gas.TPY = T, P, y
 
-			rho = gas.density
-			wdot = gas.net_production_rates
 			h_hat = gas.partial_molar_enthalpies
 			cp = gas.cp_mass
 
-			mw = gas.molecular_weights
-
-			dTdt = (1./(tau*cp)) * np.dot(physics.yin[1:], 
-					(physics.hin/mw - h_hat/mw))
-			dYdt = (1./tau) * (physics.yin[1:] - y)
+			dTdt = (1./(tau*cp)) * np.dot(yin, (hin_mw - h_hat/mw))
+			dYdt = (1./tau) * (yin - y)
 
 			S[:, i] = np.hstack((dTdt, dYdt))
 
@@ -265,25 +269,26 @@ class Reacting(SourceBase):
 		super().__init__(kwargs)
 
 	def get_source(self, physics, Uq, x, t):
-		# Unpack T and Y
+		# Unpack (quantities that do not vary between quadrature points)
+		gas = physics.gas
+		P = physics.P
+		mw = gas.molecular_weights
+
 		S = np.zeros([Uq.shape[0], Uq.shape[1], physics.NUM_STATE_VARS])
 		for i in range(Uq.shape[1]):
+			# Unpack T and Y
 			T = Uq[0,i,0]
 			y = Uq[0,i,1:]
 
-			tau = physics.tau
-			gas = physics.gas
 			gas.set_unnormalized_mass_fractions(y)
 
-			gas.TPY = T, physics.P, y
+			gas.TPY = T, P, y
 
 			rho = gas.density
 			wdot = gas.net_production_rates
 			h_hat = gas.partial_molar_enthalpies
 			cp = gas.cp_mass
 
-			mw = gas.molecular_weights
-
 			dTdt = -1.*np.dot(h_hat, wdot) * (1./ (rho*cp))
 			dYdt = wdot * mw / rho
 
@@ -324,21 +329,21 @@ def get_numerical_jacobian(source, physics, Uq, x, t):
 
 	jac = np.zeros([Uq.shape[0], Uq.shape[1], ns, ns])
 
+	# Perturbed state buffer (reused for every element and variable)
+	Uq_per = np.empty([1, 1, ns])
+
 	for ielem in range(nelem):
 		# Get source term in each element
 		S[ielem] = source.get_source(physics, 
 				Uq[ielem].reshape([1, 1, ns]), x, t)
 		# Construct the perturbed sources
+		Uq_per[0, 0] = Uq[ielem, 0]
 		for i in range(ns):
-			Uq_per = Uq[ielem].copy()
-			Uq_per[0, i] += eps
-			Sp[ielem, i] = source.get_source(physics, 
-					Uq_per.reshape([1, 1, ns]), x, t)
-	# First-order finite difference
-	for ielem in range(nelem):
-		for i in range(ns):
-			for j in range(ns):
-					jac[ielem, 0, i, j] = (Sp[ielem, i, 0, j] - \
-						S[ielem, 0, j]) / (eps)
+			Uq_per[0, 0, i] += eps
+			Sp[ielem, i] = source.get_source(physics, Uq_per, x, t)
+			# Restore the unperturbed value
+			Uq_per[0, 0, i] = Uq[ielem, 0, i]
+	# First-order finite difference (jac[:, 0, i, j] = dS_j/dU_i)
+	jac[:, 0] = (Sp[:, :, 0, :] - S) / eps
 
 	return jac.transpose(0, 1, 3, 2)
\ No newline at end of file
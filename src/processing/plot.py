@@ -5,13 +5,21 @@
 #       Contains functions for plotting 1D and 2D solutions and meshes.
 #
 # ------------------------------------------------------------------------ #
+import os
+
 import matplotlib as mpl
+
+# Batch mode (QUAIL_BATCH set to a nonempty value): use a non-interactive
+# backend so that no GUI toolkit is initialized
+BATCH_MODE = bool(os.environ.get("QUAIL_BATCH"))
+if BATCH_MODE:
+	mpl.use("Agg")
+
 from matplotlib import pyplot as plt
 import matplotlib.tri as tri
 import numpy as np
 
 import meshing.meshbase as mesh_defs
-import meshing.tools as mesh_tools
 
 import numerics.helpers.helpers as helpers
 
@@ -89,7 +97,10 @@ def save_figure(file_name='fig', file_type='pdf', crop_level=1):
 def show_plot(interactive=False):
 	'''
 	This function is a wrapper for plt.show() (displays all open figures).
+	Does nothing in batch mode (environment variable QUAIL_BATCH set).
 	'''
+	if BATCH_MODE:
+		return
 	plt.show()
 
 
@@ -460,7 +471,6 @@ def get_sample_points(mesh, solver, physics, basis, equidistant=True):
 			number of sample points per element
 	'''
 	# Extract
-	ndims = mesh.ndims
 	U = solver.state_coeffs
 	order = solver.order
 
@@ -473,17 +483,15 @@ def get_sample_points(mesh, solver, physics, basis, equidistant=True):
 		gbasis = mesh.gbasis
 		xref, _ = gbasis.get_quadrature_data(quad_order)
 
-	# Allocate
-	num_pts = xref.shape[0]
-	x = np.zeros([mesh.num_elems, num_pts, ndims])
-
 	# Evaluate basis at reference-space points
 	basis.get_basis_val_grads(xref, True, False, False, None)
 
-	# Convert reference-space points to physical space
-	for elem_ID in range(mesh.num_elems):
-		xphys = mesh_tools.ref_to_phys(mesh, elem_ID, xref)
-		x[elem_ID, :, :] = xphys
+	# Convert reference-space points to physical space for all elements
+	# at once
+	gbasis = mesh.gbasis
+	gbasis.get_basis_val_grads(xref, get_val=True)
+	elem_coords = mesh.node_coords[mesh.elem_to_node_IDs]
+	x = np.matmul(gbasis.basis_val, elem_coords) # [num_elems, num_pts, ndims]
 
 	return x
 
@@ -693,13 +701,17 @@ def plot_mesh(mesh, equal_AR=False, **kwargs):
 	If requested, plot element IDs at element centroids
 	'''
 	if "show_elem_IDs" in kwargs and kwargs["show_elem_IDs"]:
+		# Evaluate geometric basis at centroid once for all elements
+		gbasis.get_basis_val_grads(gbasis.CENTROID, get_val=True)
+		xc = np.matmul(gbasis.basis_val, mesh.node_coords[
+				mesh.elem_to_node_IDs]) # [num_elems, 1, ndims]
+		if ndims == 1:
+			# Midpoint of y-axis
+			yc = np.full(mesh.num_elems, 0.5*(y[0] + y[1]))
+		else:
+			yc = xc[:, 0, 1]
 		for elem_ID in range(mesh.num_elems):
-			xc = mesh_tools.get_element_centroid(mesh, elem_ID)
-			if ndims == 1:
-				yc = np.mean(y)
-			else:
-				yc = xc[0,1]
-			plt.text(xc[0,0], yc, str(elem_ID))
+			plt.text(xc[elem_ID, 0, 0], yc[elem_ID], str(elem_ID))
 
 	# Labels, aspect ratio
 	plt.xlabel("$x$")
@@ -715,7 +727,10 @@ def plot_solution(mesh, physics, solver, var_name, plot_numerical=True,
 		equal_AR=False, skip=None, **kwargs):
 	'''
 	This function plots the solution. For 2D calculations, the solution will
-	be plotted using a triangulation.
+	be plotted using a triangulation. In 1D, any combination of the
+	numerical solution, exact solution, and initial condition can be
+	plotted in a single call, in which case the sample points are computed
+	only once.
 
 	Inputs:
 	-------
@@ -729,8 +744,12 @@ def plot_solution(mesh, physics, solver, var_name, plot_numerical=True,
 	    plot_IC: plot initial condition
 	    create_new_figure: if True, will create new figure before plotting
 	    ylabel: y-axis label
-		fmt: format string for plotting, e.g. "bo" for blue circles
-	    legend_label: legend label
+		fmt: format string for plotting, e.g. "bo" for blue circles; if
+			several solutions are plotted, either a single format string
+			or a sequence with one entry per solution (ordered as numerical,
+			exact, initial condition)
+	    legend_label: legend label; if several solutions are plotted,
+	    	either a single label or a sequence with one entry per solution
 	    equidistant_pts: if True, then solution will be evaluated at
 	    	equidistant points (within each element); if False, then solution
 	    	will be evaluated at quadrature points
@@ -746,8 +765,10 @@ def plot_solution(mesh, physics, solver, var_name, plot_numerical=True,
 	'''
 	''' Compatibility check '''
 	plot_sum = plot_numerical + plot_exact + plot_IC + plot_average
-	if plot_sum >= 2:
-		raise ValueError("Can only plot one solution at a time")
+	if plot_average and plot_sum >= 2:
+		raise ValueError("Average solution must be plotted by itself")
+	elif plot_sum >= 2 and mesh.ndims != 1:
+		raise ValueError("Can only plot one solution at a time in 2D")
 	elif plot_sum == 0:
 		raise ValueError("Need to plot a solution")
 
@@ -755,31 +776,46 @@ def plot_solution(mesh, physics, solver, var_name, plot_numerical=True,
 	time = solver.time
 	ndims = mesh.ndims
 
-	# Get sample points
+	# Get sample points (shared by all requested solutions)
 	x = get_sample_points(mesh, solver, physics, solver.basis,
 			equidistant_pts)
 
-	''' Evaluate desired variable at sample points '''
+	''' Evaluate desired variable(s) at sample points '''
+	var_plots = []
+	default_labels = []
 	if plot_numerical:
 		var_plot = get_numerical_solution(physics, solver.state_coeffs, x,
 				solver.basis, var_name)
-		default_label = "Numerical"
-	elif plot_exact:
+		var_plots.append(var_plot)
+		default_labels.append("Numerical")
+	if plot_exact:
 		var_plot = get_analytical_solution(physics, physics.exact_soln, x,
 				time, var_name)
 		var_plot.shape = x.shape[0], x.shape[1], -1
-		default_label = "Exact"
-	elif plot_IC:
+		var_plots.append(var_plot)
+		default_labels.append("Exact")
+	if plot_IC:
 		var_plot = get_analytical_solution(physics, physics.IC, x, 0.,
 				var_name)
 		var_plot.shape = x.shape[0], x.shape[1], -1
-		default_label = "Initial"
-	elif plot_average:
+		var_plots.append(var_plot)
+		default_labels.append("Initial")
+	if plot_average:
 		var_plot, x = get_average_solution(physics, solver, x,
 				solver.basis, var_name)
-		default_label = "Average"
+		var_plots.append(var_plot)
+		default_labels.append("Average")
+
+	# One format string and legend label per solution
+	num_plots = len(var_plots)
+	if isinstance(fmt, str):
+		fmt = [fmt]*num_plots
 	if legend_label is None:
-		legend_label = default_label
+		legend_label = default_labels
+	elif isinstance(legend_label, str):
+		legend_label = [legend_label]*num_plots
+	if len(fmt) != num_plots or len(legend_label) != num_plots:
+		raise ValueError("Need one fmt and legend_label per solution")
 
 	''' Plot '''
 	ylabel = get_ylabel(physics, var_name, ylabel)
@@ -787,12 +823,82 @@ def plot_solution(mesh, physics, solver, var_name, plot_numerical=True,
 		plt.figure()
 
 	if ndims == 1:
-		plot_1D(physics, x, var_plot, ylabel, fmt, legend_label, skip)
+		for var_plot, fmt_i, label_i in zip(var_plots, fmt, legend_label):
+			plot_1D(physics, x, var_plot, ylabel, fmt_i, label_i, skip)
 	else:
-		plot_2D(physics, x, var_plot, ylabel, regular_2D, equal_AR, **kwargs)
+		plot_2D(physics, x, var_plots[0], ylabel, regular_2D, equal_AR,
+				**kwargs)
 
 	if include_mesh:
 		plot_mesh(mesh, **kwargs)
 
 	# Final embellishments
 	finalize_plot(**kwargs)
+
+
+def plot_solutions(mesh, physics, solver, var_names, ylabels=None,
+		fmt='k-', legend_label=None, equidistant_pts=True,
+		include_mesh=False, regular_2D=False, equal_AR=False, skip=None,
+		**kwargs):
+	'''
+	This function plots the numerical solution of several variables, each
+	in a new figure. The sample points and the state at the sample points
+	are computed once and shared by all variables.
+
+	Inputs:
+	-------
+	    mesh: mesh object
+	    physics: physics object
+	    solver: solver object
+	    var_names: list of names of variables to plot
+	    ylabels: list of y-axis labels (same length as var_names); if
+	    	None, default labels are used
+		fmt: format string for plotting, e.g. "bo" for blue circles
+	    legend_label: legend label
+	    equidistant_pts: if True, then solution will be evaluated at
+	    	equidistant points (within each element); if False, then solution
+	    	will be evaluated at quadrature points
+	    include_mesh: if True, then the mesh will be superimposed
+	    regular_2D: if True, then entire domain will be triangulated at once
+	    	(appropriate only for regular domains); if False, then each
+	    	element will be triangulated one-by-one (appropriate for
+	    	general domains)
+	    equal_AR: if True, will set equal aspect ratio
+		skip: integer value that determines the increment between each point
+			to skip when plotting (only matters for 1D)
+	    kwargs: keyword arguments (see below)
+	'''
+	if ylabels is None:
+		ylabels = [None]*len(var_names)
+	elif len(ylabels) != len(var_names):
+		raise ValueError("Need one y-axis label per variable")
+	if legend_label is None:
+		legend_label = "Numerical"
+
+	ndims = mesh.ndims
+
+	# Get sample points and evaluate state once for all variables
+	x = get_sample_points(mesh, solver, physics, solver.basis,
+			equidistant_pts)
+	Uq = helpers.evaluate_state(solver.state_coeffs, solver.basis.basis_val)
+
+	for var_name, ylabel in zip(var_names, ylabels):
+		''' Evaluate variable at sample points '''
+		var_plot = physics.compute_variable(var_name, Uq)
+
+		''' Plot '''
+		ylabel = get_ylabel(physics, var_name, ylabel)
+		plt.figure()
+
+		if ndims == 1:
+			plot_1D(physics, x, var_plot, ylabel, fmt, legend_label, skip)
+		else:
+			# Triangulation reshapes its inputs in place
+			plot_2D(physics, np.copy(x), var_plot, ylabel, regular_2D,
+					equal_AR, **kwargs)
+
+		if include_mesh:
+			plot_mesh(mesh, **kwargs)
+
+		# Final embellishments
+		finalize_plot(**kwargs)
@@ -70,21 +70,17 @@ def get_error(mesh, physics, solver, var_name, ord=2, print_error=True,
 	else:
 		tot_vol = 1.
 
-	# Allocate, initialize
-	err_elems = np.zeros([mesh.num_elems])
-	tot_err = 0.
-
 	# Get quadrature data
-	quad_order = basis.get_quadrature_order(mesh, 2*np.amax([order, 1]),
+	quad_order = basis.get_quadrature_order(mesh, 2*max(order, 1),
 			physics=physics)
 
 	gbasis = mesh.gbasis
 	quad_pts, quad_wts = gbasis.get_quadrature_data(quad_order)
 
 	# Get x for each element
-	xphys = np.empty((mesh.num_elems,) + quad_pts.shape)
-	for elem_ID in range(mesh.num_elems):
-		xphys[elem_ID] = mesh_tools.ref_to_phys(mesh, elem_ID, quad_pts)
+	gbasis.get_basis_val_grads(quad_pts, get_val=True)
+	elem_coords = mesh.node_coords[mesh.elem_to_node_IDs]
+	xphys = np.matmul(gbasis.basis_val, elem_coords) # [num_elems, nq, ndims]
 
 	# Evaluate exact solution at quadrature points
 	u_exact = physics.exact_soln.get_state(physics, x=xphys, t=time)
@@ -97,14 +93,11 @@ def get_error(mesh, physics, solver, var_name, ord=2, print_error=True,
 	s = physics.compute_variable(var_name, u)
 	s_exact = physics.compute_variable(var_name, u_exact)
 
-	# Loop through elements
-	for elem_ID in range(mesh.num_elems):
-		# Calculate element-local error
-		djac, _, _ = basis_tools.element_jacobian(mesh, elem_ID, quad_pts,
-				get_djac=True)
-		err = np.sum((s[elem_ID] - s_exact[elem_ID])**ord*quad_wts*djac)
-		err_elems[elem_ID] = err
-		tot_err += err_elems[elem_ID]
+	# Calculate element-local errors for all elements at once
+	djac_elems, _, _ = basis_tools.element_jacobians(mesh, quad_pts,
+			get_djac=True)
+	err_elems = np.sum((s - s_exact)**ord*quad_wts*djac_elems, axis=(1, 2))
+	tot_err = np.sum(err_elems)
 
 	tot_err = (tot_err / tot_vol)**(1./ord)
 
@@ -20,8 +20,16 @@
 #       Contains functions for reading and writing data files.
 #
 # ------------------------------------------------------------------------ #
+from collections import OrderedDict
+import os
 import pickle
 
+# Solvers already read from disk, keyed by (absolute path, modification
+# time, size) so that stale entries are never returned. The least
+# recently used entry is evicted once MAX_CACHED_SOLVERS are stored.
+MAX_CACHED_SOLVERS = 4
+_cached_solvers = OrderedDict()
+
 def write_data_file(solver, iwrite):
 	'''
 	This function writes a data file (pickle format).
@@ -47,20 +55,42 @@ def write_data_file(solver, iwrite):
 		pickle.dump(solver, fo, pickle.HIGHEST_PROTOCOL)
 
 
-def read_data_file(fname):
+def read_data_file(fname, use_cache=False):
 	'''
 	This function reads a data file (pickle format).
 
 	Inputs:
 	-------
 	    fname: file name (str)
+	    use_cache: if True, repeated reads of an unchanged file return the
+	    	solver object loaded the first time instead of unpickling the
+	    	file again
 
 	Outputs:
 	--------
 	    solver: solver object
+
+	Notes:
+	------
+		With use_cache=True, every call for the same unchanged file returns
+		the same object, so the returned solver should not be modified.
+		At most MAX_CACHED_SOLVERS solvers are kept, with the least
+		recently used one evicted first.
 	'''
+	if use_cache:
+		stat = os.stat(fname)
+		key = (os.path.abspath(fname), stat.st_mtime_ns, stat.st_size)
+		if key in _cached_solvers:
+			_cached_solvers.move_to_end(key)
+			return _cached_solvers[key]
+
 	# Open and get solver
 	with open(fname, 'rb') as fo:
 		solver = pickle.load(fo)
 
+	if use_cache:
+		_cached_solvers[key] = solver
+		if len(_cached_solvers) > MAX_CACHED_SOLVERS:
+			_cached_solvers.popitem(last=False)
+
 	return solver
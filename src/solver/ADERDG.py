@@ -21,14 +21,12 @@
 #
 # ------------------------------------------------------------------------ #
 import numpy as np
-from scipy.linalg import solve_sylvester
 
 import errors
 
 from general import ModalOrNodal, StepperType, ShapeType
 
 import meshing.meshbase as mesh_defs
-import meshing.tools as mesh_tools
 
 import numerics.basis.basis as basis_defs
 import numerics.basis.tools as basis_tools
@@ -60,6 +58,10 @@ class ElemHelpersADER(DG.ElemHelpers):
 		self.basis_time = None
 		self.nq_tile_constant = None
 		self.nn_tile_constant = None
+		self.djac_elems_tiled = np.zeros(0)
+		self.quad_wts_djac_elems = np.zeros(0)
+		self.ijac_elems_tiled = np.zeros(0)
+		self.x_elems_tiled = np.zeros(0)
 
 
 class InteriorFaceHelpersADER(DG.InteriorFaceHelpers):
@@ -74,6 +76,9 @@ class InteriorFaceHelpersADER(DG.InteriorFaceHelpers):
 		super().__init__()
 		self.faceL_IDs_st = np.empty(0, dtype=int)
 		self.faceR_IDs_st = np.empty(0, dtype=int)
+		self.normals_int_faces_tiled = np.zeros(0)
+		self.ijacL_elems_tiled = np.zeros(0)
+		self.ijacR_elems_tiled = np.zeros(0)
 
 	def store_neighbor_info(self, mesh):
 		'''
@@ -113,6 +118,15 @@ class InteriorFaceHelpersADER(DG.InteriorFaceHelpers):
 		else:
 			raise NotImplementedError
 
+	def store_scatter_indices(self, physics, basis, order):
+		'''
+		The residuals of the space-time faces are integrated in time
+		before they are added to the (spatial) element residuals, so
+		their scatter indices are those of DG.InteriorFaceHelpers and are
+		not stored here.
+		'''
+		pass
+
 
 class BoundaryFaceHelpersADER(DG.BoundaryFaceHelpers):
 	'''
@@ -181,6 +195,9 @@ class ADERHelpers(object):
 		matrix whose gradient is taken in the temporal direction
 	iK: numpy array
 		inverse of space-time matrix K
+	iMM_SMS_ref: numpy array
+		inverse mass matrix times the transposed reference stiffness
+		matrix in each spatial direction
 	FTL: numpy array
 		flux matrix in space-time reference space (evaluated at tau=1)
 	FTR: numpy array
@@ -196,8 +213,17 @@ class ADERHelpers(object):
 		inverse Jacobian evaluated at the element nodes
 	djac_elems: numpy array
 		determinant of the Jacobian evaluated at the element nodes
+	proj_elems: numpy array
+		space-time L2 projection operator from the space-time quadrature
+		points to the basis coefficients for each element
 	x_elems: numpy array
 		physical coordinates of nodal points
+	F: numpy array
+		work array for the flux coefficients of the predicted solution
+	S: numpy array
+		work array for the source coefficients of the predicted solution
+	Sq: numpy array
+		work array for the source term evaluated at the nodal points
 	'''
 	def __init__(self):
 		self.MM = np.zeros(0)
@@ -205,6 +231,7 @@ class ADERHelpers(object):
 		self.iMM_elems = np.zeros(0)
 		self.K = np.zeros(0)
 		self.iK = np.zeros(0)
+		self.iMM_SMS_ref = np.zeros(0)
 		self.FTL = np.zeros(0)
 		self.FTR = np.zeros(0)
 		self.SMT = np.zeros(0)
@@ -212,7 +239,11 @@ class ADERHelpers(object):
 		self.jac_elems = np.zeros(0)
 		self.ijac_elems = np.zeros(0)
 		self.djac_elems = np.zeros(0)
+		self.proj_elems = np.zeros(0)
 		self.x_elems = np.zeros(0)
+		self.F = np.zeros(0)
+		self.S = np.zeros(0)
+		self.Sq = np.zeros(0)
 
 	def calc_ader_matrices(self, mesh, basis, basis_st, dt, order):
 		'''
@@ -243,12 +274,13 @@ class ADERHelpers(object):
 				space [num_elems, nb_st, nb_st]
 			self.K: space-time matrix FTL - SMT [nb_st, nb_st]
 			self.iK: inverse of space-time matrix K [nb_st, nb_st]
+			self.iMM_SMS_ref: product of iMM and the transposed reference
+				stiffness matrix in each spatial direction
+				[ndims, nb_st, nb_st]
 		'''
 		ndims = mesh.ndims
 		nb = basis_st.nb
 		SMS_ref = np.zeros([nb, nb, ndims])
-		SMS_elems = np.zeros([mesh.num_elems, nb, nb, ndims])
-		iMM_elems = np.zeros([mesh.num_elems, nb, nb])
 
 		# Get flux matrices in time
 		FTL = basis_st_tools.get_temporal_flux_ader(mesh, basis_st, basis_st,
@@ -262,16 +294,10 @@ class ADERHelpers(object):
 
 		# Get stiffness matrices in space and inverse mass matrices
 		# (physical space)
-		for elem_ID in range(mesh.num_elems):
-			for nd in range(ndims):
-				SMS = basis_st_tools.get_stiffness_matrix_ader(mesh, basis,
-						basis_st, order, dt, elem_ID, grad_dir=nd,
-						physical_space=True)
-				SMS_elems[elem_ID, :, :, nd] = SMS.transpose()
-
-			iMM = basis_st_tools.get_elem_inv_mass_matrix_ader(mesh,
-					basis_st, order, elem_ID, physical_space=True)
-			iMM_elems[elem_ID] = iMM
+		SMS_elems = basis_st_tools.get_stiffness_matrices_ader(mesh,
+				basis_st, order, dt)
+		iMM_elems = basis_st_tools.get_inv_mass_matrices_ader(mesh,
+				basis_st, order)
 
 		# Get mass matrix (and inverse) in reference space
 		iMM = basis_st_tools.get_elem_inv_mass_matrix_ader(mesh, basis_st,
@@ -297,6 +323,10 @@ class ADERHelpers(object):
 		self.K = FTL - SMT
 		self.iK = np.linalg.inv(self.K)
 
+		# Combined operator used to take the gradient of space-time
+		# coefficients in each spatial direction
+		self.iMM_SMS_ref = np.matmul(iMM, SMS_ref.transpose(2, 1, 0))
+
 	def get_geom_data(self, mesh, basis, order):
 		'''
 		Precomputes the geometric data for the ADER-DG scheme
@@ -318,38 +348,29 @@ class ADERHelpers(object):
 			self.x_elems: precomputed coordinates of the nodal points
 				in physical space [num_elems, nb, ndims]
 		'''
-		ndims = mesh.ndims
-		num_elems = mesh.num_elems
-		nb = basis.nb
 		gbasis = mesh.gbasis
 		tile_basis = basis_defs.LagrangeSeg(order)
 
 		# Define geometric basis for tiling jac, ijac, and djac
 		xnodes = gbasis.get_nodes(order)
-		nnodes = xnodes.shape[0]
 
 		tile_xnodes = tile_basis.get_nodes(order)
 		tile_nnodes = tile_xnodes.shape[0]
 
-		# Allocate
-		self.jac_elems = np.zeros([num_elems, nb, ndims, ndims])
-		self.ijac_elems = np.zeros([num_elems, nb, ndims, ndims])
-		self.djac_elems = np.zeros([num_elems, nb, 1])
-		self.x_elems = np.zeros([num_elems, nb, ndims])
-
-		for elem_ID in range(mesh.num_elems):
-			# Jacobian
-			djac, jac, ijac = basis_tools.element_jacobian(mesh, elem_ID,
-					xnodes, get_djac=True, get_jac=True, get_ijac=True)
+		# Jacobian for all elements at once
+		djac, jac, ijac = basis_tools.element_jacobians(mesh, xnodes,
+				get_djac=True, get_jac=True, get_ijac=True)
 
-			self.jac_elems[elem_ID] = np.tile(jac, (tile_nnodes, 1, 1))
-			self.ijac_elems[elem_ID] = np.tile(ijac, (tile_nnodes, 1, 1))
-			self.djac_elems[elem_ID] = np.tile(djac, (tile_nnodes, 1))
+		self.jac_elems = np.tile(jac, (1, tile_nnodes, 1, 1))
+		self.ijac_elems = np.tile(ijac, (1, tile_nnodes, 1, 1))
+		self.djac_elems = np.tile(djac, (1, tile_nnodes, 1))
 
-			# Physical coordinates of nodal points
-			x = mesh_tools.ref_to_phys(mesh, elem_ID, xnodes)
-			# Store
-			self.x_elems[elem_ID] = np.tile(x, (tile_nnodes, 1))
+		# Physical coordinates of nodal points
+		gbasis.get_basis_val_grads(xnodes, get_val=True)
+		elem_coords = mesh.node_coords[mesh.elem_to_node_IDs]
+		x = np.matmul(gbasis.basis_val, elem_coords) # [num_elems, nnodes, ndims]
+		# Store
+		self.x_elems = np.tile(x, (1, tile_nnodes, 1))
 
 	def set_tiling_constants(self, basis, elem_helpers_st, bface_helpers_st):
 		'''
@@ -384,15 +405,36 @@ class ADERHelpers(object):
 					basis_st_tools.get_tiling_constants_tri(
 					bface_quad_pts_st.shape[0])
 		else:
-			NotImplementedError
+			raise NotImplementedError
 
 		elem_helpers_st.nq_tile_constant = nq_t
 		elem_helpers_st.time_skip = time_skip
 		elem_helpers_st.time_tile = time_tile
 
+	def alloc_other_arrays(self, mesh, physics, basis_st):
+		'''
+		Allocates the work arrays used to compute the flux and source
+		coefficients of the predicted solution
+
+		Inputs:
+		-------
+			mesh: mesh object
+			physics: physics object
+			basis_st: space-time basis object
+		'''
+		ne = mesh.num_elems
+		nb_st = basis_st.nb
+		ns = physics.NUM_STATE_VARS
+		ndims = physics.NDIMS
+
+		self.F = np.zeros([ne, nb_st, ns, ndims])
+		self.S = np.zeros([ne, nb_st, ns])
+		self.Sq = np.zeros([ne, nb_st, ns])
+
 	def compute_helpers(self, mesh, physics, basis, basis_st, dt, order):
 		self.calc_ader_matrices(mesh, basis, basis_st, dt, order)
 		self.get_geom_data(mesh, basis_st, order)
+		self.alloc_other_arrays(mesh, physics, basis_st)
 
 
 class ADERDG(base.SolverBase):
@@ -506,8 +548,13 @@ class ADERDG(base.SolverBase):
 		stepper = self.stepper
 
 		self.elem_helpers = DG.ElemHelpers()
-		self.elem_helpers.compute_helpers(mesh, physics, basis,
-				order)
+		cache_file = self.params["HelperCacheFile"]
+		if cache_file is None:
+			self.elem_helpers.compute_helpers(mesh, physics, basis,
+					order)
+		else:
+			self.elem_helpers.compute_helpers_cached(mesh, physics, basis,
+					order, cache_file)
 		self.int_face_helpers = DG.InteriorFaceHelpers()
 		self.int_face_helpers.compute_helpers(mesh, physics, basis,
 				order)
@@ -535,6 +582,39 @@ class ADERDG(base.SolverBase):
 		self.ader_helpers.set_tiling_constants(basis,
 				self.elem_helpers_st, self.bface_helpers_st)
 
+		# Spatial Jacobian determinants tiled over the temporal quadrature
+		# points, with and without the space-time quadrature weights
+		nq_t = self.elem_helpers_st.nq_tile_constant
+		self.elem_helpers_st.djac_elems_tiled = np.tile(
+				self.elem_helpers.djac_elems, (nq_t, 1))
+		self.elem_helpers_st.quad_wts_djac_elems = \
+				self.elem_helpers_st.quad_wts * \
+				self.elem_helpers_st.djac_elems_tiled
+
+		# Space-time L2 projection operators
+		self.ader_helpers.proj_elems = dg_tools.get_projection_operators(
+				self.ader_helpers.iMM_elems, self.elem_helpers_st.basis_val,
+				self.elem_helpers_st.quad_wts,
+				self.elem_helpers_st.djac_elems_tiled)
+
+		# Spatial inverse Jacobians and physical coordinates stored
+		# contiguously for every space-time quadrature point
+		self.elem_helpers_st.ijac_elems_tiled = np.tile(
+				self.elem_helpers.ijac_elems, (1, nq_t, 1, 1))
+		self.elem_helpers_st.x_elems_tiled = np.tile(
+				self.elem_helpers.x_elems, (1, nq_t, 1))
+
+		# Interior face normals and inverse Jacobians tiled over the
+		# temporal quadrature points
+		time_skip = self.elem_helpers_st.time_skip
+		normals_int_faces = self.int_face_helpers.normals_int_faces
+		self.int_face_helpers_st.normals_int_faces_tiled = np.tile(
+				normals_int_faces, (normals_int_faces.shape[1], 1))
+		self.int_face_helpers_st.ijacL_elems_tiled = np.tile(
+				self.int_face_helpers.ijacL_elems, (1, time_skip, 1, 1))
+		self.int_face_helpers_st.ijacR_elems_tiled = np.tile(
+				self.int_face_helpers.ijacR_elems, (1, time_skip, 1, 1))
+
 
 	def get_element_residual(self, Uc, res_elem):
 		physics = self.physics
@@ -544,7 +624,6 @@ class ADERDG(base.SolverBase):
 
 		elem_helpers = self.elem_helpers
 		elem_helpers_st = self.elem_helpers_st
-		nq_tile_constant = elem_helpers_st.nq_tile_constant
 
 		quad_wts = elem_helpers.quad_wts
 		quad_wts_st = elem_helpers_st.quad_wts
@@ -557,7 +636,6 @@ class ADERDG(base.SolverBase):
 		basis_ref_grad_st = elem_helpers_st.basis_ref_grad
 
 		basis_ref_grad = elem_helpers.basis_ref_grad
-		ijac_elems = elem_helpers.ijac_elems
 
 		x_elems = elem_helpers.x_elems
 		x_elems_st = elem_helpers_st.x_elems
@@ -571,15 +649,6 @@ class ADERDG(base.SolverBase):
 		# Interpolate state at quad points
 		Uq = helpers.evaluate_state(Uc, basis_val_st) # [ne, nq_st, ns]
 
-		# Interpolate gradient of state at quad points
-		# gUq = solver_tools.evaluate_gradient(nq_tile_constant, Uc, 
-				# basis_phys_grad_elems)
-		gUq_ref = self.evaluate_gradient(Uc, 
-				basis_ref_grad_st[:, : , :-1])
-
-		ijac_elems_st = np.tile(ijac_elems, (1, nq_tile_constant, 1, 1))
-		gUq = self.ref_to_phys_grad(ijac_elems_st, gUq_ref)
-
 		if self.verbose:
 			# Get min and max of state variables for reporting
 			self.get_min_max_state(Uq)
@@ -589,6 +658,13 @@ class ADERDG(base.SolverBase):
 			Fq = physics.get_conv_flux_interior(Uq)[0] # [ne, nq, ns, ndims]
 			
 			if physics.diff_flux_fcn:
+				# Interpolate gradient of state at quad points. This is
+				# only needed by the diffusion flux.
+				gUq_ref = self.evaluate_gradient(Uc, 
+						basis_ref_grad_st[:, : , :-1])
+				gUq = self.ref_to_phys_grad(
+						elem_helpers_st.ijac_elems_tiled, gUq_ref)
+
 				# Evaluate the diffusion flux
 				Fq -= physics.get_diff_flux_interior(Uq, gUq)
 					# [ne, nq, ns, ndims]
@@ -596,7 +672,7 @@ class ADERDG(base.SolverBase):
 			res_elem += solver_tools.calculate_volume_flux_integral(
 					self, elem_helpers, elem_helpers_st, Fq) # [ne, nb, ns]
 
-		if sources:
+		if sources and physics.source_terms:
 			# Evaluate the source term integral
 
 			# Get array in physical time from ref time
@@ -606,8 +682,7 @@ class ADERDG(base.SolverBase):
 
 			# Evaluate the source term at the quadrature points
 			Sq = elem_helpers_st.Sq
-			
-			Sq[:] = 0. # [ne, nq, sr, ndims]
+			Sq.fill(0.) # [ne, nq, ns]
 			Sq = physics.eval_source_terms(Uq, x_elems_st, t, Sq)
 
 			res_elem += solver_tools.calculate_source_term_integral(
@@ -654,8 +729,9 @@ class ADERDG(base.SolverBase):
 		basis_valL_st = faces_to_basisL_st[faceL_id_st]
 		basis_valR_st = faces_to_basisR_st[faceR_id_st]
 
-		ijacL_elems = int_face_helpers.ijacL_elems
-		ijacR_elems = int_face_helpers.ijacR_elems
+		ijacL_elems_st = int_face_helpers_st.ijacL_elems_tiled
+		ijacR_elems_st = int_face_helpers_st.ijacR_elems_tiled
+		normals_int_faces = int_face_helpers_st.normals_int_faces_tiled
 
 		fluxes = self.params["ConvFluxSwitch"]
 
@@ -663,30 +739,18 @@ class ADERDG(base.SolverBase):
 		UqL = helpers.evaluate_state(UcL, basis_valL_st) # [nf, nq_st, ns]
 		UqR = helpers.evaluate_state(UcR, basis_valR_st) # [nf, nq_st, ns]
 
-		# Interpolate gradient of state at quad points
-		gUqL_ref = self.evaluate_gradient(UcL, 
-				faces_to_basis_ref_gradL_st[faceL_id_st, :, :, :-1])
-		gUqR_ref = self.evaluate_gradient(UcR, 
-				faces_to_basis_ref_gradR_st[faceR_id_st, :, :, :-1])
-
-		ijacL_elems_st = np.tile(ijacL_elems, (1, time_skip, 1, 1))
-		ijacR_elems_st = np.tile(ijacR_elems, (1, time_skip, 1, 1))
-
-		# Make gradient the physical gradient at L/R states
-		gUqL = self.ref_to_phys_grad(ijacL_elems_st, gUqL_ref)
-		gUqR = self.ref_to_phys_grad(ijacR_elems_st, gUqR_ref)
-
-		normals_int_faces = int_face_helpers.normals_int_faces
-		normals_int_faces = np.tile(normals_int_faces, 
-				(normals_int_faces.shape[1], 1))
+		gUqL, gUqR = None, None
+		if physics.diff_flux_fcn:
+			# Interpolate gradient of state at quad points
+			gUqL_ref = self.evaluate_gradient(UcL, 
+					faces_to_basis_ref_gradL_st[faceL_id_st, :, :, :-1])
+			gUqR_ref = self.evaluate_gradient(UcR, 
+					faces_to_basis_ref_gradR_st[faceR_id_st, :, :, :-1])
 
-		# Allocate resL/R and resL/R_diff (needed for operator splitting)
-		resL = np.zeros_like(self.stepper.res)
-		resR = np.zeros_like(self.stepper.res)
-		resL_diff = np.zeros_like(resL)
-		resR_diff = np.zeros_like(resR)
+			# Make gradient the physical gradient at L/R states
+			gUqL = self.ref_to_phys_grad(ijacL_elems_st, gUqL_ref)
+			gUqR = self.ref_to_phys_grad(ijacR_elems_st, gUqR_ref)
 
-		if physics.diff_flux_fcn:
 			# Calculate diffusion flux helpers
 			physics.diff_flux_fcn.compute_iface_helpers(self)
 		
@@ -695,29 +759,37 @@ class ADERDG(base.SolverBase):
 			Fq = physics.get_conv_flux_numerical(UqL, UqR, normals_int_faces)
 					# [nf, nq_st, ns]
 
-			# Compute diffusion flux
-			Fq_diff, FL, FR = physics.get_diff_flux_numerical(UqL, UqR,
-					gUqL, gUqR, normals_int_faces) # [nf, nq, ns], 
-					# [nf, nq, ns, ndims], [nf, nq, ns, ndims]
-			Fq -= Fq_diff
+			resL_diff, resR_diff = 0., 0.
+			if physics.diff_flux_fcn:
+				# Compute diffusion flux
+				Fq_diff, FL, FR = physics.get_diff_flux_numerical(UqL, UqR,
+						gUqL, gUqR, normals_int_faces) # [nf, nq, ns], 
+						# [nf, nq, ns, ndims], [nf, nq, ns, ndims]
+				Fq -= Fq_diff
+
+				FL_phys = self.ref_to_phys_grad(ijacL_elems_st, FL)
+				FR_phys = self.ref_to_phys_grad(ijacR_elems_st, FR)
+
+				# Compute additional boundary flux integrals for diffusion
+				# terms
+				resL_diff = self.calculate_boundary_flux_integral_sum(
+						time_skip, faces_to_basis_ref_gradL[faceL_IDs], 
+						quad_wts_st, FL_phys)
+				resR_diff = self.calculate_boundary_flux_integral_sum(
+						time_skip, faces_to_basis_ref_gradR[faceR_IDs],
+						quad_wts_st, FR_phys)
 
-			FL_phys = self.ref_to_phys_grad(ijacL_elems_st, FL)
-			FR_phys = self.ref_to_phys_grad(ijacR_elems_st, FR)
-			
 			# Compute contribution to left and right element residuals
 			resL = solver_tools.calculate_boundary_flux_integral(
 					time_skip, basis_valL, quad_wts_st, Fq)
 			resR = solver_tools.calculate_boundary_flux_integral(
 					time_skip, basis_valR, quad_wts_st, Fq)
-					
-			# Compute additional boundary flux integrals for diffusion terms
-			resL_diff = self.calculate_boundary_flux_integral_sum(
-					time_skip, faces_to_basis_ref_gradL[faceL_IDs], 
-					quad_wts_st, FL_phys)
-
-			resR_diff = self.calculate_boundary_flux_integral_sum(
-					time_skip, faces_to_basis_ref_gradR[faceR_IDs],
-					quad_wts_st, FR_phys)
+		else:
+			# Zero face contributions (needed for operator splitting)
+			resL = np.zeros([faceL_IDs.shape[0], basis_valL.shape[2], ns])
+			resR = np.zeros_like(resL)
+			resL_diff = np.zeros_like(resL)
+			resR_diff = np.zeros_like(resL)
 
 		return resL, resR, resL_diff, resR_diff # [nif, nb, ns]
 
@@ -752,11 +824,13 @@ class ADERDG(base.SolverBase):
 
 		basis_val = faces_to_basis[face_ID]
 		basis_val_st = faces_to_basis_st[face_ID_st]
-		basis_ref_grad_st = faces_to_basis_ref_grad_st[face_ID_st]
-		basis_ref_grad = faces_to_basis_ref_grad[face_ID]
-		xref_st = faces_to_xref_st[face_ID_st]
 		ijac = ijac_bgroups[bgroup_num]
 
+		# The boundary condition is applied at the temporal quadrature
+		# points of the first face, so only its reference coordinates
+		# are needed to build the time array
+		xref_st = faces_to_xref_st[face_ID_st[:1]] # [1, nq_st, ndims+1]
+
 		nq_st = quad_wts_st.shape[0]
 
 		# Get array in physical time from ref time
@@ -777,14 +851,6 @@ class ADERDG(base.SolverBase):
 		# Interpolate state at quadrature points
 		UqI = helpers.evaluate_state(Uc, basis_val_st) # [nbf, nq, ns]
 
-		# Interpolate gradient of state at quad points
-		gUq_ref = self.evaluate_gradient(Uc, basis_ref_grad_st[:, :, :, :-1])
-		# import code; code.interact(local=locals())
-		ijac_st = np.tile(ijac, (1, time_skip, 1, 1))
-
-		# Make ref gradient of state the physical gradient
-		gUq = self.ref_to_phys_grad(ijac_st, gUq_ref)
-
 		# Unpack normals and x on boundary faces
 		normals = normals_bgroups[bgroup_num]
 		x = x_bgroups[bgroup_num]
@@ -797,43 +863,54 @@ class ADERDG(base.SolverBase):
 		BC = physics.BCs[bgroup.name]
 		nbf = UqI.shape[0]
 		Fq = np.zeros([nbf, nq_st, ns])
-		FqB = np.zeros([nbf, nq_st, ns, ndims])
-		
-		# Need to allocate data for gradient when not using diffusion
-		if not physics.diff_flux_fcn:
-			gUq = np.zeros([Uc.shape[0], nq_st, ns, ndims])
 
-		# Compute any additional helpers for diffusive flux fcn
+		# The gradients of the basis are only gathered when needed for
+		# the diffusion flux
 		if physics.diff_flux_fcn:
-			physics.diff_flux_fcn.compute_bface_helpers(self, bgroup_num)
+			basis_ref_grad_st = faces_to_basis_ref_grad_st[face_ID_st]
+			basis_ref_grad = faces_to_basis_ref_grad[face_ID]
 
-		if fluxes:
-			# Loop over time to apply BC at each temporal quadrature point
-			for i in range(t.shape[1]):
-				# Need time to be constant not an array to work with 
-				# get_boundary_flux appropriately
-				t_ = time_t[:, i][0, 0]
-				x_ = x[:, i].reshape([nbf, 1, ndims])
-				normals_ = normals[:, i].reshape([nbf, 1, ndims])
+			# Interpolate gradient of state at quad points
+			gUq_ref = self.evaluate_gradient(Uc,
+					basis_ref_grad_st[:, :, :, :-1])
+			ijac_st = np.tile(ijac, (1, time_skip, 1, 1))
 
-				Fq_hold, FqB_hold = BC.get_boundary_flux(physics,
-						UqI[:, i, :].reshape([nbf, 1, ns]),
-						normals_, x_, t_, gUq=gUq[:, i, :, :].reshape(
-						[nbf, 1, ns, ndims]))
+			# Make ref gradient of state the physical gradient
+			gUq = self.ref_to_phys_grad(ijac_st, gUq_ref)
 
-				if not physics.diff_flux_fcn:
-					FqB_hold = np.zeros([nbf, ns, ndims])
+			FqB = np.zeros([nbf, nq_st, ns, ndims])
 
-				Fq[:, i, :] = Fq_hold.reshape([nbf, ns])
-				FqB[:, i, :, :] = FqB_hold.reshape([nbf, ns, ndims])
+			# Compute any additional helpers for diffusive flux fcn
+			physics.diff_flux_fcn.compute_bface_helpers(self, bgroup_num)
 
-			FqB_phys = self.ref_to_phys_grad(ijac_st, FqB)
+		if fluxes:
+			# Apply the BC once for each time value. All quadrature points
+			# that are assigned the same time in time_t are evaluated
+			# together since get_boundary_flux needs time to be a
+			# constant, not an array.
+			ntime = time.shape[1]
+			for k in range(ntime):
+				idx = slice(k, nq_st, ntime)
+				t_ = time_t[0, k, 0]
+
+				if physics.diff_flux_fcn:
+					Fq_hold, FqB_hold = BC.get_boundary_flux(physics,
+							UqI[:, idx, :], normals[:, idx], x[:, idx], t_,
+							gUq=gUq[:, idx])
+					FqB[:, idx, :, :] = FqB_hold
+				else:
+					Fq_hold, _ = BC.get_boundary_flux(physics,
+							UqI[:, idx, :], normals[:, idx], x[:, idx], t_)
+
+				Fq[:, idx, :] = Fq_hold
 
 			resB = solver_tools.calculate_boundary_flux_integral(
 					time_skip, basis_val, quad_wts_st, Fq) # [nbf, nb, ns]
 
-			resB -= self.calculate_boundary_flux_integral_sum(time_skip,
-				basis_ref_grad, quad_wts_st, FqB_phys)
+			if physics.diff_flux_fcn:
+				FqB_phys = self.ref_to_phys_grad(ijac_st, FqB)
+				resB -= self.calculate_boundary_flux_integral_sum(time_skip,
+					basis_ref_grad, quad_wts_st, FqB_phys)
 
 		return resB # [nbf, nb, ns]
 
@@ -865,16 +942,12 @@ class ADERDG(base.SolverBase):
 
 		elem_helpers = self.elem_helpers
 		elem_helpers_st = self.elem_helpers_st
-		djac_elems = elem_helpers.djac_elems
 		basis_ref_grad_st = elem_helpers_st.basis_ref_grad
-		ijac_elems = elem_helpers.ijac_elems
 		ader_helpers = self.ader_helpers
 		ijac_nodes = ader_helpers.ijac_elems
-		nq_t = self.elem_helpers_st.nq_tile_constant 
 
-		# Allocate flux coefficients
-		F = np.zeros([Up.shape[0], basis.get_num_basis_coeff(order),
-				ns, ndims], dtype=Up.dtype)
+		# Flux coefficients (every entry is set below)
+		F = ader_helpers.F
 
 		# Flux coefficient calc from interpolation or L2-projection
 		if InterpolateFluxADER:
@@ -899,7 +972,7 @@ class ADERDG(base.SolverBase):
 			quad_pts = elem_helpers.quad_pts
 			nq_st = quad_wts_st.shape[0]
 			nq = quad_wts.shape[0]
-			iMM_elems = ader_helpers.iMM_elems
+			proj_elems = ader_helpers.proj_elems
 
 			# Interpolate state at quadrature points
 			Uq = helpers.evaluate_state(Up, basis_val_st)
@@ -908,8 +981,8 @@ class ADERDG(base.SolverBase):
 			gUq_ref = self.evaluate_gradient(Up, 
 				basis_ref_grad_st[:, : , :-1])
 
-			ijac_elems_st = np.tile(ijac_elems, (1, nq_t, 1, 1))
-			gUq = self.ref_to_phys_grad(ijac_elems_st, gUq_ref)
+			gUq = self.ref_to_phys_grad(elem_helpers_st.ijac_elems_tiled,
+					gUq_ref)
 
 			# Evaluate the inviscid flux
 			Fq = physics.get_conv_flux_interior(Uq)[0]
@@ -918,11 +991,11 @@ class ADERDG(base.SolverBase):
 			if physics.diff_flux_fcn:
 				Fq -= physics.get_diff_flux_interior(Uq, gUq)
 				
-			# Project Fq to the space-time basis coefficients
-			for d in range(ndims):
-				solver_tools.L2_projection(mesh, iMM_elems, basis, quad_pts_st,
-						quad_wts_st, np.tile(djac_elems, (nq_t, 1)),
-						Fq[:, :, :, d], F[:, :, :, d])
+			# Project Fq to the space-time basis coefficients, for all
+			# dimensions at once
+			ne, nq_st, ns, _ = Fq.shape
+			F[:] = np.matmul(proj_elems, Fq.reshape(ne, nq_st,
+					ns*ndims)).reshape(F.shape)
 
 		return F*dt/2.0 # [ne, nb_st, ns, ndims]
 
@@ -952,10 +1025,6 @@ class ADERDG(base.SolverBase):
 
 		elem_helpers = self.elem_helpers
 		elem_helpers_st = self.elem_helpers_st
-		djac_elems = elem_helpers.djac_elems
-		x_elems = elem_helpers.x_elems
-
-		nq_t = self.elem_helpers_st.nq_tile_constant 
 
 		ader_helpers = self.ader_helpers
 		x_elems_ader = ader_helpers.x_elems
@@ -971,8 +1040,9 @@ class ADERDG(base.SolverBase):
 					xnodes[:, -1:], elem_helpers_st.basis_time)
 
 			# Evaluate the source term at the quadrature points
-			Sq = np.zeros([Up.shape[0], t.shape[0], ns])
-			S = np.zeros_like(Sq)
+			Sq = ader_helpers.Sq
+			Sq[:] = 0.
+			S = ader_helpers.S
 			Sq = physics.eval_source_terms(Up, x_elems_ader, t, Sq)
 
 			# Interpolate source coefficient to nodes
@@ -987,26 +1057,25 @@ class ADERDG(base.SolverBase):
 			quad_pts_st = elem_helpers_st.quad_pts
 			nq_st = quad_wts_st.shape[0]
 			nq = quad_wts.shape[0]
-			iMM_elems = ader_helpers.iMM_elems
+			proj_elems = ader_helpers.proj_elems
 
 			# Interpolate state at quadrature points
 			Uq = helpers.evaluate_state(Up, basis_val_st)
-			x_elems_st = np.tile(x_elems, [1, nq_t, 1])
+			x_elems_st = elem_helpers_st.x_elems_tiled
 			# Get array in physical time from ref time
-			t = np.zeros([nq_st, ndims])
 			t, elem_helpers_st.basis_time = solver_tools.ref_to_phys_time(
 					mesh, self.time, self.stepper.dt,
 					quad_pts_st[:, -1:], elem_helpers_st.basis_time)
 
 			# Evaluate the source term at the quadrature points
-			Sq = np.zeros_like(Uq)
-			S = np.zeros([Uq.shape[0], nb_st, ns])
+			Sq = elem_helpers_st.Sq
+			Sq[:] = 0.
+			S = ader_helpers.S
 			Sq = physics.eval_source_terms(Uq, x_elems_st, t, Sq)
 				# [ne, nq, ns, ndims]
 
 			# Project Sq to the space-time basis coefficients
-			solver_tools.L2_projection(mesh, iMM_elems, basis, quad_pts_st,
-					quad_wts_st, np.tile(djac_elems, (nq_t, 1)), Sq, S)
+			S[:] = np.matmul(proj_elems, Sq)
 			
 
 		return S*dt/2.0 # [ne, nb_st, ns]
@@ -21,6 +21,7 @@
 #
 # ------------------------------------------------------------------------ #
 from abc import ABC, abstractmethod
+import hashlib
 import numpy as np
 import time
 
@@ -38,6 +39,10 @@ import numerics.timestepping.stepper as stepper_defs
 import solver.base as base
 import solver.tools as solver_tools
 
+SUM_FACTORIZATION_MIN_ORDER = 6 # minimum solution order for which the
+	# element states of tensor-product bases are evaluated with sum
+	# factorization
+
 
 class ElemHelpers(object):
 	'''
@@ -53,12 +58,26 @@ class ElemHelpers(object):
 		values for the weights of each quadrature point
 	basis_val: numpy array
 		stores the evaluated basis function
+	basis_val_T: numpy array
+		contiguous transpose of basis_val
+	basis_val_1D: numpy array
+		1D factor of basis_val for tensor-product bases of high order
+		(None otherwise)
 	basis_ref_grad: numpy array
 		stores the evaluated basis function's gradient for the reference
 		element
 	basis_phys_grad_elems: numpy array
 		stores the evaluated basis function's gradient for each individual
 		physical element
+	basis_phys_grad_elems_T: numpy array
+		basis_phys_grad_elems with the basis axis first
+	basis_ref_grad_T: numpy array
+		basis_ref_grad with the basis axis first (only used if the
+		physical gradients are not stored)
+	store_phys_grad: bool
+		if False, the physical basis gradients are not stored for each
+		element but obtained from basis_ref_grad and ijac_elems when
+		needed
 	jac_elems: numpy array
 		stores the evaluated geometric Jacobian for each element
 	ijac_elems: numpy array
@@ -77,6 +96,9 @@ class ElemHelpers(object):
 		source vector evaluated at the quadrature points
 	iMM_elems: numpy array
 		stores the inverse mass matrix for each element
+	proj_elems: numpy array
+		stores the L2 projection operator from the quadrature points to
+		the basis coefficients for each element
 	vol_elems: numpy array
 		stores the volume of each element
 	normals_elems: numpy array
@@ -97,13 +119,24 @@ class ElemHelpers(object):
 		at the quadrature points
 	compute_helpers
 		call the functions to precompute the necessary helper data
+	compute_helpers_cached
+		same as compute_helpers, but with the data cached in a file
+	get_cache_key
+		computes the key under which the helper data is cached
+	set_precision
+		sets the precision of the basis gradients used in the volume
+		flux integral
 	'''
 	def __init__(self):
 		self.quad_pts = np.zeros(0)
 		self.quad_wts = np.zeros(0)
 		self.basis_val = np.zeros(0)
+		self.basis_val_T = np.zeros(0)
+		self.basis_val_1D = None
 		self.basis_ref_grad = np.zeros(0)
 		self.basis_phys_grad_elems = np.zeros(0)
+		self.basis_phys_grad_elems_T = np.zeros(0)
+		self.basis_ref_grad_T = np.zeros(0)
 		self.jac_elems = np.zeros(0)
 		self.ijac_elems = np.zeros(0)
 		self.djac_elems = np.zeros(0)
@@ -112,10 +145,12 @@ class ElemHelpers(object):
 		self.Fq = np.zeros(0)
 		self.Sq = np.zeros(0)
 		self.iMM_elems = np.zeros(0)
+		self.proj_elems = np.zeros(0)
 		self.vol_elems = np.zeros(0)
 		self.normals_elems = np.zeros(0)
 		self.domain_vol = 0.
 		self.need_phys_grad = True
+		self.store_phys_grad = True
 
 	def get_gaussian_quadrature(self, mesh, physics, basis, order):
 		'''
@@ -156,10 +191,20 @@ class ElemHelpers(object):
 		Outputs:
 		--------
 			self.basis_val: precomputed basis value [nq, nb]
+			self.basis_val_T: contiguous transpose of the basis value
+				[nb, nq]
+			self.basis_val_1D: 1D factor of the basis value, used for
+				sum factorization [nq_1D, order + 1]
 			self.basis_ref_grad: precomputed basis gradient for the
 				reference element [nq, nb, ndims]
 			self.basis_phys_grad_elems: precomputed basis gradient for each
 				physical element [num_elems, nq, nb, ndims]
+			self.basis_phys_grad_elems_T: precomputed basis gradient for
+				each physical element with the basis axis first
+				[num_elems, nb, nq, ndims]
+			self.basis_ref_grad_T: reference basis gradient with the
+				basis axis first [nb, nq, ndims] (if store_phys_grad is
+				False, in which case the two arrays above are None)
 			self.jac_elems: precomputed Jacobian for each element
 				[num_elems, nq, ndims, ndims]
 			self.ijac_elems: precomputed inverse Jacobian for each element
@@ -176,11 +221,6 @@ class ElemHelpers(object):
 		nb = basis.nb
 
 		# Allocate
-		self.jac_elems = np.zeros([num_elems, nq, ndims, ndims])
-		self.ijac_elems = np.zeros([num_elems, nq, ndims, ndims])
-		self.djac_elems = np.zeros([num_elems, nq, 1])
-		self.x_elems = np.zeros([num_elems, nq, ndims])
-		self.basis_phys_grad_elems = np.zeros([num_elems, nq, nb, basis.NDIMS])
 		self.normals_elems = np.empty([num_elems, mesh.gbasis.NFACES,
 			self.face_quad_pts.shape[0], ndims])
 
@@ -189,33 +229,56 @@ class ElemHelpers(object):
 				get_ref_grad=True)
 
 		self.basis_val = basis.basis_val
+		self.basis_val_T = np.ascontiguousarray(self.basis_val.transpose())
+
+		# Sum factorization only pays off at high order
+		if order >= SUM_FACTORIZATION_MIN_ORDER:
+			self.basis_val_1D = basis_tools.get_tensor_product_factor(
+					basis, quad_pts, self.basis_val)
 		self.basis_ref_grad = basis.basis_ref_grad
 
-		for elem_ID in range(mesh.num_elems):
-			# Jacobian
-			djac, jac, ijac = basis_tools.element_jacobian(mesh, elem_ID,
-					quad_pts, get_djac=True, get_jac=True, get_ijac=True)
-			# Store
-			self.jac_elems[elem_ID] = jac
-			self.ijac_elems[elem_ID] = ijac
-			self.djac_elems[elem_ID] = djac
-
-			# Physical coordinates of quadrature points
-			x = mesh_tools.ref_to_phys(mesh, elem_ID, quad_pts)
-			# Store
-			self.x_elems[elem_ID] = x
-
-			if self.need_phys_grad:
-				# Physical gradient
-				basis.get_basis_val_grads(quad_pts, get_phys_grad=True,
-						ijac=ijac)
-				self.basis_phys_grad_elems[elem_ID] = basis.basis_phys_grad
-					# [nq, nb, ndims]
-
-			# Face normals
-			for i in range(mesh.gbasis.NFACES):
-				self.normals_elems[elem_ID, i] = mesh.gbasis.calculate_normals(
-						mesh, elem_ID, i, self.face_quad_pts)
+		# Jacobians of all elements
+		self.djac_elems, self.jac_elems, self.ijac_elems = \
+				basis_tools.element_jacobians(mesh, quad_pts, get_djac=True,
+				get_jac=True, get_ijac=True)
+
+		# Physical coordinates of quadrature points
+		mesh.gbasis.get_basis_val_grads(quad_pts, get_val=True)
+		elem_coords = mesh.node_coords[mesh.elem_to_node_IDs]
+			# [num_elems, nb, ndims]
+		self.x_elems = np.matmul(mesh.gbasis.basis_val, elem_coords)
+
+		if self.need_phys_grad and not self.store_phys_grad:
+			# Physical gradients are evaluated from the reference
+			# gradients and the inverse Jacobians when needed
+			self.basis_phys_grad_elems = None
+			self.basis_phys_grad_elems_T = None
+			self.basis_ref_grad_T = np.ascontiguousarray(
+					self.basis_ref_grad.transpose(1, 0, 2))
+					# [nb, nq, ndims]
+		elif self.need_phys_grad:
+			# Physical gradient
+			self.basis_phys_grad_elems = np.matmul(
+					self.ijac_elems.transpose(0, 1, 3, 2),
+					self.basis_ref_grad.transpose(0, 2, 1)).transpose(
+					0, 1, 3, 2) # [num_elems, nq, nb, ndims]
+
+			# Physical gradient with the basis axis first so that the
+			# volume flux integral is a single matrix multiply per
+			# element
+			self.basis_phys_grad_elems_T = np.ascontiguousarray(
+					self.basis_phys_grad_elems.transpose(0, 2, 1, 3))
+					# [num_elems, nb, nq, ndims]
+		else:
+			self.basis_phys_grad_elems = np.zeros([num_elems, nq, nb,
+					basis.NDIMS])
+
+		# Face normals of all elements
+		nfaces_per_elem = mesh.gbasis.NFACES
+		elem_IDs, face_IDs = np.meshgrid(np.arange(num_elems),
+				np.arange(nfaces_per_elem), indexing='ij')
+		self.normals_elems[:] = mesh.gbasis.calculate_normals(mesh,
+				elem_IDs, face_IDs, self.face_quad_pts)
 
 		# Volumes
 		self.vol_elems, self.domain_vol = mesh_tools.element_volumes(mesh)
@@ -258,12 +321,117 @@ class ElemHelpers(object):
 		--------
 			self.iMM_elems: precomputed inverse mass matrix for each element
 				[mesh.num_elems, nb, nb]
+			self.proj_elems: precomputed L2 projection operator from the
+				quadrature points to the basis coefficients for each
+				element [mesh.num_elems, nb, nq]
 		'''
 		self.get_gaussian_quadrature(mesh, physics, basis, order)
 		self.get_basis_and_geom_data(mesh, basis, order)
 		self.alloc_other_arrays(physics, basis, order)
 		self.iMM_elems = basis_tools.get_inv_mass_matrices(mesh,
 				basis, order)
+		self.proj_elems = solver_tools.get_projection_operators(
+				self.iMM_elems, self.basis_val, self.quad_wts,
+				self.djac_elems)
+
+	def compute_helpers_cached(self, mesh, physics, basis, order,
+			cache_file):
+		'''
+		Same as compute_helpers, except that the precomputed data is
+		loaded from the given cache file if it was computed for the same
+		mesh and discretization. Otherwise, the data is computed and
+		written to the cache file.
+
+		Inputs:
+		-------
+			mesh: mesh object
+			physics: physics object
+			basis: basis object
+			order: solution order
+			cache_file: path of the cache file (numpy .npz format)
+
+		Notes:
+		------
+			The cache is keyed by a hash of the mesh, the basis, the
+			quadrature points, and the solution order
+		'''
+		# Work arrays are reallocated rather than cached
+		work_arrays = ["Uq", "Fq", "Sq"]
+
+		self.get_gaussian_quadrature(mesh, physics, basis, order)
+		key = self.get_cache_key(mesh, basis, order)
+
+		try:
+			with np.load(cache_file) as data:
+				if str(data["key"]) == key:
+					for name in data["none_attrs"]:
+						setattr(self, name, None)
+					for name in data.files:
+						if name in ["key", "none_attrs"]:
+							continue
+						value = data[name]
+						if value.ndim == 0:
+							value = value.item()
+						setattr(self, name, value)
+					self.alloc_other_arrays(physics, basis, order)
+					return
+		except (FileNotFoundError, KeyError, ValueError):
+			pass
+
+		self.compute_helpers(mesh, physics, basis, order)
+
+		arrays = {name : value for name, value in vars(self).items()
+				if isinstance(value, (np.ndarray, float))
+				and name not in work_arrays}
+		none_attrs = [name for name, value in vars(self).items()
+				if value is None]
+		with open(cache_file, "wb") as f:
+			np.savez(f, key=key, none_attrs=np.array(none_attrs, dtype=str),
+					**arrays)
+
+	def get_cache_key(self, mesh, basis, order):
+		'''
+		Computes the key under which the helper data is cached
+
+		Inputs:
+		-------
+			mesh: mesh object
+			basis: basis object
+			order: solution order
+
+		Outputs:
+		--------
+			key: hexadecimal hash string
+		'''
+		h = hashlib.sha1()
+		h.update(repr((type(mesh.gbasis).__name__, mesh.gorder,
+				type(basis).__name__, order, basis.get_1d_nodes.__name__,
+				self.need_phys_grad, self.store_phys_grad)).encode())
+		for array in [mesh.node_coords, mesh.elem_to_node_IDs,
+				self.quad_pts, self.quad_wts, self.face_quad_pts]:
+			h.update(np.ascontiguousarray(array).tobytes())
+
+		return h.hexdigest()
+
+	def set_precision(self, precision):
+		'''
+		Sets the floating-point precision in which the physical basis
+		gradients used in the volume flux integral are stored
+
+		Inputs:
+		-------
+			precision: "float32" or "float64"
+
+		Outputs:
+		--------
+			self.basis_phys_grad_elems_T: cast to the given precision
+		'''
+		if precision not in ["float32", "float64"]:
+			raise errors.IncompatibleError
+		if self.basis_phys_grad_elems_T is None:
+			return
+		self.basis_phys_grad_elems_T = \
+				self.basis_phys_grad_elems_T.astype(precision, copy=False)
 
 
 class InteriorFaceHelpers(ElemHelpers):
@@ -311,6 +479,12 @@ class InteriorFaceHelpers(ElemHelpers):
 		face IDs to the left of each interior face
 	faceR_IDs: numpy array
 		face IDs to the right of each interior face
+	scatterL_IDs: numpy array
+		flattened indices into the residual array of each entry of the
+		left element residuals of the interior faces
+	scatterR_IDs: numpy array
+		flattened indices into the residual array of each entry of the
+		right element residuals of the interior faces
 	ijacL_elems: numpy array
 		stores the evaluated inverse of the geometric Jacobian for each
 		left element
@@ -330,6 +504,9 @@ class InteriorFaceHelpers(ElemHelpers):
 	alloc_other_arrays
 		allocate the solution and flux vectors that are evaluated
 		at the quadrature points
+	store_scatter_indices
+		precomputes the indices used to add the face residuals to the
+		element residuals
 	compute_helpers
 		call the functions to precompute the necessary helper data
 	'''
@@ -348,6 +525,8 @@ class InteriorFaceHelpers(ElemHelpers):
 		self.elemR_IDs = np.empty(0, dtype=int)
 		self.faceL_IDs = np.empty(0, dtype=int)
 		self.faceR_IDs = np.empty(0, dtype=int)
+		self.scatterL_IDs = np.empty(0, dtype=int)
+		self.scatterR_IDs = np.empty(0, dtype=int)
 		self.ijacL_elems = np.zeros(0)
 		self.ijacR_elems = np.zeros(0)
 
@@ -415,6 +594,8 @@ class InteriorFaceHelpers(ElemHelpers):
 			and mesh to have different number of dimensions
 			(ex: when using a space-time basis function and 
 			only a spatial mesh)
+
+			Requires the neighbor info from store_neighbor_info
 		'''
 		ndims_basis = basis.NDIMS 
 		ndims = mesh.ndims
@@ -438,54 +619,57 @@ class InteriorFaceHelpers(ElemHelpers):
 		self.ijacR_elems = np.zeros([nfaces, nq, ndims, ndims])
 		self.normals_int_faces = np.zeros([mesh.num_interior_faces, nq,
 				ndims])
-		djac_faces = np.zeros([mesh.num_interior_faces, nq])
 
 		# Get values on each face (from both left and right perspectives) 
-		# for both the basis and the reference gradient of the basis
+		# for both the basis and the reference gradient of the basis.
+		# The right perspective uses the quadrature points in reverse
+		# order, so its values are the left values with the quadrature
+		# point axis reversed.
+		elem_pts_faces = []
 		for face_ID in range(nfaces_per_elem):
-			# Left
 			basis.get_basis_face_val_grads(mesh, face_ID, quad_pts,
 					get_val=True, get_ref_grad=True)
 			self.faces_to_basisL[face_ID] = basis.basis_val
 			self.faces_to_basis_ref_gradL[face_ID] = basis.basis_ref_grad
 
-			# Right
-			basis.get_basis_face_val_grads(mesh, face_ID, quad_pts[::-1],
-					get_val=True, get_ref_grad=True)
-			self.faces_to_basisR[face_ID] = basis.basis_val
-			self.faces_to_basis_ref_gradR[face_ID] = basis.basis_ref_grad
+			# Face quadrature points in element reference space
+			elem_pts_faces.append(basis.get_elem_ref_from_face_ref(
+					face_ID, quad_pts))
+
+		self.faces_to_basisR[:] = self.faces_to_basisL[:, ::-1]
+		self.faces_to_basis_ref_gradR[:] = \
+				self.faces_to_basis_ref_gradL[:, ::-1]
 
-		# Normals
-		i = 0
-		for interior_face in mesh.interior_faces:
-			normals = mesh.gbasis.calculate_normals(mesh,
-					interior_face.elemL_ID, interior_face.faceL_ID, quad_pts)
-			self.normals_int_faces[i] = normals
+		elemL_IDs = self.elemL_IDs
+		faceL_IDs = self.faceL_IDs
+		elemR_IDs = self.elemR_IDs
+		faceR_IDs = self.faceR_IDs
 
+		# Normals of all interior faces (from the left perspective)
+		self.normals_int_faces[:] = mesh.gbasis.calculate_normals(mesh,
+				elemL_IDs, faceL_IDs, quad_pts)
+
+		# Inverse Jacobians, evaluated for all faces sharing a reference
+		# face at once
+		for face_ID in range(nfaces_per_elem):
 			# Left state
-			# Convert from face ref space to element ref space
-			elem_pts = basis.get_elem_ref_from_face_ref(
-					interior_face.faceL_ID, quad_pts)
-
-			_, _, ijacL = basis_tools.element_jacobian(mesh, 
-					interior_face.elemL_ID, elem_pts, get_djac=False,
-					get_jac=False, get_ijac=True)
-
-			# Right state
-			# Convert from face ref space to element ref space
-			elem_pts = basis.get_elem_ref_from_face_ref(
-					interior_face.faceR_ID, quad_pts[::-1])
-			_, _, ijacR = basis_tools.element_jacobian(mesh, 
-					interior_face.elemR_ID, elem_pts, get_djac=False,
-					get_jac=False, get_ijac=True)
-
-			# Store
-			self.ijacL_elems[i] = ijacL
-			self.ijacR_elems[i] = ijacR
-
-			# Used for face_length calculations
-			djac_faces[i] = np.linalg.norm(normals, axis=1)
-			i += 1
+			idx = np.where(faceL_IDs == face_ID)[0]
+			if idx.shape[0] > 0:
+				_, _, self.ijacL_elems[idx] = basis_tools.element_jacobians(
+						mesh, elem_pts_faces[face_ID], get_ijac=True,
+						elem_IDs=elemL_IDs[idx])
+
+			# Right state. As for the basis values, the right perspective
+			# is the left one with the quadrature point axis reversed.
+			idx = np.where(faceR_IDs == face_ID)[0]
+			if idx.shape[0] > 0:
+				_, _, ijacR = basis_tools.element_jacobians(mesh,
+						elem_pts_faces[face_ID], get_ijac=True,
+						elem_IDs=elemR_IDs[idx])
+				self.ijacR_elems[idx] = ijacR[:, ::-1]
+
+		# Used for face_length calculations
+		djac_faces = np.linalg.norm(self.normals_int_faces, axis=2)
 
 		self.face_lengths = mesh_tools.get_face_lengths(djac_faces, quad_wts)
 		
@@ -527,22 +711,47 @@ class InteriorFaceHelpers(ElemHelpers):
 			self.faceR_IDs: Face IDs to the right of each interior face
 				[num_interior_faces]
 		'''
-		self.elemL_IDs = np.empty(mesh.num_interior_faces, dtype=int)
-		self.elemR_IDs = np.empty(mesh.num_interior_faces, dtype=int)
-		self.faceL_IDs = np.empty(mesh.num_interior_faces, dtype=int)
-		self.faceR_IDs = np.empty(mesh.num_interior_faces, dtype=int)
-		for face_ID in range(mesh.num_interior_faces):
-			int_face = mesh.interior_faces[face_ID]
-			self.elemL_IDs[face_ID] = int_face.elemL_ID
-			self.elemR_IDs[face_ID] = int_face.elemR_ID
-			self.faceL_IDs[face_ID] = int_face.faceL_ID
-			self.faceR_IDs[face_ID] = int_face.faceR_ID
+		self.elemL_IDs, self.faceL_IDs, self.elemR_IDs, self.faceR_IDs = \
+				mesh.get_interior_face_IDs()
+
+	def store_scatter_indices(self, physics, basis, order):
+		'''
+		Precomputes, for each entry of the left and right element
+		residuals of the interior faces, its index into the flattened
+		residual array. The face residuals are then added to the element
+		residuals with np.bincount, which sums the contributions of all
+		faces of an element in one buffered pass (unlike np.add.at).
+
+		Inputs:
+		-------
+			physics: physics object
+			basis: basis object
+			order: solution order
+
+		Outputs:
+		--------
+			self.scatterL_IDs: flattened residual indices for the left
+				elements [num_interior_faces*nb*ns]
+			self.scatterR_IDs: flattened residual indices for the right
+				elements [num_interior_faces*nb*ns]
+		'''
+		nb = basis.get_num_basis_coeff(order)
+		ns = physics.NUM_STATE_VARS
+
+		# Index of entry [0, 0] of each element, offset by the index of
+		# each entry within the element
+		entry_IDs = np.arange(nb*ns)
+		self.scatterL_IDs = (self.elemL_IDs[:, np.newaxis]*nb*ns +
+				entry_IDs).reshape(-1)
+		self.scatterR_IDs = (self.elemR_IDs[:, np.newaxis]*nb*ns +
+				entry_IDs).reshape(-1)
 
 	def compute_helpers(self, mesh, physics, basis, order):
 		self.get_gaussian_quadrature(mesh, physics, basis, order)
+		self.store_neighbor_info(mesh)
+		self.store_scatter_indices(physics, basis, order)
 		self.get_basis_and_geom_data(mesh, basis, order)
 		self.alloc_other_arrays(physics, basis, order)
-		self.store_neighbor_info(mesh)
 
 
 class BoundaryFaceHelpers(InteriorFaceHelpers):
@@ -566,16 +775,31 @@ class BoundaryFaceHelpers(InteriorFaceHelpers):
 	faces_to_xref: numpy array
 		coordinates of quadrature points of each face converted to
 		element reference space
+	bgroup_offsets: numpy array
+		offsets of each boundary group into the arrays over all boundary
+		faces; the last entry is the total number of boundary faces
+	normals_bfaces: numpy array
+		normal vector array for all boundary faces
+	x_bfaces: numpy array
+		coordinates of the quadrature points in physical space at all
+		boundary faces
+	ijac_bfaces: numpy array
+		inverse of the geometric Jacobian of the interior element of all
+		boundary faces
+	face_lengths_bfaces: numpy array
+		precomputed face lengths of all boundary faces
 	normals_bgroups: list of numpy arrays
-		normal vector array for each boundary face
+		normal vector array for each boundary face (views into
+		normals_bfaces)
 	x_bgroups: list of numpy arrays
 		coordinates of the quadrature points in physical space at the
-		boundary face	
+		boundary face (views into x_bfaces)
 	ijac_bgroups: list of numpy arrays
 		stores the evaluated inverse of the geometric Jacobian for each
-		interior boundary element
+		interior boundary element (views into ijac_bfaces)
 	face_lengths_bgroups: list of numpy arrays
 		stores the precomputed face lengths for each boundary face
+		(views into face_lengths_bfaces)
 	UqI: numpy array
 		values of interior state at the quadrature points
 	UqB: numpy array
@@ -588,6 +812,9 @@ class BoundaryFaceHelpers(InteriorFaceHelpers):
 	face_IDs: list of numpy arrays 
 		list containing arrays of face IDs of boundary
 		face neighbors for each boundary group
+	groups_bgroups: list of lists of numpy arrays
+		indices of the boundary faces with each face ID, for each
+		boundary group
 
 	Methods:
 	--------
@@ -605,6 +832,11 @@ class BoundaryFaceHelpers(InteriorFaceHelpers):
 		self.quad_wts = np.zeros(0)
 		self.faces_to_basis = np.zeros(0)
 		self.faces_to_xref = np.zeros(0)
+		self.bgroup_offsets = np.zeros(0, dtype=int)
+		self.normals_bfaces = np.zeros(0)
+		self.x_bfaces = np.zeros(0)
+		self.ijac_bfaces = np.zeros(0)
+		self.face_lengths_bfaces = np.zeros(0)
 		self.normals_bgroups = []
 		self.x_bgroups = []
 		self.ijac_bgroups = []
@@ -614,6 +846,7 @@ class BoundaryFaceHelpers(InteriorFaceHelpers):
 		self.Fq = np.zeros(0)
 		self.elem_IDs = []
 		self.face_IDs = []
+		self.groups_bgroups = []
 
 	def get_basis_and_geom_data(self, mesh, basis, order):
 		'''
@@ -635,6 +868,11 @@ class BoundaryFaceHelpers(InteriorFaceHelpers):
 			self.faces_to_xref: coordinates of quadrature points of each
 				face converted to element reference space
 				[nfaces_per_elem, nq, ndims]		
+			self.bgroup_offsets: offsets of each boundary group into the
+				arrays over all boundary faces [num_boundary_groups + 1]
+			self.normals_bfaces, self.x_bfaces, self.ijac_bfaces,
+				self.face_lengths_bfaces: geometric data of all boundary
+				faces, of which the per-group arrays below are views
 			self.normals_bgroups: precomputed normal vectors at each
 				boundary face [num_boundary_faces, nq, ndims]
 			self.x_bgroups: precomputed physical coordinates of the
@@ -643,6 +881,10 @@ class BoundaryFaceHelpers(InteriorFaceHelpers):
 				Jacobian for each interior element 	
 			self.face_lengths_bgroups: stores the precomputed length of each face
 				[num_interior_faces, 1]
+
+		Notes:
+		------
+			Requires the neighbor info from store_neighbor_info
 		'''
 		ndims = mesh.ndims
 		quad_pts = self.quad_pts
@@ -666,51 +908,63 @@ class BoundaryFaceHelpers(InteriorFaceHelpers):
 			self.faces_to_basis[face_ID] = basis.basis_val
 			self.faces_to_basis_ref_grad[face_ID] = basis.basis_ref_grad
 
-		# Get boundary information
-		i = 0
-		for bgroup in mesh.boundary_groups.values():
-			self.normals_bgroups.append(np.zeros([bgroup.num_boundary_faces,
-					nq, ndims]))
-			self.x_bgroups.append(np.zeros([bgroup.num_boundary_faces,
-					nq, ndims]))
-			self.ijac_bgroups.append(np.zeros([bgroup.num_boundary_faces,
-					nq, ndims, ndims]))
-			self.face_lengths_bgroups.append(np.zeros([
-					bgroup.num_boundary_faces, 1]))
-
-			normal_bgroup = self.normals_bgroups[i]
-			x_bgroup = self.x_bgroups[i]
-			ijac_bgroup = self.ijac_bgroups[i]
-			face_lengths_bgroup = self.face_lengths_bgroups[i]
-
-			j = 0
-			for boundary_face in bgroup.boundary_faces:
-				# Normals
-				normals = mesh.gbasis.calculate_normals(mesh,
-						boundary_face.elem_ID,
-						boundary_face.face_ID, quad_pts)
-				elem_pts = basis.get_elem_ref_from_face_ref(
-						boundary_face.face_ID, quad_pts)
-				djac, jac, ijac = basis_tools.element_jacobian(mesh, 
-					boundary_face.elem_ID, elem_pts, get_djac=True,
-					get_jac=True, get_ijac=True)
-
-				normal_bgroup[j] = normals
-				ijac_bgroup[j] = ijac
-				djac_faces = np.linalg.norm(normals, axis=1)
-				face_lengths_bgroup[j] = mesh_tools.get_face_lengths(
-						djac_faces.reshape([1, nq]), quad_wts)
-
-				# Physical coordinates of quadrature points
-				x = mesh_tools.ref_to_phys(mesh, boundary_face.elem_ID,
-						self.faces_to_xref[boundary_face.face_ID])
-				# Store
-				x_bgroup[j] = x
-
-				# Increment
-				j += 1
-			i += 1
-
+		# Allocate the geometric data of all boundary faces in single
+		# arrays. The data of each boundary group is a contiguous slice,
+		# starting at the group's offset.
+		num_bfaces = [bgroup.num_boundary_faces for bgroup in
+				mesh.boundary_groups.values()]
+		self.bgroup_offsets = np.zeros(len(num_bfaces) + 1, dtype=int)
+		self.bgroup_offsets[1:] = np.cumsum(num_bfaces)
+		total_bfaces = self.bgroup_offsets[-1]
+
+		self.normals_bfaces = np.zeros([total_bfaces, nq, ndims])
+		self.x_bfaces = np.zeros([total_bfaces, nq, ndims])
+		self.ijac_bfaces = np.zeros([total_bfaces, nq, ndims, ndims])
+		self.face_lengths_bfaces = np.zeros([total_bfaces, 1])
+
+		# Per-group views into the above arrays
+		for i in range(len(num_bfaces)):
+			bslice = slice(self.bgroup_offsets[i], self.bgroup_offsets[i+1])
+			self.normals_bgroups.append(self.normals_bfaces[bslice])
+			self.x_bgroups.append(self.x_bfaces[bslice])
+			self.ijac_bgroups.append(self.ijac_bfaces[bslice])
+			self.face_lengths_bgroups.append(
+					self.face_lengths_bfaces[bslice])
+
+		if total_bfaces == 0:
+			return
+
+		# Element and reference face IDs of all boundary faces, in the
+		# same order as the arrays above
+		elem_IDs = np.concatenate(self.elem_IDs)
+		face_IDs = np.concatenate(self.face_IDs)
+
+		# Normals of all boundary faces
+		self.normals_bfaces[:] = mesh.gbasis.calculate_normals(mesh,
+				elem_IDs, face_IDs, quad_pts)
+
+		# Inverse Jacobians and physical coordinates of quadrature
+		# points, evaluated for all boundary faces sharing a reference
+		# face at once
+		for face_ID in range(nfaces_per_elem):
+			idx = np.where(face_IDs == face_ID)[0]
+			if idx.shape[0] == 0:
+				continue
+			elem_pts = self.faces_to_xref[face_ID]
+			_, _, ijac = basis_tools.element_jacobians(mesh,
+					elem_pts, get_djac=True, get_jac=True,
+					get_ijac=True, elem_IDs=elem_IDs[idx])
+			self.ijac_bfaces[idx] = ijac
+
+			mesh.gbasis.get_basis_val_grads(elem_pts, get_val=True)
+			elem_coords = mesh.node_coords[
+					mesh.elem_to_node_IDs[elem_IDs[idx]]]
+			self.x_bfaces[idx] = np.matmul(mesh.gbasis.basis_val,
+					elem_coords)
+
+		djac_faces = np.linalg.norm(self.normals_bfaces, axis=2)
+		self.face_lengths_bfaces[:] = mesh_tools.get_face_lengths(
+				djac_faces, quad_wts)
 
 	def alloc_other_arrays(self, physics, basis, order):
 		'''
@@ -748,23 +1002,30 @@ class BoundaryFaceHelpers(InteriorFaceHelpers):
 			self.face_IDs: List containing arrays of face IDs of boundary
 			face neighbors for each boundary group
 			[num_boundary_groups][num_interior_faces]
+			self.groups_bgroups: List containing, for each boundary group,
+			the indices of the boundary faces with each face ID
+			[num_boundary_groups][nfaces_per_elem]
 		'''
+		nfaces_per_elem = mesh.gbasis.NFACES
+
 		# Loop through boundary groups
 		for bgroup in mesh.boundary_groups.values():
-			bgroup_elem_IDs = np.empty(bgroup.num_boundary_faces, dtype=int)
-			bgroup_face_IDs = np.empty(bgroup.num_boundary_faces, dtype=int)
-			for bface_ID in range(bgroup.num_boundary_faces):
-				boundary_face = bgroup.boundary_faces[bface_ID]
-				bgroup_elem_IDs[bface_ID] = boundary_face.elem_ID
-				bgroup_face_IDs[bface_ID] = boundary_face.face_ID
+			bgroup_elem_IDs, bgroup_face_IDs = \
+					bgroup.get_boundary_face_IDs()
 			self.elem_IDs.append(bgroup_elem_IDs)
 			self.face_IDs.append(bgroup_face_IDs)
 
+			# As for the interior faces, the boundary faces in each of
+			# these groups have no duplicate element IDs
+			self.groups_bgroups.append([np.where(
+					bgroup_face_IDs == face_ID)[0] for face_ID in
+					range(nfaces_per_elem)])
+
 	def compute_helpers(self, mesh, physics, basis, order):
 		self.get_gaussian_quadrature(mesh, physics, basis, order)
+		self.store_neighbor_info(mesh)
 		self.get_basis_and_geom_data(mesh, basis, order)
 		self.alloc_other_arrays(physics, basis, order)
-		self.store_neighbor_info(mesh)
 
 
 class DG(base.SolverBase):
@@ -811,8 +1072,14 @@ class DG(base.SolverBase):
 		basis = self.basis
 
 		self.elem_helpers = ElemHelpers()
-		self.elem_helpers.compute_helpers(mesh, physics, basis,
-				self.order)
+		self.elem_helpers.store_phys_grad = self.params["StoreBasisPhysGrad"]
+		cache_file = self.params["HelperCacheFile"]
+		if cache_file is None:
+			self.elem_helpers.compute_helpers(mesh, physics, basis,
+					self.order)
+		else:
+			self.elem_helpers.compute_helpers_cached(mesh, physics, basis,
+					self.order, cache_file)
 		self.int_face_helpers = InteriorFaceHelpers()
 		self.int_face_helpers.compute_helpers(mesh, physics, basis,
 				self.order)
@@ -820,6 +1087,8 @@ class DG(base.SolverBase):
 		self.bface_helpers.compute_helpers(mesh, physics, basis,
 				self.order)
 
+		self.elem_helpers.set_precision(self.params["HelperPrecision"])
+
 	def get_element_residual(self, Uc, res_elem):
 		# Unpack
 		physics = self.physics
@@ -838,10 +1107,15 @@ class DG(base.SolverBase):
 
 		# Interpolate state at quad points
 		Uq = helpers.evaluate_state(Uc, basis_val,
-				skip_interp=self.basis.skip_interp) # [ne, nq, ns]
+				skip_interp=self.basis.skip_interp,
+				basis_val_1D=elem_helpers.basis_val_1D) # [ne, nq, ns]
 		
 		# Interpolate gradient of state at quad points
-		gUq = self.evaluate_gradient(Uc, basis_phys_grad_elems)
+		if basis_phys_grad_elems is not None:
+			gUq = self.evaluate_gradient(Uc, basis_phys_grad_elems)
+		else:
+			gUq_ref = self.evaluate_gradient(Uc, elem_helpers.basis_ref_grad)
+			gUq = self.ref_to_phys_grad(ijac_elems, gUq_ref)
 
 		if self.verbose:
 			# Get min and max of state variables for reporting
@@ -859,11 +1133,12 @@ class DG(base.SolverBase):
 			res_elem += solver_tools.calculate_volume_flux_integral(
 					self, elem_helpers, Fq) # [ne, nb, ns]
 
-		if sources:
+		if sources and physics.source_terms:
 			# Evaluate the source term integral
 			# eval_source_terms is an additive function so source needs to be
 			# initialized to zero for each time step
-			Sq = np.zeros_like(Uq) # [ne, nq, ns]
+			Sq = elem_helpers.Sq # [ne, nq, ns]
+			Sq.fill(0.)
 			Sq = physics.eval_source_terms(Uq, x_elems, self.time, Sq)
 					# [ne, nq, ns]
 
@@ -903,31 +1178,28 @@ class DG(base.SolverBase):
 		ns = physics.NUM_STATE_VARS
 		nq = quad_wts.shape[0]
 
-		# Interpolate state at quad points
-		UqL = helpers.evaluate_state(UcL, faces_to_basisL[faceL_IDs])
-				# [nf, nq, ns]
-		UqR = helpers.evaluate_state(UcR, faces_to_basisR[faceR_IDs])
-				# [nf, nq, ns]
+		basis_valL = faces_to_basisL[faceL_IDs] # [nf, nq, nb]
+		basis_valR = faces_to_basisR[faceR_IDs] # [nf, nq, nb]
 
-		# Interpolate gradient of state at quad points
-		gUqL_ref = self.evaluate_gradient(UcL, 
-				faces_to_basis_ref_gradL[faceL_IDs])
-		gUqR_ref = self.evaluate_gradient(UcR, 
-				faces_to_basis_ref_gradR[faceR_IDs])
-
-		# Make gradient the physical gradient at L/R states
-		gUqL = self.ref_to_phys_grad(ijacL_elems, gUqL_ref)
-		gUqR = self.ref_to_phys_grad(ijacR_elems, gUqR_ref)
-
-		# Allocate resL and resR (needed for operator splitting)
-		nifL = self.int_face_helpers.elemL_IDs.shape[0]
-		nifR = self.int_face_helpers.elemR_IDs.shape[0]
-		resL = np.zeros([nifL, nq, ns])
-		resR = np.zeros([nifR, nq, ns])
-		resL_diff = np.zeros([nifL, nq, ns])
-		resR_diff = np.zeros([nifR, nq, ns])
+		# Interpolate state at quad points
+		UqL = helpers.evaluate_state(UcL, basis_valL) # [nf, nq, ns]
+		UqR = helpers.evaluate_state(UcR, basis_valR) # [nf, nq, ns]
 
+		# The gradients of the basis are only gathered when needed for
+		# the diffusion flux
+		gUqL, gUqR = None, None
 		if physics.diff_flux_fcn:
+			basis_ref_gradL = faces_to_basis_ref_gradL[faceL_IDs]
+			basis_ref_gradR = faces_to_basis_ref_gradR[faceR_IDs]
+
+			# Interpolate gradient of state at quad points
+			gUqL_ref = self.evaluate_gradient(UcL, basis_ref_gradL)
+			gUqR_ref = self.evaluate_gradient(UcR, basis_ref_gradR)
+
+			# Make gradient the physical gradient at L/R states
+			gUqL = self.ref_to_phys_grad(ijacL_elems, gUqL_ref)
+			gUqR = self.ref_to_phys_grad(ijacR_elems, gUqR_ref)
+
 			# Calculate diffusion flux helpers
 			physics.diff_flux_fcn.compute_iface_helpers(self)
 
@@ -936,29 +1208,39 @@ class DG(base.SolverBase):
 			Fq = physics.get_conv_flux_numerical(UqL, UqR, normals_int_faces)
 					# [nf, nq, ns]
 
-			# Compute diffusion flux
-			Fq_diff, FL, FR = physics.get_diff_flux_numerical(UqL, UqR,
-					gUqL, gUqR, normals_int_faces) # [nf, nq, ns], 
-					# [nf, nq, ns, ndims], [nf, nq, ns, ndims]
-			Fq -= Fq_diff
-
-			FL_phys = self.ref_to_phys_grad(ijacL_elems, FL)
-			FR_phys = self.ref_to_phys_grad(ijacR_elems, FR)
+			resL_diff, resR_diff = 0., 0.
+			if physics.diff_flux_fcn:
+				# Compute diffusion flux
+				Fq_diff, FL, FR = physics.get_diff_flux_numerical(UqL, UqR,
+						gUqL, gUqR, normals_int_faces) # [nf, nq, ns], 
+						# [nf, nq, ns, ndims], [nf, nq, ns, ndims]
+				Fq -= Fq_diff
+
+				FL_phys = self.ref_to_phys_grad(ijacL_elems, FL)
+				FR_phys = self.ref_to_phys_grad(ijacR_elems, FR)
+
+				# Compute additional boundary flux integrals for diffusion
+				# terms
+				resL_diff = self.calculate_boundary_flux_integral_sum(
+						basis_ref_gradL, quad_wts, FL_phys)
+				resR_diff = self.calculate_boundary_flux_integral_sum(
+						basis_ref_gradR, quad_wts, FR_phys)
 
 			# Compute contribution to left and right element residuals
 			resL = solver_tools.calculate_boundary_flux_integral(
-					faces_to_basisL[faceL_IDs], quad_wts, Fq)
+					basis_valL, quad_wts, Fq)
 			resR = solver_tools.calculate_boundary_flux_integral(
-					faces_to_basisR[faceR_IDs], quad_wts, Fq)
-
-			# Compute additional boundary flux integrals for diffusion terms
-			resL_diff = self.calculate_boundary_flux_integral_sum(
-					faces_to_basis_ref_gradL[faceL_IDs], quad_wts, FL_phys)
+					basis_valR, quad_wts, Fq)
+		else:
+			# Zero face contributions (needed for operator splitting)
+			nifL = self.int_face_helpers.elemL_IDs.shape[0]
+			nifR = self.int_face_helpers.elemR_IDs.shape[0]
+			nb = basis_valL.shape[2]
+			resL = np.zeros([nifL, nb, ns])
+			resR = np.zeros([nifR, nb, ns])
+			resL_diff = np.zeros([nifL, nb, ns])
+			resR_diff = np.zeros([nifR, nb, ns])
 
-			resR_diff = self.calculate_boundary_flux_integral_sum(
-					faces_to_basis_ref_gradR[faceR_IDs], quad_wts, 
-					FR_phys)
-			
 		return resL, resR, resL_diff, resR_diff # [nif, nb, ns]
 
 	def get_boundary_face_residual(self, bgroup, face_IDs, Uc, resB):
@@ -977,7 +1259,6 @@ class DG(base.SolverBase):
 		ijac_bgroups = bface_helpers.ijac_bgroups
 
 		basis_val = bface_helpers.faces_to_basis[face_IDs] # [nbf, nq, nb]
-		basis_ref_grad = bface_helpers.faces_to_basis_ref_grad[face_IDs] 
 
 		# Interpolate state at quad points
 		UqI = helpers.evaluate_state(Uc, basis_val) # [nbf, nq, ns]
@@ -988,30 +1269,32 @@ class DG(base.SolverBase):
 
 		BC = physics.BCs[bgroup.name]
 
-		# Interpolate state at quadrature points
-		UqI = helpers.evaluate_state(Uc, basis_val)
+		# The gradients of the basis are only gathered when needed for
+		# the diffusion flux
+		gUq = None
+		if physics.diff_flux_fcn:
+			basis_ref_grad = bface_helpers.faces_to_basis_ref_grad[face_IDs]
 
-		# Interpolate gradient of state at quad points
-		gUq_ref = self.evaluate_gradient(Uc, 
-				basis_ref_grad)
+			# Interpolate gradient of state at quad points
+			gUq_ref = self.evaluate_gradient(Uc, basis_ref_grad)
 
-		# Make ref gradient of state the physical gradient
-		gUq = self.ref_to_phys_grad(ijac, gUq_ref)
+			# Make ref gradient of state the physical gradient
+			gUq = self.ref_to_phys_grad(ijac, gUq_ref)
 
-		# Compute any additional helpers for diffusive flux fcn
-		if physics.diff_flux_fcn:
+			# Compute any additional helpers for diffusive flux fcn
 			physics.diff_flux_fcn.compute_bface_helpers(self, bgroup_num)
 		
 		if fluxes:
 			# Compute boundary flux
 			Fq, FqB = BC.get_boundary_flux(physics, UqI, normals, x, self.time, gUq=gUq)
-			FqB_phys = self.ref_to_phys_grad(ijac, FqB)
 
 			# Compute contribution to adjacent element residual
 			resB = solver_tools.calculate_boundary_flux_integral(
 					basis_val, quad_wts, Fq)
 
-			resB -= self.calculate_boundary_flux_integral_sum(
-				basis_ref_grad, quad_wts, FqB_phys)
+			if physics.diff_flux_fcn:
+				FqB_phys = self.ref_to_phys_grad(ijac, FqB)
+				resB -= self.calculate_boundary_flux_integral_sum(
+					basis_ref_grad, quad_wts, FqB_phys)
 
 		return resB
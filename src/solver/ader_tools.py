@@ -22,7 +22,7 @@
 # ------------------------------------------------------------------------ #
 import numpy as np
 from scipy.integrate import LSODA, ode
-from scipy.linalg import solve_sylvester
+from scipy.linalg import schur
 from scipy.optimize import fsolve, root
 
 import general
@@ -159,11 +159,9 @@ def recalculate_jacobian_on(solver, U_pred, dt, Sjac=None):
 	nelem = U_pred.shape[0]
 	quad_wts_st = elem_helpers_st.quad_wts
 	basis_val_st = elem_helpers_st.basis_val
-	nq_t = elem_helpers_st.nq_tile_constant
 
 	x_elems = elem_helpers.x_elems
 	vol_elems = elem_helpers.vol_elems
-	djac_elems = elem_helpers.djac_elems
 
 	# Only evaluate Jacobian for stiff sources
 	temp_sources = physics.source_terms.copy()
@@ -172,7 +170,7 @@ def recalculate_jacobian_on(solver, U_pred, dt, Sjac=None):
 	Uq = helpers.evaluate_state(U_pred, basis_val_st)
 
 	U_bar = helpers.get_element_mean(Uq, quad_wts_st, 
-			np.tile(djac_elems, [1, nq_t, 1])*dt/2., dt*vol_elems)
+			elem_helpers_st.djac_elems_tiled*dt/2., dt*vol_elems)
 
 	# Calculate the source term Jacobian using average state
 	Sjac = Sjac.reshape([U_pred.shape[0], 1, ns, ns])
@@ -271,20 +269,17 @@ def spacetime_odeguess(solver, W, U_pred, dt=None):
 	elem_helpers = solver.elem_helpers
 	elem_helpers_st = solver.elem_helpers_st
 	ader_helpers = solver.ader_helpers
-	iMM_elems = ader_helpers.iMM_elems
 
 	quad_wts = elem_helpers.quad_wts
 	quad_pts = elem_helpers.quad_pts
 	basis_val = elem_helpers.basis_val
 	basis_val_st = elem_helpers_st.basis_val
-	djac_elems = elem_helpers.djac_elems
 	x_elems = elem_helpers.x_elems
 
 	nelem = W.shape[0]
 	quad_pts_st = elem_helpers_st.quad_pts
 	quad_wts_st = elem_helpers_st.quad_wts
 	nq_st = quad_wts_st.shape[0]
-	nq_t = elem_helpers_st.nq_tile_constant
 	vol_elems = elem_helpers.vol_elems
 
 	# Evaluate spatial coeffs on spatial quadrature points
@@ -374,12 +369,11 @@ def spacetime_odeguess(solver, W, U_pred, dt=None):
 
 	# Get space-time average from initial guess
 	U_bar = helpers.get_element_mean(Uq_guess, quad_wts_st, 
-			np.tile(djac_elems, [1, nq_t, 1])*dt/2., dt*vol_elems)
+			elem_helpers_st.djac_elems_tiled*dt/2., dt*vol_elems)
 
 	# Project the guess at the space-time quadrature points to the 
 	# state coefficient's initial guess
-	L2_projection(mesh, iMM_elems, solver.basis_st, quad_pts_st,
-			quad_wts_st, np.tile(djac_elems, [1, nq_t, 1]), Uq_guess, U_pred)
+	U_pred[:] = np.matmul(ader_helpers.proj_elems, Uq_guess)
 
 	return U_pred, U_bar
 
@@ -402,8 +396,8 @@ def calculate_volume_flux_integral(solver, elem_helpers,
 			[ne, nb, ns]
 	'''
 	quad_wts_st = elem_helpers_st.quad_wts
-	basis_phys_grad_elems = elem_helpers.basis_phys_grad_elems
-	djac_elems = elem_helpers.djac_elems
+	basis_phys_grad_elems_T = elem_helpers.basis_phys_grad_elems_T
+			# [ne, nb, nq, ndims]
 
 	nb = elem_helpers.basis_val.shape[1]
 	nq = elem_helpers.quad_wts.shape[0]
@@ -411,13 +405,22 @@ def calculate_volume_flux_integral(solver, elem_helpers,
 
 	nq_t = elem_helpers_st.nq_tile_constant
 
-	tile_basis_phys_grads = np.tile(basis_phys_grad_elems, (1, nq_t, 1, 1))
+	quad_wts_st_djac = elem_helpers_st.quad_wts_djac_elems
 
-	quad_wts_st_djac = quad_wts_st * np.tile(djac_elems, (nq_t, 1))
+	# Space-time quadrature points are ordered time-major, so the spatial
+	# basis gradients repeat for each time point. Split the quadrature
+	# axis and sum over the temporal points first instead of tiling the
+	# gradients.
+	ne, _, ns, ndims = Fq.shape
+	Fq_wts = (Fq * np.expand_dims(quad_wts_st_djac, axis=3)).reshape(
+			ne, nq_t, nq, ns, ndims).sum(axis=1)
 
-	# integrate
-	res_elem = np.einsum('ijkl, ijml -> ikm', tile_basis_phys_grads,
-			Fq * np.expand_dims(quad_wts_st_djac, axis=3))# [ne, nb, ns]
+	# integrate as a single batched matrix multiply over the spatial
+	# quadrature points and dimensions
+	F_quad = np.ascontiguousarray(Fq_wts.transpose(0, 1, 3, 2))
+			# [ne, nq, ndims, ns]
+	res_elem = np.matmul(basis_phys_grad_elems_T.reshape(ne, nb, nq*ndims),
+			F_quad.reshape(ne, nq*ndims, ns)) # [ne, nb, ns]
 
 	return res_elem # [ne, nb, ns]
 
@@ -438,9 +441,16 @@ def calculate_boundary_flux_integral(nq_t, basis_val,
 		resB: residual contribution (from boundary face) [nf, nb, ns]
 	'''
 	# Calculate the flux quadrature
-	Fq_quad = np.einsum('ijk, jm -> ijk', Fq, quad_wts_st)
-	# Calculate residual
-	resB = np.einsum('ijn, ijk -> ink', np.tile(basis_val,(nq_t, 1)), Fq_quad)
+	Fq_quad = Fq*quad_wts_st
+
+	# Space-time face quadrature points are the time points times the
+	# spatial face points (time-major), so split that axis and sum over
+	# the time points rather than tiling the spatial basis values
+	nf, _, ns = Fq_quad.shape
+	Fq_quad = Fq_quad.reshape(nf, -1, basis_val.shape[1], ns).sum(axis=1)
+
+	# Calculate residual as one batched matrix multiply over all faces
+	resB = np.matmul(basis_val.transpose(0, 2, 1), Fq_quad) # [nf, nb, ns]
 
 	return resB # [nf, nb, ns]
 
@@ -452,7 +462,7 @@ def calculate_boundary_flux_integral_sum(nq_t, basis_ref_grad, quad_wts_st, Fq):
 	Inputs:
 	-------
 		basis_ref_grad: evaluated gradient of the basis function in 
-			reference space [nq, nb, ndims]
+			reference space [nf, nq, nb, ndims]
 		quad_wts: quadrature weights [nq, 1]
 		Fq: Direction diffusion flux contribution [nf, nq, ns, ndims]
 
@@ -462,11 +472,21 @@ def calculate_boundary_flux_integral_sum(nq_t, basis_ref_grad, quad_wts_st, Fq):
 	'''
 
 	# Calculate flux quadrature
-	Fq_quad = np.einsum('ijkl, jm -> ijkl', Fq, quad_wts_st) # [nf, nq, ns]
-
-	# Calculate residual
-	resB = np.einsum('ijnl, ijkl -> ink',np.tile(basis_ref_grad, 
-		[1, nq_t, 1, 1]), Fq_quad)
+	Fq_quad = Fq*quad_wts_st[:, :, np.newaxis] # [nf, nq, ns, ndims]
+
+	# Split the time-major space-time quadrature axis and sum over the
+	# time points rather than tiling the spatial basis gradients
+	nf, _, ns, ndims = Fq_quad.shape
+	nq = basis_ref_grad.shape[1]
+	nb = basis_ref_grad.shape[2]
+	Fq_quad = Fq_quad.reshape(nf, -1, nq, ns, ndims).sum(axis=1)
+
+	# Calculate residual as one batched matrix multiply over the
+	# quadrature points and dimensions
+	basis_ref_grad_T = basis_ref_grad.transpose(0, 2, 1, 3).reshape(nf, nb,
+			nq*ndims)
+	Fq_quad = Fq_quad.transpose(0, 1, 3, 2).reshape(nf, nq*ndims, ns)
+	resB = np.matmul(basis_ref_grad_T, Fq_quad) # [nf, nb, ns]
 
 	return resB # [nf, nb, ns]
 
@@ -491,7 +511,6 @@ def calculate_source_term_integral(elem_helpers, elem_helpers_st, Sq):
 	quad_wts_st = elem_helpers_st.quad_wts
 
 	basis_val = elem_helpers.basis_val
-	djac_elems = elem_helpers.djac_elems
 
 	nb = basis_val.shape[1]
 	nq = quad_wts.shape[0]
@@ -499,11 +518,18 @@ def calculate_source_term_integral(elem_helpers, elem_helpers_st, Sq):
 
 	nq_t = elem_helpers_st.nq_tile_constant
 
-	quad_wts_st_djac = quad_wts_st * np.tile(djac_elems, (nq_t, 1))
+	quad_wts_st_djac = elem_helpers_st.quad_wts_djac_elems
+
+	# Split the time-major space-time quadrature axis rather than tiling
+	# the spatial basis values
+	ne, _, ns = Sq.shape
+	Sq_wts = (Sq*quad_wts_st_djac).reshape(ne, nq_t, nq, ns)
 
-	# Calculate residual from source term
-	res_elem = np.einsum('jk, ijl -> ikl', np.tile(basis_val, (nq_t, 1)),
-			Sq*quad_wts_st_djac) # [ne, nb, ns]
+	# Calculate residual from source term. The time quadrature points
+	# are summed first, after which the spatial integral is one batched
+	# matrix multiply.
+	res_elem = np.matmul(basis_val.transpose(),
+			Sq_wts.sum(axis=1)) # [ne, nb, ns]
 
 	return res_elem # [ne, nb, ns]
 
@@ -521,26 +547,19 @@ def get_spacetime_gradient(solver, Uc):
 	-------
 		gUc: gradient of the space-time state [ne, nb_st, ns, ndims]
 	'''
-	ader_helpers = solver.ader_helpers
-
-	iMM = ader_helpers.iMM
-	SMS = ader_helpers.SMS_ref
-	
-	x = np.zeros([Uc.shape[0], Uc.shape[1], Uc.shape[-1], SMS.shape[-1]])
-	gUc = np.zeros([Uc.shape[0], Uc.shape[1], Uc.shape[-1], SMS.shape[-1]])
+	# Precomputed iMM @ SMS^T for each spatial direction
+	iMM_SMS = solver.ader_helpers.iMM_SMS_ref # [ndims, nb_st, nb_st]
 
-	for i in range(SMS.shape[-1]):
-		x[:, :, :, i] = SMS[:, :, i].transpose() @ Uc
-		gUc[:, :, :, i] = iMM @ x[:, :, :, i]
+	gUc = np.einsum('ljk, ikm -> ijml', iMM_SMS, Uc)
 
 	return gUc # [ne, nb_st, ns, ndims]
 
 def smsflux(SMS, flux):
 	'''
-	This method does two operations:
-
-	1. It first does a matrix multiply of the SMS matrix and flux in each direction
-	2. It then conducts a sum along the dimensional axis of the returned matrix.
+	This method multiplies the SMS matrix and the flux in each direction
+	and sums over the directions. Both are done at once by treating the
+	basis and dimension axes as a single axis of a batched matrix
+	multiply.
 
 	This is a more efficient implementation of the following einsum calculation
 
@@ -555,10 +574,11 @@ def smsflux(SMS, flux):
 	--------
 		Returns a matrix of shape [ne, nb_st, ns]
 	'''
-	x = np.zeros_like(flux)
-	for i in range(flux.shape[-1]):
-		x[:, :, :, i] = SMS[:, :, :, i] @ flux[:, :, :, i]
-	return np.sum(x, axis=3)
+	ne, nb_st, ns, ndims = flux.shape
+	SMS_r = SMS.reshape(ne, SMS.shape[1], nb_st*ndims)
+	flux_r = flux.transpose(0, 1, 3, 2).reshape(ne, nb_st*ndims, ns)
+
+	return np.matmul(SMS_r, flux_r)
 
 
 def predictor_elem_explicit(solver, dt, W, U_pred):
@@ -618,13 +638,17 @@ def predictor_elem_explicit(solver, dt, W, U_pred):
 	flux_coeffs = solver.flux_coefficients(dt, order, basis_st,
 			U_pred)
 
+	# The contribution of the previous time step solution does not
+	# change between subiterations
+	FTR_W = FTR @ W # [ne, nb_st, ns]
+
 	# Iterate using a discrete Picard nonlinear solve for the
 	# updated space-time coefficients.
 	niter = 100
 	for i in range(niter):
 
 		U_pred_new = iK @ ( MM @ source_coeffs - \
-			smsflux(SMS_elems, flux_coeffs) + FTR @ W )
+			smsflux(SMS_elems, flux_coeffs) + FTR_W )
 
 		# We check when the coefficients are no longer changing.
 		# This can lead to differences between NODAL and MODAL solutions.
@@ -637,7 +661,8 @@ def predictor_elem_explicit(solver, dt, W, U_pred):
 			print("Predictor iterations: ", i)
 			break
 
-		U_pred = np.copy(U_pred_new)
+		# U_pred_new is a new array every iteration, so no copy is needed
+		U_pred = U_pred_new
 		
 		source_coeffs = solver.source_coefficients(dt, order,
 				basis_st, U_pred)
@@ -730,43 +755,42 @@ def predictor_elem_implicit(solver, dt, W, U_pred):
 	# Iterate using a nonlinear Sylvester solver for the
 	# updated space-time coefficients. Solves for X in the form:
 	# 	AX + XB = C
-	# Update: We now transform AX+XB=C into KX=C using kronecker
-	# products.
+	# using the Bartels-Stewart algorithm. A is the same for every
+	# element and every subiteration, so its complex Schur decomposition
+	# (A = Z T Z^H) is only computed once.
 	niter = 10000
 
 	A = np.matmul(iMM, K)
+	ne, nb_st = U_pred.shape[0], U_pred.shape[1]
+	T, Z = schur(A, output='complex')
+	I1 = np.eye(ns)
 
-	U_pred_new = np.zeros_like(U_pred)
+	# The contribution of the previous time step solution does not
+	# change between subiterations
+	FTR_W = np.matmul(FTR, W) # [ne, nb_st, ns]
 
 	for i in range(niter):
 		
 		B = -1.0*dt*Sjac.transpose(0,2,1)
 
-		Q = np.einsum('jk, ikm -> ijm', FTR, W) - np.einsum(
-				'ijkl, ikml -> ijm', SMS_elems, flux_coeffs)
+		Q = FTR_W - smsflux(SMS_elems, flux_coeffs)
 
 		C = source_coeffs - dt*np.matmul(U_pred[:],
 				Sjac[:].transpose(0, 2, 1)) + \
-				np.einsum('jk, ikl -> ijl', iMM, Q)
-
-		# Build identity matrices for kronecker procucts
-		I2 = np.eye(A.shape[1])
-		I1 = np.eye(B.shape[1])
-
-		for ie in range(U_pred.shape[0]):
-
-			# Conduct kronecker products to transfrom Ax+xB=C system to Ax=b
-			kronecker = np.kron(I1, A) + np.kron(B[ie, :, :].transpose(), I2)
-			U_pred_hold = np.linalg.solve(kronecker, 
-					C[ie, :, :].transpose().reshape(-1))
-			U_pred_new[ie, :, :] = U_pred_hold.reshape(U_pred.shape[2], 
-					U_pred.shape[1]).transpose()
-
-			# Note: Previous implementaion used sylvester solve directly.
-			# This still requires further testing to determine which is 
-			# more efficient.
-			# U_pred_new[ie, :, :] = solve_sylvester(A, B[ie, :, :],
-			# 		C[ie, :, :])
+				np.matmul(iMM, Q)
+
+		# Transform to T Y + Y B = Z^H C with Y = Z^H X. Since T is
+		# upper triangular, the rows of Y are found by back-substitution,
+		# each requiring an [ns, ns] solve for all elements at once.
+		C_hat = np.matmul(Z.conj().transpose(), C)
+		B_T = B.transpose(0, 2, 1)
+		Y = np.zeros_like(C_hat) # [ne, nb_st, ns]
+		for j in range(nb_st - 1, -1, -1):
+			rhs = C_hat[:, j, :] - np.einsum('k, ikl -> il',
+					T[j, j+1:], Y[:, j+1:, :])
+			Y[:, j, :] = np.linalg.solve(B_T + T[j, j]*I1,
+					rhs[:, :, np.newaxis])[:, :, 0]
+		U_pred_new = np.matmul(Z, Y).real
 
 		# We check when the coefficients are no longer changing.
 		# This can lead to differences between NODAL and MODAL solutions.
@@ -854,6 +878,10 @@ def predictor_elem_stiffimplicit(solver, dt, W, U_pred):
 	flux_coeffs = solver.flux_coefficients(dt, order, basis_st,
 			U_pred)
 
+	# The contribution of the previous time step solution does not
+	# change between nonlinear solver evaluations
+	FTR_W = np.matmul(FTR, W) # [ne, nb_st, ns]
+
 	def rhs_weakform(q):
 		'''
 		Solves the weak form of the DG discretization while doing
@@ -874,10 +902,8 @@ def predictor_elem_stiffimplicit(solver, dt, W, U_pred):
 				basis_st, q)
 		flux_coeffs = solver.flux_coefficients(dt, order, basis_st,
 				q)	
-		zero = np.einsum('jk, ikm -> ijm',iK,
-				np.einsum('jk, ikl -> ijl', MM, source_coeffs) -
-				np.einsum('ijkl, ikml -> ijm', SMS_elems, flux_coeffs) +
-				np.einsum('jk, ikm -> ijm', FTR, W)) - q
+		zero = np.matmul(iK, np.matmul(MM, source_coeffs) -
+				smsflux(SMS_elems, flux_coeffs) + FTR_W) - q
 		
 		q.reshape(-1) # reshape for the nonlinear solver
 		return zero.reshape(-1) # reshape for the nonlinear solver
@@ -898,32 +924,6 @@ def predictor_elem_stiffimplicit(solver, dt, W, U_pred):
 	return U_pred # [ne, nb_st, ns]
 
 
-def L2_projection(mesh, iMM, basis, quad_pts, quad_wts, djac, f, U):
-	'''
-	Performs an L2 projection for the space-time solution state vector
-
-	Inputs:
-	-------
-		mesh: mesh object
-		iMM: space-time inverse mass matrix
-		basis: basis object
-		quad_pts: quadrature coordinates in reference space
-		quad_wts: quadrature weights
-		djac: determinant of the Jacobian
-		f: array of values to be projected from
-
-	Outpust:
-	--------
-		U: array of values to be projected to
-	'''
-	if basis.basis_val.shape[0] != quad_wts.shape[0]:
-		basis.get_basis_val_grads(quad_pts, get_val=True)
-
-	rhs = np.einsum('jk, ijl -> ikl', basis.basis_val, f*quad_wts*djac)
-			# [ne, nb, ns]
-	U[:, :, :] = np.einsum('ijk, ikl -> ijl', iMM, rhs)
-
-
 def ref_to_phys_time(mesh, time, dt, tref, basis=None):
     '''
     This function converts reference time coordinates to physical
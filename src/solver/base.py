@@ -31,7 +31,6 @@ from general import ModalOrNodal, NodeType, ShapeType, QuadratureType, \
 		StepperType, LimiterType, BasisType
 
 import meshing.meshbase as mesh_defs
-import meshing.tools as mesh_tools
 
 import numerics.basis.tools as basis_tools
 
@@ -75,6 +74,8 @@ class SolverBase(ABC):
 		contains all the information and methods for the limiter class
 	verbose: bool
 		determines whether to print detailed info to console
+	print_interval: int
+		iteration interval at which info is printed to console
 	min_state: numpy array
 		minimum values of state variables
 	max_state: numpy array
@@ -131,9 +132,12 @@ class SolverBase(ABC):
 		basis_type  = params["SolutionBasis"]
 		self.basis = basis_tools.set_basis(self.order, basis_type)
 		# State polynomial coefficients (what we're solving for)
+		state_precision = params["StatePrecision"]
+		if state_precision not in ["float32", "float64"]:
+			raise errors.IncompatibleError
 		self.state_coeffs = np.zeros([mesh.num_elems,
 				self.basis.get_num_basis_coeff(self.order),
-				physics.NUM_STATE_VARS])
+				physics.NUM_STATE_VARS], dtype=state_precision)
 
 		# Node type
 		node_type = params["NodeType"]
@@ -170,6 +174,7 @@ class SolverBase(ABC):
 		# Console output
 		self.verbose = params["Verbose"]
 		self.progress_bar = params["ProgressBar"]
+		self.print_interval = params["PrintInterval"]
 		self.min_state = np.zeros(physics.NUM_STATE_VARS)
 		self.max_state = np.zeros(physics.NUM_STATE_VARS)
 
@@ -258,6 +263,12 @@ class SolverBase(ABC):
 			if basis.BASIS_TYPE == BasisType.HierarchicH1Tri:
 				raise errors.IncompatibleError
 
+		# Artificial viscosity and the WENO limiter need the stored
+		# physical basis gradients
+		if not params["StoreBasisPhysGrad"] and (params["ArtificialViscosity"]
+				or LimiterType.WENO.name in params["ApplyLimiters"]):
+			raise errors.IncompatibleError
+
 	@abstractmethod
 	def precompute_matrix_helpers(self):
 		'''
@@ -361,7 +372,7 @@ class SolverBase(ABC):
 			# Quadrature
 
 			# Over-integrate
-			order = 2*np.amax([self.order, 1])
+			order = 2*max(self.order, 1)
 			order = physics.get_quadrature_order(order)
 
 			quad_order = basis.get_quadrature_order(mesh, order)
@@ -371,10 +382,10 @@ class SolverBase(ABC):
 			nq = eval_pts.shape[0]
 
 		# Compute state
-		xphys = np.empty((mesh.num_elems,) + eval_pts.shape)
-
-		for elem_ID in range(mesh.num_elems):
-			xphys[elem_ID] = mesh_tools.ref_to_phys(mesh, elem_ID, eval_pts)
+		gbasis = mesh.gbasis
+		gbasis.get_basis_val_grads(eval_pts, get_val=True)
+		elem_coords = mesh.node_coords[mesh.elem_to_node_IDs]
+		xphys = np.matmul(gbasis.basis_val, elem_coords) # [num_elems, nq, ndims]
 		f = physics.IC.get_state(physics, x=xphys, t=self.time)
 
 		if not params["L2InitialCondition"]:
@@ -387,7 +398,8 @@ class SolverBase(ABC):
 
 	def project_state_to_new_basis(self, U_old, basis_old, order_old):
 		'''
-		Projects the state to a different basis and/or order
+		Projects the state to a different basis and/or order. If the basis
+		and order are unchanged, the state is copied directly.
 
 		Inputs:
 		-------
@@ -398,6 +410,11 @@ class SolverBase(ABC):
 		Outputs:
 		--------
 			state is modified
+
+		Notes:
+		------
+			The state is written in place, so it keeps its precision
+			(StatePrecision) regardless of that of U_old
 		'''
 		mesh = self.mesh
 		physics = self.physics
@@ -411,12 +428,21 @@ class SolverBase(ABC):
 		if basis_old.SHAPE_TYPE != basis.SHAPE_TYPE:
 			raise errors.IncompatibleError
 
+		# The projection onto the same basis (and nodes) is the identity,
+		# so the basis evaluation and projection are skipped
+		if basis_old == basis and order_old == self.order and \
+				basis_old.get_1d_nodes == basis.get_1d_nodes:
+			U[:] = U_old
+			return
+
+		print("Projecting to a different solution basis and/or order")
+
 		if not params["L2InitialCondition"]:
 			# Interpolate to solution nodes
 			eval_pts = basis.get_nodes(self.order)
 		else:
 			# Quadrature
-			order = 2*np.amax([self.order, order_old])
+			order = 2*max(self.order, order_old)
 			quad_order = basis.get_quadrature_order(mesh, order)
 
 			quad_pts, quad_wts = basis.get_quadrature_data(quad_order)
@@ -506,15 +532,20 @@ class SolverBase(ABC):
 		RL, RR, RL_diff, RR_diff = self.get_interior_face_residual(faceL_IDs, faceR_IDs, UL,
 				UR)
 
-		# Add this residual back to the global. The np.add.at function is
-		# used to correctly handle duplicate element IDs.
-		np.add.at(res, elemL_IDs, -RL)
-		np.add.at(res, elemR_IDs,  RR)
-
 		# Add the additional diffusion portion of the residual to the
-		# correct left/right states.
-		np.add.at(res, elemL_IDs,  RL_diff)
-		np.add.at(res, elemR_IDs,  RR_diff)
+		# left/right face residuals first, so that the global residual is
+		# only updated once per face
+		if self.physics.diff_flux_fcn:
+			RL -= RL_diff
+			RR += RR_diff
+
+		# Add this residual back to the global. The contributions of all
+		# faces of each element are summed with a single bincount.
+		res_flat = res.reshape(-1)
+		res_flat -= np.bincount(int_face_helpers.scatterL_IDs,
+				weights=RL.reshape(-1), minlength=res_flat.shape[0])
+		res_flat += np.bincount(int_face_helpers.scatterR_IDs,
+				weights=RR.reshape(-1), minlength=res_flat.shape[0])
 
 	def get_boundary_face_residuals(self, U, res):
 		'''
@@ -536,6 +567,7 @@ class SolverBase(ABC):
 		bface_helpers = self.bface_helpers
 		elem_IDs = bface_helpers.elem_IDs
 		face_IDs = bface_helpers.face_IDs
+		groups_bgroups = bface_helpers.groups_bgroups
 
 		# Loop through boundary groups
 		for bgroup in mesh.boundary_groups.values():
@@ -547,7 +579,10 @@ class SolverBase(ABC):
 					bgroup_face_IDs, U[bgroup_elem_IDs],
 					res[bgroup_elem_IDs])
 
-			np.add.at(res, bgroup_elem_IDs, -resB)
+			# Add this residual back to the global. The faces are added
+			# in groups that do not contain duplicate element IDs.
+			for idx in groups_bgroups[bgroup.number]:
+				res[bgroup_elem_IDs[idx]] -= resB[idx]
 
 	def apply_limiter(self, U):
 		'''
@@ -589,6 +624,8 @@ class SolverBase(ABC):
 		only time and residual info is printed; otherwise, min and max
 		values of the state are also reported. If self.progress_bar is True,
 		then the iteration output is replaced with a progress bar.
+		Iteration output is only printed every self.print_interval
+		iterations (never if nonpositive) and at the final iteration.
 
 		Inputs:
 		-------
@@ -603,12 +640,15 @@ class SolverBase(ABC):
 			solver_tools.update_progress(t / self.stepper.tfinal)
 
 		# Basic info: time, residual. If using a progress bar, only the last
-		# iteration is output.
+		# iteration is output. The residual norm is only computed when it
+		# is printed.
 		is_final_iteration = itime == self.stepper.num_time_steps - 1
-		if not self.progress_bar or is_final_iteration:
+		is_print_iteration = self.print_interval > 0 and \
+				(itime + 1) % self.print_interval == 0
+		if (not self.progress_bar and is_print_iteration) or \
+				is_final_iteration:
 			print("%d: Time = %g - Time step = %g - Residual norm = %g" % (
-					itime + 1, t, dt, np.linalg.norm(np.reshape(res, -1),
-					ord=1)))
+					itime + 1, t, dt, np.abs(res).sum()))
 
 			# If requested, report min and max of state variables
 			if self.verbose:
@@ -635,8 +675,12 @@ class SolverBase(ABC):
 
 		# Parameters for writing data
 		write_interval = self.params["WriteInterval"]
-		if write_interval == -1:
-			write_interval = np.NAN
+		# Iteration (counting from one) at which the next data file is
+		# written, if any
+		if write_interval > 0:
+			next_write_iter = (self.itime // write_interval + 1)*write_interval
+		else:
+			next_write_iter = None
 		write_final_solution = self.params["WriteFinalSolution"]
 		write_initial_solution = self.params["WriteInitialSolution"]
 
@@ -674,9 +718,10 @@ class SolverBase(ABC):
 			self.print_info(physics, res, self.itime, t, stepper.dt)
 
 			# Write data file
-			if (self.itime + 1) % write_interval == 0:
+			if self.itime + 1 == next_write_iter:
 				readwritedatafiles.write_data_file(self,
-						(self.itime + 1) // write_interval)
+						next_write_iter // write_interval)
+				next_write_iter += write_interval
 
 			self.itime += 1
 
@@ -66,18 +66,47 @@ def calculate_volume_flux_integral(solver, elem_helpers, Fq):
 	--------
 		res_elem: calculated residual array
 			[ne, nb, ns]
+
+	Notes:
+	------
+		The basis gradients are stored with the basis axis first (see
+		ElemHelpers), so the contraction over the quadrature points and
+		the dimensions is a single batched matrix multiply. The flux
+		quadrature is evaluated in the precision in which the basis
+		gradients are stored. If the physical basis gradients are not
+		stored, the flux is instead mapped to reference space with the
+		inverse Jacobians and contracted with the reference gradients.
 	'''
 	quad_wts = elem_helpers.quad_wts # [nq, 1]
-	basis_phys_grad_elems = elem_helpers.basis_phys_grad_elems
-			# [ne, nq, nb, ndims]
+	basis_phys_grad_elems_T = elem_helpers.basis_phys_grad_elems_T
+			# [ne, nb, nq, ndims]
 	djac_elems = elem_helpers.djac_elems # [ne, nq, 1]
+	ne, nq, ns, ndims = Fq.shape
+
+	if basis_phys_grad_elems_T is None:
+		dtype = Fq.dtype
+	else:
+		dtype = basis_phys_grad_elems_T.dtype
+
+	# Calculate flux quadrature, stored with the dimension axis before
+	# the state axis
+	F_quad = np.multiply(Fq.transpose(0, 1, 3, 2), quad_wts[:, :,
+			np.newaxis], order='C', dtype=dtype)
+	F_quad *= djac_elems[:, :, :, np.newaxis] # [ne, nq, ndims, ns]
 
-	# Calculate flux quadrature
-	F_quad = np.einsum('ijkl, jm, ijm -> ijkl', Fq, quad_wts, djac_elems)
-			# [ne, nq, ns, ndims]
 	# Calculate residual
-	res_elem = np.einsum('ijnl, ijkl -> ink', basis_phys_grad_elems, F_quad)
-			# [ne, nb, ns]
+	if basis_phys_grad_elems_T is None:
+		basis_ref_grad_T = elem_helpers.basis_ref_grad_T # [nb, nq, ndims]
+		nb = basis_ref_grad_T.shape[0]
+		F_quad = np.matmul(elem_helpers.ijac_elems, F_quad)
+				# [ne, nq, ndims, ns]
+		res_elem = np.matmul(basis_ref_grad_T.reshape(nb, nq*ndims),
+				F_quad.reshape(ne, nq*ndims, ns)) # [ne, nb, ns]
+	else:
+		nb = basis_phys_grad_elems_T.shape[1]
+		res_elem = np.matmul(basis_phys_grad_elems_T.reshape(ne, nb,
+				nq*ndims), F_quad.reshape(ne, nq*ndims, ns)) # [ne, nb, ns]
+
 	return res_elem # [ne, nb, ns]
 
 
@@ -96,10 +125,10 @@ def calculate_boundary_flux_integral(basis_val, quad_wts, Fq):
 		resB: residual contribution (from boundary face) [nf, nb, ns]
 	'''
 	# Calculate flux quadrature
-	Fq_quad = np.einsum('ijk, jm -> ijk', Fq, quad_wts) # [nf, nq, ns]
+	Fq_quad = Fq*quad_wts # [nf, nq, ns]
 
-	# Calculate residual
-	resB = np.einsum('ijn, ijk -> ink', basis_val, Fq_quad) # [nf, nb, ns]
+	# Calculate residual as one batched matrix multiply over all faces
+	resB = np.matmul(basis_val.transpose(0, 2, 1), Fq_quad) # [nf, nb, ns]
 
 	return resB # [nf, nb, ns]
 
@@ -111,7 +140,7 @@ def calculate_boundary_flux_integral_sum(basis_ref_grad, quad_wts, Fq):
 	Inputs:
 	-------
 		basis_ref_grad: evaluated gradient of the basis function in 
-			reference space [nq, nb, ndims]
+			reference space [nf, nq, nb, ndims]
 		quad_wts: quadrature weights [nq, 1]
 		Fq: Direction diffusion flux contribution [nf, nq, ns, ndims]
 
@@ -120,11 +149,19 @@ def calculate_boundary_flux_integral_sum(basis_ref_grad, quad_wts, Fq):
 		resB: residual contribution (from boundary face) [nf, nb, ns]
 	'''
 
-	# Calculate flux quadrature
-	Fq_quad = np.einsum('ijkl, jm -> ijkl', Fq, quad_wts) # [nf, nq, ns, ndims]
+	nf, nq, ns, ndims = Fq.shape
+	nb = basis_ref_grad.shape[2]
 
-	# Calculate residual
-	resB = np.einsum('ijnl, ijkl -> ink', basis_ref_grad, Fq_quad)
+	# Calculate flux quadrature, stored with the dimension axis before
+	# the state axis
+	Fq_quad = np.multiply(Fq.transpose(0, 1, 3, 2), quad_wts[:, :,
+			np.newaxis], order='C') # [nf, nq, ndims, ns]
+
+	# Calculate residual as one batched matrix multiply over the
+	# quadrature points and dimensions
+	basis_ref_grad_T = basis_ref_grad.transpose(0, 2, 1, 3).reshape(nf, nb,
+			nq*ndims)
+	resB = np.matmul(basis_ref_grad_T, Fq_quad.reshape(nf, nq*ndims, ns))
 
 	return resB # [nf, nb, ns]
 
@@ -144,15 +181,15 @@ def calculate_source_term_integral(elem_helpers, Sq):
 		[ne, nb, ns]
 	'''
 	quad_wts = elem_helpers.quad_wts # [nq, 1]
-	basis_val = elem_helpers.basis_val # [nq, nb]
+	basis_val_T = elem_helpers.basis_val_T # [nb, nq]
 	djac_elems = elem_helpers.djac_elems # [ne, nq, 1]
 
 	# Calculate source term quadrature
-	Sq_quad = np.einsum('ijk, jm, ijm -> ijk', Sq, quad_wts, djac_elems)
-			# [ne, nq, ns]
+	Sq_quad = Sq*quad_wts
+	Sq_quad *= djac_elems # [ne, nq, ns]
 
 	# Calculate residual
-	res_elem = np.einsum('jn, ijk -> ink', basis_val, Sq_quad) # [ne, nb, ns]
+	res_elem = np.matmul(basis_val_T, Sq_quad) # [ne, nb, ns]
 
 	return res_elem # [ne, nb, ns]
 
@@ -187,7 +224,7 @@ def calculate_artificial_viscosity_integral(physics, elem_helpers, Uc, av_param,
 	# Evaluate solution at quadrature points
 	Uq = helpers.evaluate_state(Uc, basis_val)
 	# Evaluate solution gradient at quadrature points
-	grad_Uq = np.einsum('ijnl, ink -> ijkl', basis_phys_grad_elems, Uc)
+	grad_Uq = helpers.evaluate_gradient(Uc, basis_phys_grad_elems)
 	# Compute pressure
 	pressure = physics.compute_additional_variable("Pressure", Uq,
 			flag_non_physical=False)[:, :, 0]
@@ -255,7 +292,8 @@ def calculate_dRdU(elem_helpers, Sjac):
 	basis_val = elem_helpers.basis_val
 	djac_elems = elem_helpers.djac_elems
 
-	a = np.einsum('eijk, il, eil -> eijk', Sjac, quad_wts, djac_elems)
+	a = Sjac*quad_wts[:, :, np.newaxis]
+	a *= djac_elems[:, :, :, np.newaxis] # [ne, nq, ns, ns]
 
 	return np.einsum('bq, ql, eqts -> eblts', basis_val.transpose(),
 			basis_val, a)
@@ -278,7 +316,36 @@ def mult_inv_mass_matrix(mesh, solver, dt, res):
 	physics = solver.physics
 	iMM_elems = solver.elem_helpers.iMM_elems
 
-	return dt*np.einsum('ijk, ikl -> ijl', iMM_elems, res)
+	return dt*np.matmul(iMM_elems, res) # [num_elems, nb, ns]
+
+
+def get_projection_operators(iMM_elems, basis_val, quad_wts, djac_elems):
+	'''
+	Precomputes the operator that maps values at the quadrature points
+	to basis coefficients by L2 projection (quadrature-to-modes
+	projector), i.e. the inverse mass matrix times the transposed basis
+	values times the quadrature weights and Jacobian determinants
+
+	Inputs:
+	-------
+		iMM_elems: inverse mass matrix of each element [ne, nb, nb]
+		basis_val: basis values at the quadrature points [nq, nb]
+		quad_wts: quadrature weights [nq, 1]
+		djac_elems: Jacobian determinants at the quadrature points
+			[ne, nq, 1]
+
+	Outputs:
+	--------
+		proj_elems: projection operator of each element [ne, nb, nq]
+
+	Notes:
+	------
+		The L2 projection of f [ne, nq, ns] is np.matmul(proj_elems, f)
+	'''
+	wts_djac = quad_wts[:, 0]*djac_elems[:, :, 0] # [ne, nq]
+
+	return np.matmul(iMM_elems, basis_val.transpose())*wts_djac[:,
+			np.newaxis, :] # [ne, nb, nq]
 
 
 def L2_projection(mesh, iMM, basis, quad_pts, quad_wts, f, U):
@@ -301,13 +368,13 @@ def L2_projection(mesh, iMM, basis, quad_pts, quad_wts, f, U):
 	if basis.basis_val.shape[0] != quad_wts.shape[0]:
 		basis.get_basis_val_grads(quad_pts, get_val=True)
 
-	for elem_ID in range(U.shape[0]):
-		djac, _, _ = basis_tools.element_jacobian(mesh, elem_ID, quad_pts,
-				get_djac=True)
-		rhs = np.matmul(basis.basis_val.transpose(),
-				f[elem_ID, :, :]*quad_wts*djac) # [nb, ns]
+	# Project all elements at once
+	djac, _, _ = basis_tools.element_jacobians(mesh, quad_pts,
+			get_djac=True, elem_IDs=np.arange(U.shape[0])) # [ne, nq, 1]
+	rhs = np.matmul(basis.basis_val.transpose(),
+			f*quad_wts*djac) # [ne, nb, ns]
 
-		U[elem_ID, :, :] = np.matmul(iMM[elem_ID], rhs)
+	U[:] = np.matmul(iMM, rhs)
 
 
 def interpolate_to_nodes(f, U):
@@ -381,3 +381,41 @@ def test_legendre_spacetime_massmatrix(order):
 	np.testing.assert_allclose(np.diagonal(iMM), 1./np.diagonal(MM), rtol, atol)
 
 
+
+
+@pytest.mark.parametrize('order', [
+	# Order of Lagrange basis
+	1, 2
+])
+def test_spacetime_matrices_all_elems_match_single_elem(order):
+	'''
+	This test checks that the physical-space stiffness and inverse mass
+	matrices computed for all elements at once match the ones computed
+	element-by-element.
+	'''
+	dt = 0.1
+	basis = basis_defs.LegendreSeg(order)
+	basis_st = basis_defs.LegendreQuad(order)
+	mesh = mesh_common.mesh_1D(num_elems=3, xmin=0., xmax=1.5)
+
+	# Set quadrature
+	basis.set_elem_quadrature_type("GaussLegendre")
+	basis.set_face_quadrature_type("GaussLegendre")
+	basis_st.set_elem_quadrature_type("GaussLegendre")
+	basis_st.set_face_quadrature_type("GaussLegendre")
+
+	SMS_elems = basis_st_tools.get_stiffness_matrices_ader(mesh, basis_st,
+			order, dt)
+	iMM_elems = basis_st_tools.get_inv_mass_matrices_ader(mesh, basis_st,
+			order)
+
+	for elem_ID in range(mesh.num_elems):
+		SMS = basis_st_tools.get_stiffness_matrix_ader(mesh, basis,
+				basis_st, order, dt, elem_ID, grad_dir=0,
+				physical_space=True)
+		iMM = basis_st_tools.get_elem_inv_mass_matrix_ader(mesh, basis_st,
+				order, elem_ID, physical_space=True)
+		# Assert
+		np.testing.assert_allclose(SMS_elems[elem_ID, :, :, 0],
+				SMS.transpose(), rtol, atol)
+		np.testing.assert_allclose(iMM_elems[elem_ID], iMM, rtol, atol)
@@ -130,4 +130,110 @@ def test_lagrange_massmatrix_should_be_symmetric(basis, order):
 	should_be_one = np.abs(iMM - iMM_T) + 1.0
 	expected=np.ones_like(iMM)
 
-	np.testing.assert_allclose(should_be_one, expected, 1e-12, 1e-12)
\ No newline at end of file
+	np.testing.assert_allclose(should_be_one, expected, 1e-12, 1e-12)
+
+@pytest.mark.parametrize('order', [
+	# Order of Lagrange basis
+	1, 2, 3,
+])
+@pytest.mark.parametrize('perturb', [
+	# Whether to move an interior node to make the elements non-affine
+	False, True,
+])
+def test_inv_mass_matrices_all_elems_match_single_elem(order, perturb):
+	'''
+	This test checks that the physical-space inverse mass matrices
+	computed for all elements at once match the ones computed
+	element-by-element, for both affine and non-affine elements.
+	'''
+	basis = basis_defs.LagrangeQuad(order)
+	mesh = mesh_common.mesh_2D(num_elems_x=2, num_elems_y=2, xmin=0.,
+			xmax=2., ymin=0., ymax=1.)
+	if perturb:
+		# Center node of the mesh
+		mesh.node_coords[4] += np.array([0.2, 0.1])
+		mesh.create_elements()
+
+	# Set quadrature
+	basis.set_elem_quadrature_type("GaussLegendre")
+	basis.set_face_quadrature_type("GaussLegendre")
+	mesh.gbasis.set_elem_quadrature_type("GaussLegendre")
+	mesh.gbasis.set_face_quadrature_type("GaussLegendre")
+
+	iMM_elems = basis_tools.get_inv_mass_matrices(mesh, basis, order)
+
+	for elem_ID in range(mesh.num_elems):
+		iMM = basis_tools.get_elem_inv_mass_matrix(mesh, basis, order,
+				elem_ID, physical_space=True)
+		# Assert
+		np.testing.assert_allclose(iMM_elems[elem_ID], iMM, 1e-12, 1e-12)
+
+
+@pytest.mark.parametrize('split', [
+	# Whether to split the quadrilaterals into triangles
+	False, True,
+])
+def test_normals_all_elems_match_single_elem(split):
+	'''
+	This test checks that the face normals computed for an array of
+	elements match the ones computed element-by-element.
+	'''
+	mesh = mesh_common.mesh_2D(num_elems_x=2, num_elems_y=2, xmin=0.,
+			xmax=2., ymin=0., ymax=1.)
+	# Center node of the mesh
+	mesh.node_coords[4] += np.array([0.2, 0.1])
+	mesh.create_elements()
+	if split:
+		mesh = mesh_common.split_quadrils_into_tris(mesh)
+
+	quad_pts = np.array([[-0.5], [0.], [0.7]])
+	elem_IDs = np.arange(mesh.num_elems)
+
+	for face_ID in range(mesh.gbasis.NFACES):
+		normals_elems = mesh.gbasis.calculate_normals(mesh, elem_IDs,
+				face_ID, quad_pts)
+		for elem_ID in elem_IDs:
+			normals = mesh.gbasis.calculate_normals(mesh, elem_ID,
+					face_ID, quad_pts)
+			# Assert
+			np.testing.assert_allclose(normals_elems[elem_ID], normals,
+					rtol, atol)
+
+	# Arrays of both element and face IDs
+	elem_IDs, face_IDs = np.meshgrid(elem_IDs,
+			np.arange(mesh.gbasis.NFACES), indexing='ij')
+	normals_faces = mesh.gbasis.calculate_normals(mesh, elem_IDs, face_IDs,
+			quad_pts)
+	for elem_ID, face_ID in zip(elem_IDs.ravel(), face_IDs.ravel()):
+		normals = mesh.gbasis.calculate_normals(mesh, elem_ID, face_ID,
+				quad_pts)
+		# Assert
+		np.testing.assert_allclose(normals_faces[elem_ID, face_ID], normals,
+				rtol, atol)
+
+
+@pytest.mark.parametrize('split', [
+	# Whether to split the quadrilaterals into triangles
+	False, True,
+])
+def test_element_jacobians_inverse_and_determinant(split):
+	'''
+	This test checks the closed-form inverse and determinant of the
+	geometric Jacobian against the LAPACK-based ones.
+	'''
+	mesh = mesh_common.mesh_2D(num_elems_x=2, num_elems_y=2, xmin=0.,
+			xmax=2., ymin=0., ymax=1.)
+	# Center node of the mesh
+	mesh.node_coords[4] += np.array([0.2, 0.1])
+	mesh.create_elements()
+	if split:
+		mesh = mesh_common.split_quadrils_into_tris(mesh)
+
+	quad_pts = np.array([[-0.5, 0.1], [0., 0.3], [0.2, -0.7]])
+	djac, jac, ijac = basis_tools.element_jacobians(mesh, quad_pts,
+			get_djac=True, get_jac=True, get_ijac=True)
+
+	# Assert
+	np.testing.assert_allclose(ijac, np.linalg.inv(jac), 1e-13, 1e-13)
+	np.testing.assert_allclose(djac[:, :, 0], np.linalg.det(jac), 1e-13,
+			1e-13)
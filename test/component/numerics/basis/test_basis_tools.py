@@ -205,6 +205,29 @@ def test_1d_normals_rightface():
 	np.testing.assert_allclose(normals, expected, rtol, atol)
 
 
+def test_element_jacobians_match_element_jacobian():
+	'''
+	Checks that the Jacobians computed for all elements at once match
+	the ones computed element-by-element
+	'''
+	mesh = mesh_common.mesh_2D(num_elems_x=2, num_elems_y=3, xmin=-1.,
+			xmax=1., ymin=0., ymax=3.)
+	mesh = mesh_common.split_quadrils_into_tris(mesh)
+	mesh.gbasis.set_elem_quadrature_type("Dunavant")
+	quad_order = mesh.gbasis.get_quadrature_order(mesh, 2)
+	quad_pts, _ = mesh.gbasis.get_quadrature_data(quad_order)
+
+	djac_elems, jac_elems, ijac_elems = basis_tools.element_jacobians(mesh,
+			quad_pts, get_djac=True, get_jac=True, get_ijac=True)
+
+	for elem_ID in range(mesh.num_elems):
+		djac, jac, ijac = basis_tools.element_jacobian(mesh, elem_ID,
+				quad_pts, get_djac=True, get_jac=True, get_ijac=True)
+		np.testing.assert_allclose(djac_elems[elem_ID], djac, rtol, atol)
+		np.testing.assert_allclose(jac_elems[elem_ID], jac, rtol, atol)
+		np.testing.assert_allclose(ijac_elems[elem_ID], ijac, rtol, atol)
+
+
 def test_get_lagrange_basis_tri_p1():
 	'''
 	Tests the lagrange tri basis for p1
@@ -52,4 +52,29 @@ def test_evaluate_gradient_returns_one_when_state_is_linear():
 	gUq = helpers.evaluate_gradient(Uc, basis_phys_grad_elems)
 
 	expected = np.ones_like(gUq)
-	np.testing.assert_allclose(gUq, expected, rtol, atol)
\ No newline at end of file
+	np.testing.assert_allclose(gUq, expected, rtol, atol)
+
+@pytest.mark.parametrize('Basis', [
+	# Basis class
+	basis_defs.LagrangeQuad, basis_defs.LegendreQuad,
+])
+def test_evaluate_state_sum_factorization_matches_dense(Basis):
+	'''
+	This test checks that evaluating the state of a tensor-product
+	basis with sum factorization matches the dense evaluation.
+	'''
+	order = 3
+	basis = Basis(order)
+	basis.set_elem_quadrature_type("GaussLegendre")
+	quad_pts, _ = basis.get_quadrature_data(2*order + 1)
+	basis_val = basis.get_values(quad_pts)
+
+	basis_val_1D = basis_tools.get_tensor_product_factor(basis, quad_pts,
+			basis_val)
+	assert basis_val_1D is not None
+
+	Uc = np.random.default_rng(0).random([3, basis.nb, 4])
+	Uq = helpers.evaluate_state(Uc, basis_val, basis_val_1D=basis_val_1D)
+	expected = helpers.evaluate_state(Uc, basis_val)
+
+	np.testing.assert_allclose(Uq, expected, 1e-13, 1e-13)
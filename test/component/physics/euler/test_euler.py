@@ -199,3 +199,18 @@ def test_conv_eigenvectors_multiplied_is_identity():
 	expected[:, :] = np.identity(left_eigen.shape[-1])
 
 	np.testing.assert_allclose(ldotr, expected, rtol, atol)
+
+
+def test_state_indices_and_slices_match_named_lookups():
+	'''
+	This tests that the stored state indices/slices match the lookups
+	by state variable name.
+	'''
+	physics = euler.Euler2D()
+
+	names = ["Density", "XMomentum", "YMomentum", "Energy"]
+
+	assert physics.get_state_indices() == tuple(
+			physics.get_state_index(name) for name in names)
+	assert physics.state_slice_tuple == tuple(
+			physics.get_state_slice(name) for name in names)
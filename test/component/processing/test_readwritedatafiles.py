@@ -0,0 +1,93 @@
+import pickle
+import pytest
+import sys
+sys.path.append('../src')
+
+import processing.readwritedatafiles as readwritedatafiles
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+	'''
+	This fixture empties the solver cache before and after each test
+	'''
+	readwritedatafiles._cached_solvers.clear()
+	yield
+	readwritedatafiles._cached_solvers.clear()
+
+
+def write_file(fname, data):
+	'''
+	This function pickles the given data to a file
+	'''
+	with open(fname, 'wb') as fo:
+		pickle.dump(data, fo, pickle.HIGHEST_PROTOCOL)
+
+
+def test_read_data_file_does_not_cache_by_default(tmp_path):
+	'''
+	This test ensures that files are only cached when requested
+	'''
+	fname = str(tmp_path / "Data_0.pkl")
+	write_file(fname, [0.])
+
+	data1 = readwritedatafiles.read_data_file(fname)
+	data2 = readwritedatafiles.read_data_file(fname)
+
+	assert data1 == data2
+	assert data1 is not data2
+	assert len(readwritedatafiles._cached_solvers) == 0
+
+
+def test_read_data_file_returns_cached_object(tmp_path):
+	'''
+	This test ensures that repeated reads of an unchanged file return the
+	cached object
+	'''
+	fname = str(tmp_path / "Data_0.pkl")
+	write_file(fname, [0.])
+
+	data1 = readwritedatafiles.read_data_file(fname, use_cache=True)
+	data2 = readwritedatafiles.read_data_file(fname, use_cache=True)
+
+	assert data1 is data2
+
+
+def test_read_data_file_rereads_modified_file(tmp_path):
+	'''
+	This test ensures that a file modified since it was cached is read
+	again
+	'''
+	fname = str(tmp_path / "Data_0.pkl")
+	write_file(fname, [0.])
+	data1 = readwritedatafiles.read_data_file(fname, use_cache=True)
+
+	write_file(fname, [1., 2.])
+	data2 = readwritedatafiles.read_data_file(fname, use_cache=True)
+
+	assert data1 == [0.]
+	assert data2 == [1., 2.]
+
+
+def test_read_data_file_evicts_least_recently_used(tmp_path):
+	'''
+	This test ensures that the cache is bounded and evicts the least
+	recently used file first
+	'''
+	max_size = readwritedatafiles.MAX_CACHED_SOLVERS
+	fnames = [str(tmp_path / f"Data_{i}.pkl") for i in range(max_size + 1)]
+	for i, fname in enumerate(fnames):
+		write_file(fname, [float(i)])
+
+	data = [readwritedatafiles.read_data_file(fname, use_cache=True)
+			for fname in fnames[:max_size]]
+	# Use the first file again so that the second one is evicted next
+	assert readwritedatafiles.read_data_file(fnames[0],
+			use_cache=True) is data[0]
+	readwritedatafiles.read_data_file(fnames[-1], use_cache=True)
+
+	assert len(readwritedatafiles._cached_solvers) == max_size
+	assert readwritedatafiles.read_data_file(fnames[0],
+			use_cache=True) is data[0]
+	assert readwritedatafiles.read_data_file(fnames[1],
+			use_cache=True) is not data[1]
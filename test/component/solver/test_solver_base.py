@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+import sys
+sys.path.append('../src')
+
+import general
+import meshing.common as mesh_common
+import meshing.tools as mesh_tools
+import physics.scalar.scalar as scalar
+import solver.DG as DG
+
+rtol = 1e-14
+atol = 1e-14
+
+
+def create_solver_object(order, nu=None, **kwargs):
+	'''
+	This function creates a DG solver object for 1D constant advection
+	on a periodic mesh with the given solution order. If nu is given, a
+	linear source term with this coefficient is added. Additional solver
+	parameters can be passed as kwargs.
+	'''
+	mesh = mesh_common.mesh_1D(num_elems=4, xmin=0., xmax=1.)
+	mesh_tools.make_periodic_translational(mesh, x1="x1", x2="x2")
+
+	params = general.set_solver_params(dict(general.solver_params,
+			RestartFile=None), SolutionOrder=order,
+			SolutionBasis="LagrangeSeg", FinalTime=0.1, NumTimeSteps=10,
+			ApplyLimiters=[], **kwargs)
+
+	physics = scalar.ConstAdvScalar1D()
+	physics.set_conv_num_flux("LaxFriedrichs")
+	physics.set_physical_params(ConstVelocity=1.)
+	physics.set_IC(IC_type="Uniform", state=np.array([1.]))
+	physics.BCs = dict.fromkeys(mesh.boundary_groups.keys())
+	if nu is not None:
+		physics.set_source(source_type="SimpleSource", nu=nu)
+
+	solver = DG.DG(params, physics, mesh)
+
+	return solver
+
+
+def get_linear_state(solver):
+	'''
+	This function returns the state coefficients of u(x) = x in the
+	nodal basis of the given solver
+	'''
+	mesh = solver.mesh
+	xnodes = solver.basis.get_nodes(solver.order)
+
+	return np.array([mesh_tools.ref_to_phys(mesh, elem_ID, xnodes)
+			for elem_ID in range(mesh.num_elems)]) # [ne, nb, 1]
+
+
+def test_project_state_to_same_basis_copies_state():
+	'''
+	This test ensures that projecting onto the same basis and order
+	copies the state
+	'''
+	solver = create_solver_object(order=2)
+	solver_old = create_solver_object(order=2)
+	U_old = get_linear_state(solver_old)
+
+	solver.project_state_to_new_basis(U_old, solver_old.basis,
+			solver_old.order)
+
+	np.testing.assert_array_equal(solver.state_coeffs, U_old)
+	assert solver.state_coeffs is not U_old
+
+
+def test_project_state_to_higher_order():
+	'''
+	This test ensures that a linear state is exactly represented after
+	projecting onto a higher order
+	'''
+	solver = create_solver_object(order=2)
+	solver_old = create_solver_object(order=1)
+	U_old = get_linear_state(solver_old)
+
+	solver.project_state_to_new_basis(U_old, solver_old.basis,
+			solver_old.order)
+
+	np.testing.assert_allclose(solver.state_coeffs,
+			get_linear_state(solver), rtol, atol)
+
+
+def test_state_precision_after_splitting_step():
+	'''
+	This test ensures that the state keeps single precision through an
+	operator splitting time step with an implicit source step
+	'''
+	solver = create_solver_object(order=2, nu=-3., TimeStepper="Strang",
+			StatePrecision="float32")
+	U = solver.state_coeffs
+	solver.stepper.dt = 0.01
+
+	solver.stepper.take_time_step(solver)
+
+	assert solver.state_coeffs.dtype == np.float32
+	assert solver.state_coeffs is U
+
+
+def test_state_precision_after_restart():
+	'''
+	This test ensures that the state keeps single precision when restarted
+	from a double-precision solution
+	'''
+	solver = create_solver_object(order=2, StatePrecision="float32")
+	solver_old = create_solver_object(order=2)
+	U_old = get_linear_state(solver_old)
+
+	solver.project_state_to_new_basis(U_old, solver_old.basis,
+			solver_old.order)
+
+	assert solver.state_coeffs.dtype == np.float32
+	np.testing.assert_allclose(solver.state_coeffs, U_old, rtol=1e-7)
+
+
+@pytest.mark.parametrize('print_interval', [0, -1])
+def test_print_info_nonpositive_print_interval(print_interval, capsys):
+	'''
+	This test ensures that only the final iteration is printed if the
+	print interval is nonpositive
+	'''
+	solver = create_solver_object(order=1, PrintInterval=print_interval)
+	res = np.zeros_like(solver.state_coeffs)
+	num_time_steps = solver.stepper.num_time_steps
+
+	for itime in range(num_time_steps):
+		solver.print_info(solver.physics, res, itime, 0., 0.01)
+
+	lines = [line for line in capsys.readouterr().out.splitlines()
+			if "Residual norm" in line]
+	assert len(lines) == 1
+	assert lines[0].startswith("%d:" % num_time_steps)
@@ -113,3 +113,30 @@ def test_mesh_should_get_face_neighbors_correctly(filled_mesh):
 			np.array([1, -1, -1]))
 	np.testing.assert_array_equal(filled_mesh.elements[1].face_to_neighbors,
 			np.array([0, -1, -1]))
+
+def test_mesh_should_get_interior_face_IDs_as_arrays(filled_mesh):
+	'''
+	Make sure that the element and face IDs of interior faces are gathered
+	into arrays correctly.
+	'''
+	elemL_IDs, faceL_IDs, elemR_IDs, faceR_IDs = \
+			filled_mesh.get_interior_face_IDs()
+	np.testing.assert_array_equal(elemL_IDs, np.array([0]))
+	np.testing.assert_array_equal(faceL_IDs, np.array([0]))
+	np.testing.assert_array_equal(elemR_IDs, np.array([1]))
+	np.testing.assert_array_equal(faceR_IDs, np.array([0]))
+
+def test_boundary_group_should_get_boundary_face_IDs_as_arrays():
+	'''
+	Make sure that the element and face IDs of boundary faces are gathered
+	into arrays correctly.
+	'''
+	boundary_group = mesh_defs.BoundaryGroup()
+	boundary_group.num_boundary_faces = 3
+	boundary_group.allocate_boundary_faces()
+	for i, boundary_face in enumerate(boundary_group.boundary_faces):
+		boundary_face.elem_ID = 2*i
+		boundary_face.face_ID = i
+	elem_IDs, face_IDs = boundary_group.get_boundary_face_IDs()
+	np.testing.assert_array_equal(elem_IDs, np.array([0, 2, 4]))
+	np.testing.assert_array_equal(face_IDs, np.array([0, 1, 2]))